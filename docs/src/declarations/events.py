@@ -35,6 +35,43 @@ def response(res: Response) -> Response | None:
     """
 
 
+def request_batch(reqs: list[Request]) -> list[Request | None] | None:
+    """- Intercept and rewrite several requests at once.
+       - Optional, when declared it is used instead of `request()`.
+       - Requests that queued up while the script was busy (e.g. Intruder or Scanner bursts) are passed together.
+
+    - Args:
+        - reqs (list[[Request](../pdoc/python3-10/pyscalpel.html#Request)]): The intercepted requests accepted by `match()`.
+
+    - Returns:
+        - list[[Request](../pdoc/python3-10/pyscalpel.html#Request) or None] or None: One modified request or None per intercepted request, in the same order. Otherwise, None to ignore all of them.
+    """
+
+
+def response_batch(ress: list[Response]) -> list[Response | None] | None:
+    """- Intercept and rewrite several responses at once.
+       - Optional, when declared it is used instead of `response()`.
+       - Responses that queued up while the script was busy are passed together.
+
+    - Args:
+        - ress (list[[Response](../pdoc/python3-10/pyscalpel.html#Response)]): The intercepted responses accepted by `match()`.
+
+    - Returns:
+        - list[[Response](../pdoc/python3-10/pyscalpel.html#Response) or None] or None: One modified response or None per intercepted response, in the same order. Otherwise, None to ignore all of them.
+    """
+
+
+def on_response(res: Response) -> None:
+    """- Observe a response without delaying it.
+       - Burp forwards the response immediately, the hook runs in the background.
+       - Use it for passive analysis or logging, changes to the response are not applied.
+       - Pending calls are capped, the "When the on_response() queue is full" setting decides whether extra responses are skipped or wait.
+
+    - Args:
+        - res ([Response](../pdoc/python3-10/pyscalpel.html#Response)): The received response.
+    """
+
+
 def req_edit_in(req: Request) -> bytes | None:
     """- Create or update a request editor's content from a request.
        - May be used to decode a request to plaintext.
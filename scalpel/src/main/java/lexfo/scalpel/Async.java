@@ -3,6 +3,7 @@ package lexfo.scalpel;
 import java.util.concurrent.CompletableFuture;
 import java.util.concurrent.Executor;
 import java.util.concurrent.Executors;
+import java.util.function.Supplier;
 
 public class Async {
 
@@ -11,4 +12,8 @@ public class Async {
 	public static CompletableFuture<Void> run(Runnable runnable) {
 		return CompletableFuture.runAsync(runnable, executor);
 	}
+
+	public static <T> CompletableFuture<T> supply(Supplier<T> supplier) {
+		return CompletableFuture.supplyAsync(supplier, executor);
+	}
 }
@@ -75,6 +75,9 @@ public class Config {
 		public String editScriptCommand = Constants.DEFAULT_TERM_EDIT_CMD;
 		public String openFolderCommand = Constants.DEFAULT_OPEN_DIR_CMD;
 		public boolean enabled = true;
+		public int outputMaxLines = Constants.DEFAULT_OUTPUT_MAX_LINES;
+		public int outputMaxKiB = Constants.DEFAULT_OUTPUT_MAX_KIB;
+		public boolean outputLogFiles = false;
 	}
 
 	// Persistent data for a specific project.
@@ -91,6 +94,17 @@ public class Config {
 		public String userScriptPath = "";
 
 		public String displayProxyErrorPopup = "True";
+
+		/*
+		 * Number of Python interpreters the hooks are dispatched to.
+		 * A single interpreter is required for scripts relying on global state.
+		 */
+		public int workerCount = Constants.DEFAULT_WORKER_COUNT;
+
+		/*
+		 * What to do with observe-only hook calls when their queue is full. (Drop or Block)
+		 */
+		public String observerOverflowPolicy = Constants.OBSERVER_OVERFLOW_DROP;
 	}
 
 	private final _GlobalData globalConfig;
@@ -632,6 +646,44 @@ public class Config {
 		saveGlobalConfig();
 	}
 
+	public int getOutputMaxLines() {
+		return globalConfig.outputMaxLines;
+	}
+
+	public void setOutputMaxLines(int outputMaxLines) {
+		this.globalConfig.outputMaxLines = outputMaxLines;
+		saveGlobalConfig();
+	}
+
+	public int getOutputMaxKiB() {
+		return globalConfig.outputMaxKiB;
+	}
+
+	public void setOutputMaxKiB(int outputMaxKiB) {
+		this.globalConfig.outputMaxKiB = outputMaxKiB;
+		saveGlobalConfig();
+	}
+
+	/*
+	 * Get whether the stdout / stderr consoles are also written to rotating log files.
+	 *
+	 * @return Whether the log files are enabled.
+	 */
+	public boolean getOutputLogFiles() {
+		return globalConfig.outputLogFiles;
+	}
+
+	/*
+	 * Set whether the stdout / stderr consoles are also written to rotating log files.
+	 * Saves the new status to the global configuration file.
+	 *
+	 * @param outputLogFiles Whether the log files are enabled.
+	 */
+	public void setOutputLogFiles(boolean outputLogFiles) {
+		this.globalConfig.outputLogFiles = outputLogFiles;
+		saveGlobalConfig();
+	}
+
 	public String getOpenFolderCommand() {
 		return globalConfig.openFolderCommand;
 	}
@@ -661,6 +713,46 @@ public class Config {
 		saveProjectConfig();
 	}
 
+	/*
+	 * Get the number of Python interpreters the hooks are dispatched to.
+	 *
+	 * @return The configured interpreter pool size.
+	 */
+	public int getWorkerCount() {
+		return projectConfig.workerCount;
+	}
+
+	/*
+	 * Set the number of Python interpreters the hooks are dispatched to.
+	 * Saves the new count to the project configuration file.
+	 *
+	 * @param workerCount The new interpreter pool size.
+	 */
+	public void setWorkerCount(int workerCount) {
+		this.projectConfig.workerCount = workerCount;
+		saveProjectConfig();
+	}
+
+	/*
+	 * Get the policy applied to observe-only hook calls when their queue is full.
+	 *
+	 * @return The configured overflow policy. (Drop or Block)
+	 */
+	public String getObserverOverflowPolicy() {
+		return projectConfig.observerOverflowPolicy;
+	}
+
+	/*
+	 * Set the policy applied to observe-only hook calls when their queue is full.
+	 * Saves the new policy to the project configuration file.
+	 *
+	 * @param observerOverflowPolicy The new overflow policy.
+	 */
+	public void setObserverOverflowPolicy(String observerOverflowPolicy) {
+		this.projectConfig.observerOverflowPolicy = observerOverflowPolicy;
+		saveProjectConfig();
+	}
+
 	/*
 	 * Get the enabled status.
 	 *
@@ -19,16 +19,19 @@ import java.io.IOException;
 import java.net.URI;
 import java.net.URISyntaxException;
 import java.net.URLEncoder;
+import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
 import java.nio.file.StandardCopyOption;
 import java.text.SimpleDateFormat;
+import java.util.ArrayDeque;
 import java.util.Arrays;
 import java.util.Date;
 import java.util.Map;
 import java.util.Optional;
 import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.atomic.AtomicBoolean;
 import java.util.function.Consumer;
 import java.util.function.Supplier;
 import javax.swing.*;
@@ -36,10 +39,9 @@ import javax.swing.border.TitledBorder;
 import javax.swing.event.HyperlinkEvent;
 import javax.swing.event.ListSelectionEvent;
 import javax.swing.table.DefaultTableModel;
-import javax.swing.text.BadLocationException;
-import javax.swing.text.Document;
 import lexfo.scalpel.ScalpelLogger.Level;
 import lexfo.scalpel.Venv.PackageInfo;
+import lexfo.scalpel.components.HookStatsPanel;
 import lexfo.scalpel.components.PlaceholderTextField;
 import lexfo.scalpel.components.SettingsPanel;
 import lexfo.scalpel.components.WorkingPopup;
@@ -84,6 +86,7 @@ public class ConfigTab extends JFrame {
 	private JButton resetTerminalButton;
 	private JButton copyToClipboardButton;
 	private JPanel settingsTab;
+	private JPanel statsTab;
 	private JButton openIssueOnGitHubButton;
 	private final transient ScalpelExecutor scalpelExecutor;
 	private final transient Config config;
@@ -94,6 +97,35 @@ public class ConfigTab extends JFrame {
 
 	private static ConfigTab instance = null;
 
+	/**
+	 * The most recent debug log lines.
+	 */
+	private static final ArrayDeque<String> debugLog = new ArrayDeque<>();
+
+	/**
+	 * Whether a debug log refresh is already scheduled.
+	 */
+	private static final AtomicBoolean isDebugLogFlushPending = new AtomicBoolean(
+		false
+	);
+
+	/**
+	 * The stdout and stderr consoles content, displayed by the logs tab at a fixed rate.
+	 */
+	private static final ConsoleBuffer stdoutBuffer = new ConsoleBuffer(
+		Constants.DEFAULT_OUTPUT_MAX_LINES,
+		Constants.DEFAULT_OUTPUT_MAX_KIB * 1024
+	);
+	private static final ConsoleBuffer stderrBuffer = new ConsoleBuffer(
+		Constants.DEFAULT_OUTPUT_MAX_LINES,
+		Constants.DEFAULT_OUTPUT_MAX_KIB * 1024
+	);
+
+	/**
+	 * The debug report displayed before the debug log.
+	 */
+	private String debugReport = "";
+
 	public static ConfigTab getInstance() {
 		if (instance == null) {
 			throw new IllegalStateException("ConfigTab was never initialized.");
@@ -128,6 +160,7 @@ public class ConfigTab extends JFrame {
 		setupLogsTab();
 		setupDebugInfoTab();
 		setupSettingsTab();
+		setupStatsTab();
 	}
 
 	private void setupVenvTab() {
@@ -215,6 +248,19 @@ public class ConfigTab extends JFrame {
 		// Adjusting autoScroll for stderrTextArea
 		UIUtils.setupAutoScroll(stderrScrollPane, stderrTextArea);
 
+		// Display the outputs at a fixed rate, whatever the number of writes
+		applyOutputSettings();
+		final Timer outputTimer = new Timer(
+			Constants.OUTPUT_REFRESH_DELAY_MS,
+			e -> {
+				if (outputTabPanel.isShowing()) {
+					flushOutput(stdoutBuffer, stdoutTextArea);
+					flushOutput(stderrBuffer, stderrTextArea);
+				}
+			}
+		);
+		outputTimer.start();
+
 		selectedScriptLabel.setText(
 			config.getUserScriptPath().getFileName().toString()
 		);
@@ -285,6 +331,41 @@ public class ConfigTab extends JFrame {
 				"True".equals(config.getDisplayProxyErrorPopup())
 			);
 
+		this.settingsPanel.addDropdownSetting(
+				"workerCount",
+				"Python interpreters (global variables are not shared between interpreters)",
+				Constants.WORKER_COUNT_CHOICES,
+				String.valueOf(config.getWorkerCount())
+			);
+
+		this.settingsPanel.addDropdownSetting(
+				"observerOverflowPolicy",
+				"When the on_response() queue is full",
+				Constants.OBSERVER_OVERFLOW_POLICIES,
+				config.getObserverOverflowPolicy()
+			);
+
+		this.settingsPanel.addDropdownSetting(
+				"outputMaxLines",
+				"Output console lines",
+				Constants.OUTPUT_MAX_LINES_CHOICES,
+				String.valueOf(config.getOutputMaxLines())
+			);
+
+		this.settingsPanel.addDropdownSetting(
+				"outputMaxKiB",
+				"Output console size (KiB)",
+				Constants.OUTPUT_MAX_KIB_CHOICES,
+				String.valueOf(config.getOutputMaxKiB())
+			);
+
+		this.settingsPanel.addCheckboxSetting(
+				"outputLogFiles",
+				"Also write the outputs to log files in " +
+				Constants.OUTPUT_LOG_DIR,
+				config.getOutputLogFiles()
+			);
+
 		// Padding
 		this.settingsPanel.addInformationText("");
 		this.settingsPanel.addInformationText("Available placeholders:");
@@ -306,11 +387,37 @@ public class ConfigTab extends JFrame {
 				config.setDisplayProxyErrorPopup(
 					settings.get("displayProxyErrorPopup")
 				);
+				config.setWorkerCount(
+					Integer.parseInt(settings.get("workerCount"))
+				);
+				config.setObserverOverflowPolicy(
+					settings.get("observerOverflowPolicy")
+				);
+				config.setOutputMaxLines(
+					Integer.parseInt(settings.get("outputMaxLines"))
+				);
+				config.setOutputMaxKiB(
+					Integer.parseInt(settings.get("outputMaxKiB"))
+				);
+				config.setOutputLogFiles(
+					"True".equals(settings.get("outputLogFiles"))
+				);
+				applyOutputSettings();
 			});
 
 		this.settingsTab.add(this.settingsPanel, BorderLayout.CENTER);
 	}
 
+	private void setupStatsTab() {
+		this.statsTab.add(
+				new HookStatsPanel(
+					scalpelExecutor.getHookStats(),
+					scalpelExecutor::getQueueDepth
+				),
+				BorderLayout.CENTER
+			);
+	}
+
 	private void setupGitHubIssueButton() {
 		openIssueOnGitHubButton.addActionListener(__ -> {
 			try {
@@ -430,59 +537,147 @@ public class ConfigTab extends JFrame {
 		}
 
 		out.append("---- Full debug log ----\n\n");
-		this.debugInfoTextPane.setText(out.toString());
+		this.debugReport = out.toString();
+		flushDebugInfo();
+	}
+
+	/**
+	 * Display the debug report followed by the most recent debug log lines.
+	 */
+	private void flushDebugInfo() {
+		final String log;
+		synchronized (debugLog) {
+			log = String.join("\n", debugLog);
+		}
+		debugInfoTextPane.setText(debugReport + log);
 	}
 
+	/**
+	 * Append a line to the debug log.
+	 *
+	 * <p>Only the last {@link Constants#DEBUG_LOG_MAX_LINES} lines are kept,
+	 * the displayed log is refreshed at most every {@link Constants#DEBUG_LOG_REFRESH_DELAY_MS} milliseconds.
+	 *
+	 * @param info The line to append.
+	 */
 	public static void appendToDebugInfo(String info) {
-		if (instance == null) {
+		synchronized (debugLog) {
+			if (debugLog.size() >= Constants.DEBUG_LOG_MAX_LINES) {
+				debugLog.removeFirst();
+			}
+			debugLog.addLast(info);
+		}
+
+		if (
+			instance == null ||
+			!isDebugLogFlushPending.compareAndSet(false, true)
+		) {
 			return;
 		}
-		final JTextPane pane = instance.debugInfoTextPane;
 
-		// Safely append text to the JTextPane
 		SwingUtilities.invokeLater(() -> {
-			final Document doc = pane.getDocument();
-			try {
-				// Append new info as a new line at the end of the Document
-				doc.insertString(doc.getLength(), "\n" + info, null);
-			} catch (BadLocationException e) {
-				ScalpelLogger.logStackTrace(e);
-			}
+			final Timer timer = new Timer(
+				Constants.DEBUG_LOG_REFRESH_DELAY_MS,
+				e -> {
+					isDebugLogFlushPending.set(false);
+					instance.flushDebugInfo();
+				}
+			);
+			timer.setRepeats(false);
+			timer.start();
 		});
 	}
 
 	/**
-	 * Push a character to a stdout or stderr text area.
+	 * Apply the configured caps and log files to the stdout and stderr consoles.
+	 */
+	private void applyOutputSettings() {
+		final int maxLines = config.getOutputMaxLines();
+		final int maxChars = config.getOutputMaxKiB() * 1024;
+		stdoutBuffer.setLimits(maxLines, maxChars);
+		stderrBuffer.setLimits(maxLines, maxChars);
+
+		final boolean logFiles = config.getOutputLogFiles();
+		if (logFiles != (stdoutBuffer.getLogFile() != null)) {
+			stdoutBuffer.setLogFile(logFiles ? createLogFile("stdout") : null);
+			stderrBuffer.setLogFile(logFiles ? createLogFile("stderr") : null);
+		}
+	}
+
+	private static RotatingLogFile createLogFile(String name) {
+		return new RotatingLogFile(
+			Constants.OUTPUT_LOG_DIR.resolve(name + ".log"),
+			Constants.OUTPUT_LOG_MAX_BYTES,
+			Constants.OUTPUT_LOG_BACKUPS
+		);
+	}
+
+	/**
+	 * Apply the changes of a console buffer to its text area.
 	 *
-	 * @param c        The character to push.
-	 * @param isStdout Whether the character is from stdout or stderr.
+	 * @param buffer   The console buffer.
+	 * @param textArea The text area displaying it.
 	 */
+	private static void flushOutput(ConsoleBuffer buffer, JTextArea textArea) {
+		final ConsoleBuffer.Update update = buffer.drain();
+		if (update == null) {
+			return;
+		}
 
-	public static void pushCharToOutput(int c, boolean isStdout) {
-		if (instance == null) {
+		if (update.reset()) {
+			textArea.setText(update.appended());
 			return;
 		}
-		final JTextArea textArea = isStdout
-			? instance.stdoutTextArea
-			: instance.stderrTextArea;
-		textArea.append(String.valueOf((char) c));
+
+		if (update.removed() > 0) {
+			textArea.replaceRange(
+				"",
+				0,
+				Math.min(update.removed(), textArea.getDocument().getLength())
+			);
+		}
+		textArea.append(update.appended());
+	}
+
+	private static ConsoleBuffer getOutputBuffer(boolean isStdout) {
+		return isStdout ? stdoutBuffer : stderrBuffer;
+	}
+
+	/**
+	 * Push a character to the stdout or stderr console.
+	 *
+	 * @param c        The character to push.
+	 * @param isStdout Whether the character is from stdout or stderr.
+	 */
+	public static void pushCharToOutput(int c, boolean isStdout) {
+		getOutputBuffer(isStdout).append((char) c);
+	}
+
+	/**
+	 * Push bytes to the stdout or stderr console, each byte as one character.
+	 *
+	 * @param bytes    The bytes to push.
+	 * @param offset   The offset of the first byte to push.
+	 * @param length   The number of bytes to push.
+	 * @param isStdout Whether the bytes are from stdout or stderr.
+	 */
+	public static void pushBytesToOutput(
+		byte[] bytes,
+		int offset,
+		int length,
+		boolean isStdout
+	) {
+		getOutputBuffer(isStdout)
+			.append(
+				new String(bytes, offset, length, StandardCharsets.ISO_8859_1)
+			);
 	}
 
 	public static void putStringToOutput(String s, boolean isStdout) {
-		if (instance == null) {
-			return;
-		}
-		final JTextArea textArea = isStdout
-			? instance.stdoutTextArea
-			: instance.stderrTextArea;
-		textArea.append(s);
-		textArea.append("\n\n");
+		getOutputBuffer(isStdout).append(s + "\n\n");
 	}
 
 	public static void clearOutputs(String msg) {
-		if (instance == null) {
-			return;
-		}
 		final String clearedTimestamp = new SimpleDateFormat("HH:mm:ss")
 			.format(new Date());
 
@@ -493,8 +688,8 @@ public class ConfigTab extends JFrame {
 			msg +
 			"\n-------------------------------------------------------------------\n\n";
 
-		instance.stdoutTextArea.setText(clearedMsg);
-		instance.stderrTextArea.setText(clearedMsg);
+		stdoutBuffer.clear(clearedMsg);
+		stderrBuffer.clear(clearedMsg);
 	}
 
 	/**
@@ -2208,6 +2403,10 @@ public class ConfigTab extends JFrame {
 		settingsTab.setLayout(new BorderLayout(0, 0));
 		settingsTab.putClientProperty("html.disable", Boolean.TRUE);
 		tabbedPane1.addTab("Settings", settingsTab);
+		statsTab = new JPanel();
+		statsTab.setLayout(new BorderLayout(0, 0));
+		statsTab.putClientProperty("html.disable", Boolean.TRUE);
+		tabbedPane1.addTab("Hook stats", statsTab);
 		final JPanel panel11 = new JPanel();
 		panel11.setLayout(
 			new FormLayout(
@@ -0,0 +1,235 @@
+package lexfo.scalpel;
+
+import java.util.ArrayDeque;
+import java.util.Iterator;
+
+/**
+ * Bounded model of an output console, written to by any thread and displayed by the EDT.
+ *
+ * <p>The content is kept as a ring of lines: once the line or character cap is exceeded, the oldest lines are dropped.
+ * Appends only record what changed since the last {@link #drain()},
+ * so the view can be updated at a fixed rate with one append and one head removal, whatever the number of writes in between.
+ */
+public class ConsoleBuffer {
+
+	/**
+	 * What changed since the previous drain.
+	 *
+	 * @param reset    Whether the view must be replaced by appended, after a {@link #clear(String)}.
+	 * @param removed  Number of characters to remove from the start of the view.
+	 * @param appended Text to append to the view.
+	 */
+	public record Update(boolean reset, int removed, String appended) {}
+
+	/**
+	 * Complete lines, newline included, oldest first.
+	 */
+	private final ArrayDeque<String> lines = new ArrayDeque<>();
+
+	/**
+	 * The last line, not terminated yet.
+	 */
+	private final StringBuilder current = new StringBuilder();
+
+	private int maxLines;
+	private int maxChars;
+
+	/**
+	 * Number of characters kept.
+	 */
+	private int length = 0;
+
+	/**
+	 * Number of characters at the start of the content that are already displayed.
+	 */
+	private int displayed = 0;
+
+	/**
+	 * Number of displayed characters dropped since the previous drain.
+	 */
+	private int removed = 0;
+
+	private boolean reset = false;
+	private volatile RotatingLogFile logFile = null;
+
+	/**
+	 * @param maxLines Maximum number of lines kept.
+	 * @param maxChars Maximum number of characters kept.
+	 */
+	public ConsoleBuffer(int maxLines, int maxChars) {
+		this.maxLines = Math.max(maxLines, 1);
+		this.maxChars = Math.max(maxChars, 1);
+	}
+
+	/**
+	 * Change the caps, dropping the oldest lines if needed.
+	 *
+	 * @param maxLines Maximum number of lines kept.
+	 * @param maxChars Maximum number of characters kept.
+	 */
+	public synchronized void setLimits(int maxLines, int maxChars) {
+		this.maxLines = Math.max(maxLines, 1);
+		this.maxChars = Math.max(maxChars, 1);
+		trim();
+	}
+
+	/**
+	 * Also write everything appended to a log file.
+	 *
+	 * @param logFile The log file, or null to stop writing to it.
+	 */
+	public void setLogFile(RotatingLogFile logFile) {
+		final RotatingLogFile previous = this.logFile;
+		this.logFile = logFile;
+		if (previous != null && previous != logFile) {
+			previous.close();
+		}
+	}
+
+	public RotatingLogFile getLogFile() {
+		return logFile;
+	}
+
+	public void append(char c) {
+		synchronized (this) {
+			add(c);
+			trim();
+		}
+
+		final RotatingLogFile file = logFile;
+		if (file != null) {
+			file.write(String.valueOf(c));
+		}
+	}
+
+	public void append(CharSequence text) {
+		synchronized (this) {
+			add(text);
+			trim();
+		}
+
+		final RotatingLogFile file = logFile;
+		if (file != null) {
+			file.write(text);
+		}
+	}
+
+	/**
+	 * Replace the whole content.
+	 *
+	 * @param text The new content.
+	 */
+	public void clear(String text) {
+		synchronized (this) {
+			lines.clear();
+			current.setLength(0);
+			length = 0;
+			displayed = 0;
+			removed = 0;
+			reset = true;
+		}
+		append(text);
+	}
+
+	/**
+	 * Take the changes to apply to the view.
+	 *
+	 * @return The changes since the previous drain, or null when there are none.
+	 */
+	public synchronized Update drain() {
+		if (!reset && removed == 0 && displayed == length) {
+			return null;
+		}
+
+		final Update update = new Update(
+			reset,
+			removed,
+			tail(length - displayed)
+		);
+		displayed = length;
+		removed = 0;
+		reset = false;
+		return update;
+	}
+
+	/**
+	 * Copy the last characters of the content.
+	 *
+	 * @param count The number of characters to copy.
+	 * @return The last count characters.
+	 */
+	private String tail(int count) {
+		if (count <= current.length()) {
+			return current.substring(current.length() - count);
+		}
+
+		// Walk back to the first line holding the tail, then copy forward.
+		int remaining = count - current.length();
+		final Iterator<String> it = lines.descendingIterator();
+		final ArrayDeque<String> parts = new ArrayDeque<>();
+		while (remaining > 0) {
+			final String line = it.next();
+			parts.addFirst(
+				line.length() <= remaining
+					? line
+					: line.substring(line.length() - remaining)
+			);
+			remaining -= line.length();
+		}
+
+		final StringBuilder out = new StringBuilder(count);
+		parts.forEach(out::append);
+		return out.append(current).toString();
+	}
+
+	private void add(char c) {
+		current.append(c);
+		length++;
+		if (c == '\n') {
+			lines.addLast(current.toString());
+			current.setLength(0);
+		}
+	}
+
+	private void add(CharSequence text) {
+		int start = 0;
+		for (int i = 0; i < text.length(); i++) {
+			if (text.charAt(i) == '\n') {
+				current.append(text, start, i + 1);
+				lines.addLast(current.toString());
+				current.setLength(0);
+				start = i + 1;
+			}
+		}
+		current.append(text, start, text.length());
+		length += text.length();
+	}
+
+	/**
+	 * Drop the oldest lines until the content fits the caps.
+	 */
+	private void trim() {
+		final int currentLines = current.length() > 0 ? 1 : 0;
+		while (
+			!lines.isEmpty() &&
+			(lines.size() + currentLines > maxLines || length > maxChars)
+		) {
+			remove(lines.removeFirst().length());
+		}
+
+		// A single unterminated line can still exceed the character cap,
+		// drop a quarter of the cap at once rather than shifting the line on every character.
+		if (length > maxChars) {
+			final int excess = Math.min(length - maxChars + maxChars / 4, length);
+			current.delete(0, excess);
+			remove(excess);
+		}
+	}
+
+	private void remove(int count) {
+		length -= count;
+		final int fromView = Math.min(count, displayed);
+		displayed -= fromView;
+		removed += fromView;
+	}
+}
@@ -2,6 +2,7 @@ package lexfo.scalpel;
 
 import com.google.common.collect.ImmutableSet;
 import com.jediterm.terminal.ui.UIUtil;
+import java.nio.file.Path;
 
 /**
   Contains constants used by the extension.
@@ -43,11 +44,17 @@ public class Constants {
 
 	public static final String RES_CB_NAME = "response";
 
+	/**
+    	Observe-only response hook, called in the background without blocking Burp.
+	*/
+	public static final String ON_RES_CB_NAME = "on_response";
+
 	public static final ImmutableSet<String> VALID_HOOK_PREFIXES = ImmutableSet.of(
 		REQ_EDIT_PREFIX,
 		RES_EDIT_PREFIX,
 		REQ_CB_NAME,
-		RES_CB_NAME
+		RES_CB_NAME,
+		ON_RES_CB_NAME
 	);
 
 	/**
@@ -55,6 +62,98 @@ public class Constants {
 	*/
 	public static final String FRAMEWORK_RES_CB_NAME = "_" + RES_CB_NAME;
 
+	/**
+    	Callback name for the observe-only response hook.
+	*/
+	public static final String FRAMEWORK_ON_RES_CB_NAME = "_" + ON_RES_CB_NAME;
+
+	/**
+    	Optional user hook processing several requests at once.
+	*/
+	public static final String REQ_BATCH_CB_NAME = REQ_CB_NAME + "_batch";
+
+	/**
+    	Optional user hook processing several responses at once.
+	*/
+	public static final String RES_BATCH_CB_NAME = RES_CB_NAME + "_batch";
+
+	/**
+	 * Maximum number of queued intercepter calls processed at once.
+	 */
+	public static final int MAX_HOOK_BATCH_SIZE = 64;
+
+	/**
+	 * How long an idle runner waits for a task before checking for changes again, in milliseconds.
+	 * Runners are also woken up when a watched file changes, so this only bounds the detection delay.
+	 */
+	public static final int RUNNER_POLL_TIMEOUT_MS = 1000;
+
+	/**
+	 * Maximum total size of the cached req_edit_in / res_edit_in results, in bytes.
+	 */
+	public static final long EDITOR_HOOK_CACHE_MAX_BYTES = 32L * 1024 * 1024;
+
+	/**
+	 * Number of debug log lines kept for the debug report.
+	 */
+	public static final int DEBUG_LOG_MAX_LINES = 5000;
+
+	/**
+	 * Minimum delay between two refreshes of the displayed debug log, in milliseconds.
+	 */
+	public static final int DEBUG_LOG_REFRESH_DELAY_MS = 250;
+
+	/**
+	 * Delay between two refreshes of the displayed stdout / stderr consoles, in milliseconds.
+	 */
+	public static final int OUTPUT_REFRESH_DELAY_MS = 100;
+
+	/**
+	 * Default number of lines kept in each of the stdout / stderr consoles.
+	 */
+	public static final int DEFAULT_OUTPUT_MAX_LINES = 10000;
+
+	/**
+	 * Selectable numbers of lines kept in each console
+	 */
+	public static final String[] OUTPUT_MAX_LINES_CHOICES = new String[] {
+		"1000",
+		"10000",
+		"100000",
+	};
+
+	/**
+	 * Default size of each of the stdout / stderr consoles, in KiB of characters.
+	 */
+	public static final int DEFAULT_OUTPUT_MAX_KIB = 1024;
+
+	/**
+	 * Selectable console sizes, in KiB of characters
+	 */
+	public static final String[] OUTPUT_MAX_KIB_CHOICES = new String[] {
+		"256",
+		"1024",
+		"4096",
+		"16384",
+	};
+
+	/**
+	 * Directory of the stdout / stderr log files, when enabled.
+	 */
+	public static final Path OUTPUT_LOG_DIR = RessourcesUnpacker.DATA_DIR_PATH.resolve(
+		"logs"
+	);
+
+	/**
+	 * Size from which an output log file is rotated, in bytes.
+	 */
+	public static final long OUTPUT_LOG_MAX_BYTES = 10L * 1024 * 1024;
+
+	/**
+	 * Number of rotated output log files kept.
+	 */
+	public static final int OUTPUT_LOG_BACKUPS = 3;
+
 	/**
 		Scalpel prefix for the persistence databases.
 
@@ -76,6 +175,46 @@ public class Constants {
 
 	public static final String GET_CB_NAME = "_get_callables";
 
+	public static final String GET_MATCH_SPEC_CB_NAME = "_get_match_spec";
+
+	public static final String RELOAD_SCRIPT_CB_NAME = "_reload_user_script";
+
+	/**
+	 * Default number of Python interpreters (a single one sharing the script global state)
+	 */
+	public static final int DEFAULT_WORKER_COUNT = 1;
+
+	/**
+	 * Selectable numbers of Python interpreters
+	 */
+	public static final String[] WORKER_COUNT_CHOICES = new String[] {
+		"1",
+		"2",
+		"4",
+		"8",
+		"16",
+	};
+
+	/**
+	 * Maximum number of observe-only hook calls waiting to be processed.
+	 */
+	public static final int OBSERVER_QUEUE_LIMIT = 1000;
+
+	/**
+	 * Skip the observe-only hook when its queue is full.
+	 */
+	public static final String OBSERVER_OVERFLOW_DROP = "Drop";
+
+	/**
+	 * Make Burp wait for the observe-only hook when its queue is full.
+	 */
+	public static final String OBSERVER_OVERFLOW_BLOCK = "Block";
+
+	public static final String[] OBSERVER_OVERFLOW_POLICIES = new String[] {
+		OBSERVER_OVERFLOW_DROP,
+		OBSERVER_OVERFLOW_BLOCK,
+	};
+
 	/**
 	 * Required python packages
 	 */
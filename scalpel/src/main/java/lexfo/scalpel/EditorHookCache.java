@@ -0,0 +1,146 @@
+package lexfo.scalpel;
+
+import burp.api.montoya.core.ByteArray;
+import burp.api.montoya.http.HttpService;
+import burp.api.montoya.http.message.HttpMessage;
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.util.HexFormat;
+import java.util.Iterator;
+import java.util.LinkedHashMap;
+import java.util.Map;
+
+/**
+ * LRU cache of the req_edit_in / res_edit_in hooks results, bounded in bytes.
+ *
+ * <p>Burp calls isEnabledFor() and then setRequestResponse() for the same message, for every editor tab,
+ * and again every time a message is re-selected. Caching the results lets both calls share a single hook execution.
+ * Entries are keyed by the script version, so a reload never serves outdated content.
+ */
+public class EditorHookCache {
+
+	/**
+	 * Identifies a hook call.
+	 *
+	 * @param tabName The editor tab name.
+	 * @param type Whether req_edit_in or res_edit_in is called.
+	 * @param scriptVersion The reload generation of the script.
+	 * @param digest The digest of the hook arguments (messages and service).
+	 */
+	public record Key(
+		String tabName,
+		EditorType type,
+		long scriptVersion,
+		String digest
+	) {}
+
+	/**
+	 * Approximate memory used by an entry, on top of the content.
+	 */
+	private static final int ENTRY_OVERHEAD = 256;
+
+	private final long maxBytes;
+
+	private long usedBytes = 0;
+
+	/**
+	 * The cached results, from the least to the most recently used.
+	 */
+	private final LinkedHashMap<Key, Result<ByteArray, Throwable>> entries = new LinkedHashMap<>(
+		16,
+		0.75f,
+		true
+	);
+
+	/**
+	 * @param maxBytes The maximum total size of the cached contents.
+	 */
+	public EditorHookCache(long maxBytes) {
+		this.maxBytes = maxBytes;
+	}
+
+	/**
+	 * Digest the arguments of an edit_in hook.
+	 *
+	 * @param service The network service, may be null.
+	 * @param messages The hooked message, followed by the initiating request for responses. (null values are skipped)
+	 * @return The hex encoded SHA-256 digest.
+	 */
+	public static String digest(HttpService service, HttpMessage... messages) {
+		final MessageDigest sha;
+		try {
+			sha = MessageDigest.getInstance("SHA-256");
+		} catch (NoSuchAlgorithmException e) {
+			throw new RuntimeException(e);
+		}
+
+		if (service != null) {
+			final String target =
+				(service.secure() ? "https://" : "http://") +
+				service.host() +
+				":" +
+				service.port();
+			sha.update(target.getBytes(StandardCharsets.UTF_8));
+		}
+
+		for (final HttpMessage message : messages) {
+			// Separate the messages so their boundaries are part of the digest.
+			sha.update((byte) 0);
+			if (message != null) {
+				sha.update(message.toByteArray().getBytes());
+			}
+		}
+
+		return HexFormat.of().formatHex(sha.digest());
+	}
+
+	private static long sizeOf(Result<ByteArray, Throwable> result) {
+		return (
+			ENTRY_OVERHEAD +
+			(result.hasValue() ? result.getValue().length() : 0)
+		);
+	}
+
+	/**
+	 * Get a cached result.
+	 *
+	 * @param key The hook call.
+	 * @return The cached result, or null when the call isn't cached.
+	 */
+	public synchronized Result<ByteArray, Throwable> get(Key key) {
+		return entries.get(key);
+	}
+
+	/**
+	 * Cache a result, evicting the least recently used ones to stay under the size bound.
+	 *
+	 * @param key The hook call.
+	 * @param result The hook result.
+	 */
+	public synchronized void put(Key key, Result<ByteArray, Throwable> result) {
+		final long size = sizeOf(result);
+		if (size > maxBytes) {
+			return;
+		}
+
+		final Result<ByteArray, Throwable> previous = entries.put(key, result);
+		usedBytes += size - (previous != null ? sizeOf(previous) : 0);
+
+		final Iterator<Map.Entry<Key, Result<ByteArray, Throwable>>> it = entries
+			.entrySet()
+			.iterator();
+		while (usedBytes > maxBytes && it.hasNext()) {
+			usedBytes -= sizeOf(it.next().getValue());
+			it.remove();
+		}
+	}
+
+	/**
+	 * Discard every cached result.
+	 */
+	public synchronized void clear() {
+		entries.clear();
+		usedBytes = 0;
+	}
+}
@@ -0,0 +1,258 @@
+package lexfo.scalpel;
+
+import static java.nio.file.StandardWatchEventKinds.ENTRY_CREATE;
+import static java.nio.file.StandardWatchEventKinds.ENTRY_DELETE;
+import static java.nio.file.StandardWatchEventKinds.ENTRY_MODIFY;
+import static java.nio.file.StandardWatchEventKinds.OVERFLOW;
+
+import java.io.File;
+import java.io.IOException;
+import java.nio.file.ClosedWatchServiceException;
+import java.nio.file.FileSystems;
+import java.nio.file.Path;
+import java.nio.file.WatchEvent;
+import java.nio.file.WatchKey;
+import java.nio.file.WatchService;
+import java.util.Collection;
+import java.util.Map;
+import java.util.Optional;
+import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.concurrent.atomic.AtomicLong;
+
+/**
+ * Watches a set of files and flags them as changed when the file system reports an event for one of them.
+ *
+ * <p>The parent directories are watched rather than the files themselves,
+ * so editors replacing a file on save (write to a temporary file + rename) are detected.
+ * When the platform doesn't provide a native WatchService, or a directory cannot be watched,
+ * the files are reported as changed every {@link Constants#RUNNER_POLL_TIMEOUT_MS} milliseconds
+ * and callers fall back to comparing modification timestamps.
+ */
+public class FileWatcher {
+
+	private final Optional<WatchService> watchService;
+
+	/**
+	 * The watched file names, by directory.
+	 */
+	private final Map<Path, Set<Path>> watchedFiles = new ConcurrentHashMap<>();
+
+	/**
+	 * The registration of each watched directory.
+	 */
+	private final Map<Path, WatchKey> watchKeys = new ConcurrentHashMap<>();
+
+	/**
+	 * The directories that should be watched but aren't, because their registration failed or was invalidated.
+	 */
+	private final Set<Path> unwatchedDirs = ConcurrentHashMap.newKeySet();
+
+	/**
+	 * When the files were last reported as changed by polling, in System.nanoTime() units.
+	 */
+	private final AtomicLong lastPoll = new AtomicLong(System.nanoTime());
+
+	/**
+	 * Set when a watched file changed since the last {@link #consumeChanges()} call.
+	 */
+	private final AtomicBoolean changed = new AtomicBoolean(true);
+
+	/**
+	 * Called from the watcher thread when a watched file changes.
+	 */
+	private final Runnable onChange;
+
+	/**
+	 * @param onChange Called from the watcher thread when a watched file changes.
+	 */
+	public FileWatcher(Runnable onChange) {
+		this.onChange = onChange;
+
+		Optional<WatchService> service;
+		try {
+			service = Optional.of(FileSystems.getDefault().newWatchService());
+		} catch (IOException | UnsupportedOperationException e) {
+			ScalpelLogger.warn(
+				"Files cannot be watched, falling back to polling: " +
+				e.getMessage()
+			);
+			service = Optional.empty();
+		}
+
+		// Without native events (e.g. on macOS), the JDK stats the directories every 10 seconds,
+		// polling the files ourselves is faster.
+		if (service.isPresent() && isPollingService(service.get())) {
+			ScalpelLogger.debug(
+				"No native file events on this platform, falling back to polling."
+			);
+			closeQuietly(service.get());
+			service = Optional.empty();
+		}
+		this.watchService = service;
+
+		watchService.ifPresent(s -> {
+			final Thread thread = new Thread(
+				() -> watchLoop(s),
+				"ScalpelFileWatcher"
+			);
+			thread.setDaemon(true);
+			thread.start();
+		});
+	}
+
+	/**
+	 * Replace the set of watched files.
+	 *
+	 * @param files The files to watch, their parent directories must exist.
+	 */
+	public synchronized void watch(Collection<File> files) {
+		if (watchService.isEmpty()) {
+			return;
+		}
+
+		final Map<Path, Set<Path>> wanted = new ConcurrentHashMap<>();
+		for (final File file : files) {
+			final Path path = file.toPath().toAbsolutePath();
+			wanted
+				.computeIfAbsent(path.getParent(), k -> ConcurrentHashMap.newKeySet())
+				.add(path.getFileName());
+		}
+
+		// Stop watching the directories that are no longer needed.
+		watchKeys
+			.keySet()
+			.stream()
+			.filter(dir -> !wanted.containsKey(dir))
+			.toList()
+			.forEach(dir -> watchKeys.remove(dir).cancel());
+		unwatchedDirs.retainAll(wanted.keySet());
+
+		for (final Path dir : wanted.keySet()) {
+			if (!watchKeys.containsKey(dir)) {
+				register(dir);
+			}
+		}
+
+		watchedFiles.clear();
+		watchedFiles.putAll(wanted);
+
+		// Events may have been missed while the directories weren't registered.
+		changed.set(true);
+	}
+
+	/**
+	 * Whether a watched file changed since the last call.
+	 *
+	 * @return true if a watched file may have changed,
+	 * 	also true every {@link Constants#RUNNER_POLL_TIMEOUT_MS} milliseconds when some files cannot be watched.
+	 */
+	public boolean consumeChanges() {
+		if (changed.getAndSet(false)) {
+			return true;
+		}
+
+		if (watchService.isPresent() && unwatchedDirs.isEmpty()) {
+			return false;
+		}
+
+		final long now = System.nanoTime();
+		final long last = lastPoll.get();
+		if (
+			now - last <
+			TimeUnit.MILLISECONDS.toNanos(Constants.RUNNER_POLL_TIMEOUT_MS) ||
+			!lastPoll.compareAndSet(last, now)
+		) {
+			return false;
+		}
+
+		// The directories may be watchable again (e.g. re-created).
+		if (watchService.isPresent()) {
+			retryRegistrations();
+		}
+		return true;
+	}
+
+	private synchronized void retryRegistrations() {
+		for (final Path dir : Set.copyOf(unwatchedDirs)) {
+			register(dir);
+		}
+	}
+
+	/**
+	 * Watch a directory, or remember it as unwatched if it cannot be.
+	 *
+	 * @param dir The directory to watch.
+	 */
+	private void register(Path dir) {
+		try {
+			watchKeys.put(
+				dir,
+				dir.register(
+					watchService.get(),
+					ENTRY_CREATE,
+					ENTRY_MODIFY,
+					ENTRY_DELETE
+				)
+			);
+			unwatchedDirs.remove(dir);
+		} catch (IOException e) {
+			if (unwatchedDirs.add(dir)) {
+				ScalpelLogger.warn(
+					"Failed to watch " + dir + ", falling back to polling: " + e
+				);
+			}
+		}
+	}
+
+	private static boolean isPollingService(WatchService service) {
+		return service.getClass().getSimpleName().equals("PollingWatchService");
+	}
+
+	private static void closeQuietly(WatchService service) {
+		try {
+			service.close();
+		} catch (IOException e) {
+			ScalpelLogger.logStackTrace(e);
+		}
+	}
+
+	private void watchLoop(WatchService service) {
+		while (true) {
+			final WatchKey key;
+			try {
+				key = service.take();
+			} catch (InterruptedException | ClosedWatchServiceException e) {
+				return;
+			}
+
+			final Path dir = (Path) key.watchable();
+			final Set<Path> names = watchedFiles.getOrDefault(dir, Set.of());
+
+			boolean isRelevant = false;
+			for (final WatchEvent<?> event : key.pollEvents()) {
+				isRelevant |=
+					event.kind() == OVERFLOW || names.contains(event.context());
+			}
+
+			// The directory was deleted or became inaccessible, poll it until it can be watched again.
+			if (!key.reset() && watchKeys.remove(dir, key)) {
+				if (watchedFiles.containsKey(dir)) {
+					unwatchedDirs.add(dir);
+				}
+				isRelevant = true;
+			}
+
+			if (isRelevant) {
+				changed.set(true);
+				try {
+					onChange.run();
+				} catch (Throwable e) {
+					ScalpelLogger.logStackTrace(e);
+				}
+			}
+		}
+	}
+}
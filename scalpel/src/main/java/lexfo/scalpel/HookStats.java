@@ -0,0 +1,227 @@
+package lexfo.scalpel;
+
+import com.fasterxml.jackson.core.JsonProcessingException;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import java.util.ArrayList;
+import java.util.Comparator;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.concurrent.atomic.AtomicLongArray;
+
+/**
+ * Latency histograms of the hook calls, per hook and per phase.
+ *
+ * <p>Java side phases are recorded by the executor ("queue": time waiting for a worker, "python": time spent in the interpreter),
+ * the Python side phases ("from_burp", "match", "hook", "to_burp") are recorded by _framework.py through the script context.
+ */
+public class HookStats {
+
+	/**
+	 * Lock-free log-linear histogram, values are bucketed with a ~12% precision.
+	 */
+	public static class Histogram {
+
+		/**
+		 * Number of sub-buckets per power of two (2^SUB_BITS).
+		 */
+		private static final int SUB_BITS = 3;
+		private static final int SUB_COUNT = 1 << SUB_BITS;
+
+		private final AtomicLongArray buckets = new AtomicLongArray(
+			64 * SUB_COUNT
+		);
+		private final AtomicLong count = new AtomicLong();
+		private final AtomicLong sum = new AtomicLong();
+		private final AtomicLong max = new AtomicLong();
+
+		private static int bucketOf(long value) {
+			if (value < SUB_COUNT) {
+				return (int) Math.max(value, 0);
+			}
+			final int exponent = 63 - Long.numberOfLeadingZeros(value);
+			final int sub = (int) (
+				(value >>> (exponent - SUB_BITS)) & (SUB_COUNT - 1)
+			);
+			return (exponent - SUB_BITS + 1) * SUB_COUNT + sub;
+		}
+
+		private static long upperBoundOf(int bucket) {
+			if (bucket < SUB_COUNT) {
+				return bucket;
+			}
+			final int exponent = bucket / SUB_COUNT + SUB_BITS - 1;
+			final long sub = bucket % SUB_COUNT;
+			final long lowerBound = (1L << exponent) | (sub << (exponent - SUB_BITS));
+			return lowerBound + (1L << (exponent - SUB_BITS)) - 1;
+		}
+
+		public void record(long value) {
+			buckets.incrementAndGet(bucketOf(value));
+			count.incrementAndGet();
+			sum.addAndGet(value);
+			max.accumulateAndGet(value, Math::max);
+		}
+
+		public long getCount() {
+			return count.get();
+		}
+
+		public long getMax() {
+			return max.get();
+		}
+
+		public double getMean() {
+			final long n = count.get();
+			return n == 0 ? 0 : (double) sum.get() / n;
+		}
+
+		/**
+		 * Get an approximation of a percentile.
+		 *
+		 * @param percentile The percentile, between 0 and 100.
+		 * @return The upper bound of the bucket containing the percentile, never above the recorded maximum.
+		 */
+		public long getPercentile(double percentile) {
+			final long n = count.get();
+			if (n == 0) {
+				return 0;
+			}
+
+			final long rank = Math.max(1, (long) Math.ceil(n * percentile / 100));
+			long seen = 0;
+			for (int i = 0; i < buckets.length(); i++) {
+				seen += buckets.get(i);
+				if (seen >= rank) {
+					return Math.min(upperBoundOf(i), max.get());
+				}
+			}
+			return max.get();
+		}
+	}
+
+	/**
+	 * A summary of a histogram, durations are in milliseconds.
+	 */
+	public record Summary(
+		String hook,
+		String phase,
+		long count,
+		double mean,
+		double p50,
+		double p95,
+		double p99,
+		double max
+	) {}
+
+	private static final double NANOS_PER_MS = 1_000_000d;
+
+	/**
+	 * Histograms by hook name then by phase.
+	 */
+	private final Map<String, Map<String, Histogram>> histograms = new ConcurrentHashMap<>();
+
+	/**
+	 * Number of pending tasks in the pool, sampled when a task is queued.
+	 */
+	private final Histogram queueDepth = new Histogram();
+
+	/**
+	 * Record the duration of a hook call phase.
+	 *
+	 * @param hook The hook name (e.g. "request")
+	 * @param phase The phase name (e.g. "queue", "hook")
+	 * @param nanos The phase duration in nanoseconds.
+	 */
+	public void record(String hook, String phase, long nanos) {
+		histograms
+			.computeIfAbsent(hook, k -> new ConcurrentHashMap<>())
+			.computeIfAbsent(phase, k -> new Histogram())
+			.record(nanos);
+	}
+
+	/**
+	 * Record the number of pending tasks when a task is queued.
+	 *
+	 * @param depth The number of tasks queued or being processed.
+	 */
+	public void recordQueueDepth(int depth) {
+		queueDepth.record(depth);
+	}
+
+	public Histogram getQueueDepth() {
+		return queueDepth;
+	}
+
+	/**
+	 * Discard every recorded value.
+	 */
+	public void reset() {
+		histograms.clear();
+		queueDepth.count.set(0);
+		queueDepth.sum.set(0);
+		queueDepth.max.set(0);
+		for (int i = 0; i < queueDepth.buckets.length(); i++) {
+			queueDepth.buckets.set(i, 0);
+		}
+	}
+
+	/**
+	 * Summarize every histogram, sorted by hook and phase name.
+	 *
+	 * @return The summaries.
+	 */
+	public List<Summary> getSummaries() {
+		final List<Summary> summaries = new ArrayList<>();
+		histograms.forEach((hook, phases) ->
+			phases.forEach((phase, histogram) ->
+				summaries.add(
+					new Summary(
+						hook,
+						phase,
+						histogram.getCount(),
+						histogram.getMean() / NANOS_PER_MS,
+						histogram.getPercentile(50) / NANOS_PER_MS,
+						histogram.getPercentile(95) / NANOS_PER_MS,
+						histogram.getPercentile(99) / NANOS_PER_MS,
+						histogram.getMax() / NANOS_PER_MS
+					)
+				)
+			)
+		);
+		summaries.sort(
+			Comparator.comparing(Summary::hook).thenComparing(Summary::phase)
+		);
+		return summaries;
+	}
+
+	/**
+	 * Export the summaries as JSON.
+	 *
+	 * @param currentQueueDepth The current number of pending tasks.
+	 * @return The JSON document.
+	 */
+	public String toJson(int currentQueueDepth) {
+		final Map<String, Object> queue = new LinkedHashMap<>();
+		queue.put("current", currentQueueDepth);
+		queue.put("p50", queueDepth.getPercentile(50));
+		queue.put("p95", queueDepth.getPercentile(95));
+		queue.put("p99", queueDepth.getPercentile(99));
+		queue.put("max", queueDepth.getMax());
+
+		final Map<String, Object> root = new LinkedHashMap<>();
+		root.put("unit", "ms");
+		root.put("queue_depth", queue);
+		root.put("hooks", getSummaries());
+
+		try {
+			return new ObjectMapper()
+				.writerWithDefaultPrettyPrinter()
+				.writeValueAsString(root);
+		} catch (JsonProcessingException e) {
+			throw new RuntimeException(e);
+		}
+	}
+}
@@ -0,0 +1,99 @@
+package lexfo.scalpel;
+
+import burp.api.montoya.http.HttpService;
+import burp.api.montoya.http.message.HttpHeader;
+import burp.api.montoya.http.message.HttpMessage;
+import burp.api.montoya.http.message.requests.HttpRequest;
+import java.util.Map;
+import java.util.Optional;
+import java.util.regex.Pattern;
+
+/**
+ * The MATCH specification declared by a script, compiled once per reload.
+ *
+ * <p>Allows out-of-scope traffic to be skipped before it is queued for the Python interpreter.
+ * The regular expressions are generated by pyscalpel.http.match, which applies the same rules Python side.
+ */
+public class MatchSpec {
+
+	private final Optional<Pattern> hosts;
+	private final Optional<Pattern> paths;
+	private final Optional<Pattern> methods;
+	private final Optional<Pattern> contentTypes;
+
+	/**
+	 * @param regexes The regular expression of each declared field ("hosts", "paths", "methods", "content_types").
+	 */
+	public MatchSpec(Map<String, String> regexes) {
+		this.hosts = compile(regexes, "hosts");
+		this.paths = compile(regexes, "paths");
+		this.methods = compile(regexes, "methods");
+		this.contentTypes = compile(regexes, "content_types");
+	}
+
+	private static Optional<Pattern> compile(
+		Map<String, String> regexes,
+		String field
+	) {
+		return Optional.ofNullable(regexes.get(field)).map(Pattern::compile);
+	}
+
+	private static boolean fieldMatches(
+		Optional<Pattern> pattern,
+		String value
+	) {
+		return pattern.map(p -> p.matcher(value).matches()).orElse(true);
+	}
+
+	/**
+	 * Get the Content-Type of a message, without its parameters.
+	 *
+	 * @param message The HTTP message.
+	 * @return The mime type, or an empty string when there is none.
+	 */
+	private static String getMimeType(HttpMessage message) {
+		if (message == null) {
+			return "";
+		}
+
+		return message
+			.headers()
+			.stream()
+			.filter(h -> h.name().equalsIgnoreCase("Content-Type"))
+			.findFirst()
+			.map(HttpHeader::value)
+			.map(v -> v.split(";", 2)[0].strip())
+			.orElse("");
+	}
+
+	/**
+	 * Whether a message satisfies every declared field.
+	 *
+	 * @param service The network service of the request, may be null.
+	 * @param request The request, or the initiating request of a response, may be null.
+	 * @param message The hooked message, its Content-Type is matched.
+	 * @return true if the message matches the specification.
+	 */
+	public boolean matches(
+		HttpService service,
+		HttpRequest request,
+		HttpMessage message
+	) {
+		if (!fieldMatches(hosts, service != null ? service.host() : "")) {
+			return false;
+		}
+
+		if (!fieldMatches(paths, request != null ? request.path() : "")) {
+			return false;
+		}
+
+		if (!fieldMatches(methods, request != null ? request.method() : "")) {
+			return false;
+		}
+
+		return (
+			contentTypes.isEmpty() ||
+			fieldMatches(contentTypes, getMimeType(message))
+		);
+	}
+}
@@ -4,6 +4,10 @@ import burp.api.montoya.core.ByteArray;
 import burp.api.montoya.http.message.HttpHeader;
 import burp.api.montoya.http.message.HttpMessage;
 import java.lang.reflect.Method;
+import java.nio.ByteBuffer;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.List;
 import java.util.stream.IntStream;
 
 /**
@@ -57,6 +61,122 @@ public class PythonUtils {
 		return ByteArray.byteArray(pythonBytes);
 	}
 
+	/**
+	 * Copy a Burp ByteArray into a direct buffer
+	 *
+	 * Jep exposes direct buffers to Python through the buffer protocol,
+	 * 	so Python can wrap the result in a memoryview without any per-byte conversion,
+	 * 	unlike the boxed int[] returned by {@link #toPythonBytes(byte[])}.
+	 *
+	 * The content is copied twice: ByteArray.getBytes() already returns a copy, the only bulk accessor Montoya offers,
+	 * 	which is then copied into the direct buffer. (Jep would copy a byte[] into native memory as well.)
+	 *
+	 * @param byteArray the Burp ByteArray to copy
+	 * @return a direct buffer holding the ByteArray content, ready to be read
+	 */
+	public static ByteBuffer toDirectBuffer(ByteArray byteArray) {
+		return toDirectBuffer(byteArray.getBytes());
+	}
+
+	/**
+	 * Copy Java bytes into a direct buffer
+	 *
+	 * @param bytes the bytes to copy
+	 * @return a direct buffer holding the bytes, ready to be read
+	 * @see #toDirectBuffer(ByteArray)
+	 */
+	public static ByteBuffer toDirectBuffer(byte[] bytes) {
+		final ByteBuffer buffer = ByteBuffer.allocateDirect(bytes.length);
+		buffer.put(bytes);
+		buffer.flip();
+		return buffer;
+	}
+
+	/**
+	 * Whether a header name or value can be written in a header block and parsed back unchanged.
+	 *
+	 * @param text the header name or value
+	 * @return false when the text contains a line break or a character outside of ISO-8859-1
+	 */
+	private static boolean isHeaderBlockSafe(String text) {
+		for (int i = 0; i < text.length(); i++) {
+			final char c = text.charAt(i);
+			if (c == '\r' || c == '\n' || c > 0xFF) {
+				return false;
+			}
+		}
+		return true;
+	}
+
+	/**
+	 * Serialize headers to an HTTP/1 header block in a direct buffer
+	 *
+	 * Each header is written as "name: value\r\n" in ISO-8859-1,
+	 * 	so Python gets every header in one call instead of calling name() and value() on each of them.
+	 *
+	 * @param headers the headers to serialize
+	 * @return a direct buffer holding the header block, ready to be read,
+	 * 	or null when a header cannot be parsed back from the block (empty name, colon in the name
+	 * 	after its first character, line break, or character outside of ISO-8859-1).
+	 */
+	public static ByteBuffer toHeaderBlock(List<HttpHeader> headers) {
+		final StringBuilder block = new StringBuilder();
+		for (final HttpHeader header : headers) {
+			final String name = header.name();
+			final String value = header.value();
+			if (
+				name == null ||
+				value == null ||
+				name.isEmpty() ||
+				// Only pseudo headers (e.g. :authority) may contain a colon.
+				name.indexOf(':', 1) != -1 ||
+				!isHeaderBlockSafe(name) ||
+				!isHeaderBlockSafe(value)
+			) {
+				return null;
+			}
+			block.append(name).append(": ").append(value).append("\r\n");
+		}
+		return toDirectBuffer(
+			block.toString().getBytes(StandardCharsets.ISO_8859_1)
+		);
+	}
+
+	/**
+	 * Parse an HTTP/1 header block into Burp headers
+	 *
+	 * The reverse of {@link #toHeaderBlock(List)}, Python hands every header in a single byte array.
+	 *
+	 * @param block the header block, one "name: value\r\n" line per header, in ISO-8859-1
+	 * @return the parsed headers, in order
+	 */
+	public static List<HttpHeader> fromHeaderBlock(byte[] block) {
+		final String text = new String(block, StandardCharsets.ISO_8859_1);
+		final List<HttpHeader> headers = new ArrayList<>();
+		int start = 0;
+		while (start < text.length()) {
+			int end = text.indexOf("\r\n", start);
+			if (end == -1) {
+				end = text.length();
+			}
+			// Pseudo headers (e.g. :authority) start with a colon.
+			final int separator = text.indexOf(": ", start + 1);
+			if (separator == -1 || separator >= end) {
+				throw new IllegalArgumentException(
+					"Invalid header line: " + text.substring(start, end)
+				);
+			}
+			headers.add(
+				HttpHeader.httpHeader(
+					text.substring(start, separator),
+					text.substring(separator + 2, end)
+				)
+			);
+			start = end + 2;
+		}
+		return headers;
+	}
+
 	/**
 	 *    Updates the specified HttpMessage object's header with the specified name and value.
 	 *    Creates the header when it doesn't exist.
@@ -0,0 +1,127 @@
+package lexfo.scalpel;
+
+import java.io.BufferedOutputStream;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardCopyOption;
+import java.nio.file.StandardOpenOption;
+
+/**
+ * Append-only log file, rotated once it exceeds a maximum size.
+ *
+ * <p>When rotating, name.log is renamed to name.log.1, name.log.1 to name.log.2, and so on,
+ * the oldest file beyond the backup count is overwritten.
+ * Writes are buffered and flushed at the end of each line.
+ * The file is disabled after the first I/O error, so a full disk doesn't slow every write down.
+ */
+public class RotatingLogFile {
+
+	private final Path path;
+	private final long maxBytes;
+	private final int backups;
+	private OutputStream out = null;
+	private long size = 0;
+	private boolean failed = false;
+
+	/**
+	 * @param path     The log file path, its parent directories are created if needed.
+	 * @param maxBytes The size from which the file is rotated.
+	 * @param backups  The number of rotated files to keep.
+	 */
+	public RotatingLogFile(Path path, long maxBytes, int backups) {
+		this.path = path;
+		this.maxBytes = maxBytes;
+		this.backups = backups;
+	}
+
+	public Path getPath() {
+		return path;
+	}
+
+	public synchronized void write(CharSequence text) {
+		if (failed) {
+			return;
+		}
+
+		try {
+			if (out == null) {
+				open();
+			}
+
+			final String str = text.toString();
+			final byte[] bytes = str.getBytes(StandardCharsets.UTF_8);
+			out.write(bytes);
+			size += bytes.length;
+
+			if (size >= maxBytes) {
+				rotate();
+			} else if (str.indexOf('\n') >= 0) {
+				out.flush();
+			}
+		} catch (IOException e) {
+			failed = true;
+			closeQuietly();
+			ScalpelLogger.error("Failed to write to " + path + ", disabling it:");
+			ScalpelLogger.logStackTrace(e);
+		}
+	}
+
+	public synchronized void close() {
+		closeQuietly();
+	}
+
+	private void open() throws IOException {
+		Files.createDirectories(path.getParent());
+		out =
+			new BufferedOutputStream(
+				Files.newOutputStream(
+					path,
+					StandardOpenOption.CREATE,
+					StandardOpenOption.APPEND
+				)
+			);
+		size = Files.size(path);
+	}
+
+	private void rotate() throws IOException {
+		out.close();
+		out = null;
+
+		for (int i = backups - 1; i >= 1; i--) {
+			final Path source = backup(i);
+			if (Files.exists(source)) {
+				Files.move(
+					source,
+					backup(i + 1),
+					StandardCopyOption.REPLACE_EXISTING
+				);
+			}
+		}
+
+		if (backups > 0) {
+			Files.move(path, backup(1), StandardCopyOption.REPLACE_EXISTING);
+		} else {
+			Files.delete(path);
+		}
+		size = 0;
+	}
+
+	private Path backup(int index) {
+		return path.resolveSibling(path.getFileName() + "." + index);
+	}
+
+	private void closeQuietly() {
+		if (out == null) {
+			return;
+		}
+		try {
+			out.close();
+		} catch (IOException e) {
+			ScalpelLogger.logStackTrace(e);
+		}
+		out = null;
+	}
+}
@@ -19,9 +19,14 @@ import java.util.Optional;
 import java.util.Set;
 import java.util.UUID;
 import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.function.BooleanSupplier;
 import java.util.stream.Collectors;
 import java.util.stream.Stream;
+import javax.swing.JLabel;
 import javax.swing.JTabbedPane;
+import javax.swing.SwingConstants;
+import javax.swing.SwingUtilities;
 import javax.swing.UIManager;
 import javax.swing.plaf.basic.BasicTabbedPaneUI;
 import lexfo.scalpel.ScalpelExecutor.CallableData;
@@ -51,7 +56,7 @@ public class ScalpelEditorTabbedPane
 	/**
 		The HTTP request or response being edited.
 	*/
-	private HttpRequestResponse _requestResponse;
+	private volatile HttpRequestResponse _requestResponse;
 
 	/**
 		The Montoya API object.
@@ -85,6 +90,19 @@ public class ScalpelEditorTabbedPane
 
 	private final ArrayList<IMessageEditor> editors = new ArrayList<>();
 
+	/**
+		Incremented by every setRequestResponse() call, so the calls for a previous message can be dropped.
+	 */
+	private final AtomicLong renderGeneration = new AtomicLong();
+
+	/**
+		Displayed while the editor hooks are running.
+	 */
+	private final JLabel loadingPlaceholder = new JLabel(
+		"Loading...",
+		SwingConstants.CENTER
+	);
+
 	/**
 		req_edit_ or res_edit
 	 */
@@ -364,9 +382,15 @@ public class ScalpelEditorTabbedPane
 
 			this.editors.add(editor);
 
+			// Read the generation first, a message set in the meantime supersedes this render.
+			final long render = renderGeneration.get();
+			final HttpRequestResponse requestResponse = this._requestResponse;
 			if (
-				this._requestResponse != null &&
-				editor.setRequestResponseInternal(_requestResponse)
+				requestResponse != null &&
+				editor.setRequestResponseInternal(
+					requestResponse,
+					() -> renderGeneration.get() != render
+				)
 			) {
 				this.addEditorToDisplayedTabs(editor);
 			}
@@ -528,12 +552,55 @@ public class ScalpelEditorTabbedPane
 
 		this._requestResponse = requestResponse;
 
-		// Hide disabled tabs
+		// Supersede the pending calls for the previously displayed message.
+		final long render = renderGeneration.incrementAndGet();
+		final BooleanSupplier isSuperseded = () ->
+			renderGeneration.get() != render;
+
+		// Display a placeholder until the hooks have returned.
 		this.pane.removeAll();
-		editors
-			.parallelStream()
-			.filter(e -> e.setRequestResponseInternal(requestResponse))
-			.forEach(this::addEditorToDisplayedTabs);
+		this.pane.addTab("Scalpel", loadingPlaceholder);
+
+		// Call the hooks off the calling thread (usually the EDT), the calls queued for a superseded message never reach Python.
+		final List<CompletableFuture<Optional<IMessageEditor>>> rendered = List
+			.copyOf(editors)
+			.stream()
+			.map(editor ->
+				Async.supply(() ->
+					executor.callCancellable(
+						isSuperseded,
+						() ->
+							editor.setRequestResponseInternal(
+									requestResponse,
+									isSuperseded
+								)
+								? Optional.of(editor)
+								: Optional.<IMessageEditor>empty()
+					)
+				)
+			)
+			.toList();
+
+		CompletableFuture
+			.allOf(rendered.toArray(CompletableFuture[]::new))
+			.whenComplete((__, error) -> {
+				if (error != null) {
+					ScalpelLogger.logStackTrace(error);
+				}
+				SwingUtilities.invokeLater(() -> {
+					if (isSuperseded.getAsBoolean()) {
+						return;
+					}
+
+					// Hide disabled tabs
+					this.pane.removeAll();
+					rendered
+						.stream()
+						.map(f -> f.getNow(Optional.empty()))
+						.flatMap(Optional::stream)
+						.forEach(this::addEditorToDisplayedTabs);
+				});
+			});
 	}
 
 	/**
@@ -12,14 +12,27 @@ import java.io.File;
 import java.io.IOException;
 import java.io.OutputStream;
 import java.nio.file.Path;
+import java.util.ArrayList;
 import java.util.Arrays;
+import java.util.Comparator;
 import java.util.HashMap;
+import java.util.Iterator;
 import java.util.List;
 import java.util.Map;
 import java.util.Optional;
-import java.util.Queue;
+import java.util.Set;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.CopyOnWriteArrayList;
+import java.util.concurrent.ExecutionException;
 import java.util.concurrent.LinkedBlockingQueue;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.TimeoutException;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.function.BooleanSupplier;
 import java.util.function.Consumer;
+import java.util.function.Supplier;
 import java.util.stream.Stream;
 import jep.ClassEnquirer;
 import jep.ClassList;
@@ -28,10 +41,12 @@ import jep.JepConfig;
 import jep.SubInterpreter;
 
 /**
- * Responds to requested Python tasks from multiple threads through a task queue handled in a single sepearate thread.
+ * Responds to requested Python tasks from multiple threads through task queues handled in separate threads.
  *
- * <p>The executor is responsible for managing a single global Python interpreter
+ * <p>The executor is responsible for managing a pool of Python interpreters
  * for every script that's being executed.
+ * By default, the pool contains a single global interpreter, so the script's global state is shared between all hooks.
+ * When the pool is configured to contain multiple interpreters, each task is dispatched to the least busy one.
  *
  * <p>The executor itself is designed to be used concurrently by different threads.
  * It provides a simple interface for submitting tasks to be executed by the script,
@@ -119,19 +134,34 @@ public class ScalpelExecutor {
 		private Object[] args;
 
 		/**
-		 * Whether the task has been completed. (Used to break out of the awaitResult() loop in case of failure.)
+		 * The keyword arguments passed to the task.
 		 */
-		private Boolean finished = false;
+		private Map<String, Object> kwargs;
 
 		/**
-		 * The keyword arguments passed to the task.
+		 * Completed with the result of the task once it is resolved or rejected.
 		 */
-		private Map<String, Object> kwargs;
+		private final CompletableFuture<Result<Object, Throwable>> result = new CompletableFuture<>();
+
+		/**
+		 * The worker the task was dispatched to. (null until it is queued)
+		 */
+		private volatile Worker worker = null;
+
+		/**
+		 * Called once when the task is resolved or rejected.
+		 */
+		private Runnable onFinished = () -> {};
 
 		/**
-		 * An optional object containing the result of the task, if it has been completed.
+		 * When the task was created, to measure how long it waited in the queue. (System.nanoTime())
 		 */
-		private Result<Object, Throwable> result = Result.empty();
+		private final long createdAt = System.nanoTime();
+
+		/**
+		 * Whether the caller no longer needs the result, checked before the task is passed to Python.
+		 */
+		private final BooleanSupplier isCancelled = cancellation.get();
 
 		/**
 		 * Constructs a new Task object.
@@ -145,77 +175,566 @@ public class ScalpelExecutor {
 			this.args = args;
 			this.kwargs = kwargs;
 
-			ScalpelLogger.trace("Created task: " + name);
+			if (ScalpelLogger.isTraceEnabled()) {
+				ScalpelLogger.trace("Created task: " + name);
+			}
 		}
 
 		/**
-		 * Add the task to the queue and wait for it to be completed by the task thread.
+		 * Wait for the task to be completed by the task thread.
 		 *
-		 * @return the result of the task.
+		 * @return the result of the task, empty if the task was never queued or its worker died.
 		 */
-		public synchronized Result<Object, Throwable> await() {
+		public Result<Object, Throwable> await() {
 			// Log this before awaiting to debug potential deadlocks.
-			ScalpelLogger.trace("Awaiting task: " + name);
-
-			// Acquire the lock on the Task object.
-			synchronized (this) {
-				// Ensure we return only when result has been set
-				// (apparently wait() might return even if notify hasn't been called for some weird software and hardware issues)
-				while (
-					isEnabled &&
-					(isRunnerAlive || isRunnerStarting) &&
-					!isFinished()
-				) {
-					// Wrap the wait in try/catch to handle InterruptedException.
-					try {
-						// Wait for the object to be notified.
-						this.wait(1000);
-
-						if (!isFinished()) {
-							// Warn the user that a task is taking a long time.
-							ScalpelLogger.warn(
-								"Task " + name + " is still waiting..."
-							);
-						}
-					} catch (InterruptedException e) {
-						// Log the error.
-						ScalpelLogger.error("Task " + name + " interrupted:");
-
-						// Log the stack trace.
-						ScalpelLogger.logStackTrace(e);
-					}
+			if (ScalpelLogger.isTraceEnabled()) {
+				ScalpelLogger.trace("Awaiting task: " + name);
+			}
+
+			while (
+				!isFinished() &&
+				isEnabled &&
+				worker != null &&
+				worker.isAvailable()
+			) {
+				try {
+					result.get(1, TimeUnit.SECONDS);
+				} catch (TimeoutException e) {
+					// Warn the user that a task is taking a long time.
+					ScalpelLogger.warn("Task " + name + " is still waiting...");
+				} catch (InterruptedException | ExecutionException e) {
+					// Log the error.
+					ScalpelLogger.error("Task " + name + " interrupted:");
+
+					// Log the stack trace.
+					ScalpelLogger.logStackTrace(e);
+					break;
 				}
 			}
 
-			ScalpelLogger.trace("Finished awaiting task: " + name);
+			if (ScalpelLogger.isTraceEnabled()) {
+				ScalpelLogger.trace("Finished awaiting task: " + name);
+			}
 			// Return the awaited result.
-			return this.result;
+			return result.getNow(Result.empty());
 		}
 
-		public Boolean isFinished() {
-			return finished;
+		public boolean isFinished() {
+			return result.isDone();
 		}
 
-		public synchronized void then(Consumer<Object> callback) {
-			Async.run(() -> this.await().ifSuccess(callback));
+		public void then(Consumer<Object> callback) {
+			result.thenAccept(r -> r.ifSuccess(callback));
 		}
 
-		public synchronized void resolve(Object result) {
-			this.result = Result.success(result);
-			this.finished = true;
+		public void resolve(Object value) {
+			finish(Result.success(value));
 		}
 
-		public synchronized void reject() {
+		public void reject() {
 			reject(Optional.empty());
 		}
 
-		public synchronized void reject(Throwable error) {
+		public void reject(Throwable error) {
 			reject(Optional.of(error));
 		}
 
-		public synchronized void reject(Optional<Throwable> error) {
-			this.result = error.map(Result::error).orElse(Result.empty());
-			this.finished = true;
+		public void reject(Optional<Throwable> error) {
+			finish(error.map(Result::error).orElse(Result.empty()));
+		}
+
+		private void finish(Result<Object, Throwable> value) {
+			// Only the first completion counts, onFinished is called once.
+			if (result.complete(value)) {
+				onFinished.run();
+			}
+		}
+	}
+
+	/**
+	 * A task runner owning its own Python interpreter and task queue.
+	 *
+	 * <p>The executor dispatches tasks to a pool of workers,
+	 * each worker loads the framework and the user script in a separate SubInterpreter.
+	 * The first worker is the primary one, it is responsible for reporting the loading status to the user.
+	 */
+	private class Worker {
+
+		/**
+		 * The worker index in the pool.
+		 */
+		private final int id;
+
+		/**
+		 * The Python task queue, drained back to back by the runner thread.
+		 */
+		private final BlockingQueue<Task> tasks = new LinkedBlockingQueue<>();
+
+		/**
+		 * The observe-only task queue, only polled when no other task is pending.
+		 */
+		private final BlockingQueue<Task> observerTasks = new LinkedBlockingQueue<>();
+
+		/**
+		 * The task runner thread.
+		 */
+		private Thread runner;
+
+		/**
+		 * Flag indicating whether the task runner loop is running.
+		 */
+		private volatile Boolean isRunnerAlive = false;
+
+		private volatile Boolean isRunnerStarting = true;
+
+		/**
+		 * Flag indicating whether a task is being processed.
+		 */
+		private volatile boolean isBusy = false;
+
+		/**
+		 * Flag indicating whether the worker was removed from the pool and must not be relaunched.
+		 */
+		private volatile boolean isRetired = false;
+
+		/**
+		 * The reload generation the current interpreter was loaded for.
+		 */
+		private long loadedGeneration = -1;
+
+		/**
+		 * The restart generation the current interpreter was initialized for.
+		 */
+		private long loadedRestartGeneration = -1;
+
+		/**
+		 * Constructs a new Worker object.
+		 *
+		 * @param id the worker index in the pool.
+		 */
+		Worker(int id) {
+			this.id = id;
+		}
+
+		private boolean isPrimary() {
+			return id == 0;
+		}
+
+		/**
+		 * Whether the tasks queued to this worker will eventually be processed.
+		 *
+		 * @return true if the worker is running or about to run.
+		 */
+		private boolean isAvailable() {
+			return isRunnerAlive || isRunnerStarting;
+		}
+
+		/**
+		 * Whether the worker can currently accept new tasks.
+		 *
+		 * @return true if the worker is available and still part of the pool.
+		 */
+		private boolean acceptsTasks() {
+			return !isRetired && isAvailable();
+		}
+
+		/**
+		 * The number of tasks queued or being processed by this worker.
+		 * The queued observe-only tasks are not counted, they don't delay the other tasks.
+		 *
+		 * @return the worker load.
+		 */
+		private int load() {
+			return tasks.size() + (isBusy ? 1 : 0);
+		}
+
+		/**
+		 * Queues a task when the worker is available.
+		 *
+		 * @param task the task to queue.
+		 * @return true if the task was queued, false otherwise.
+		 */
+		private boolean submit(Task task) {
+			// The lock is only shared with the methods draining the queue when the runner stops,
+			// the runner itself polls the queue without it.
+			synchronized (tasks) {
+				// Ensure the runner is alive.
+				if (!acceptsTasks()) {
+					return false;
+				}
+
+				task.worker = this;
+
+				if (OBSERVER_CB_NAMES.contains(task.name)) {
+					observerTasks.add(task);
+					// Wake the runner up if it is idle, it is otherwise busy with tasks that go first.
+					if (tasks.isEmpty()) {
+						notifyLoop();
+					}
+					return true;
+				}
+
+				// Queue the task, this wakes the runner up if it is idle.
+				tasks.add(task);
+			}
+			return true;
+		}
+
+		/**
+		 * Takes the next task to process, the observe-only tasks only run when no other task is pending.
+		 *
+		 * @return the next task, or null if none was queued before the timeout.
+		 * @throws InterruptedException if interrupted while waiting.
+		 */
+		private Task pollTask() throws InterruptedException {
+			final Task task = tasks.poll();
+			if (task != null) {
+				return task;
+			}
+
+			final Task observerTask = observerTasks.poll();
+			if (observerTask != null) {
+				return observerTask;
+			}
+
+			// Queued tasks are processed back to back, the timeout only applies when the queue is empty.
+			return tasks.poll(
+				Constants.RUNNER_POLL_TIMEOUT_MS,
+				TimeUnit.MILLISECONDS
+			);
+		}
+
+		/**
+		 * Removes the queued tasks calling the same intercepter as the given one, so they can be processed at once.
+		 *
+		 * @param first the task that was just polled.
+		 * @return the tasks to process, starting with the given one.
+		 */
+		private List<Task> pollBatch(Task first) {
+			final List<Task> batch = new ArrayList<>();
+			batch.add(first);
+
+			if (!BATCH_CB_NAMES.containsKey(first.name)) {
+				return batch;
+			}
+
+			final Iterator<Task> it = tasks.iterator();
+			while (batch.size() < Constants.MAX_HOOK_BATCH_SIZE && it.hasNext()) {
+				final Task task = it.next();
+				if (task.name.equals(first.name) && !task.isFinished()) {
+					it.remove();
+					batch.add(task);
+				}
+			}
+			return batch;
+		}
+
+		/**
+		 * Wakes the runner up when it is waiting for tasks, so it checks for changes immediately.
+		 */
+		private void notifyLoop() {
+			tasks.offer(wakeUpTask);
+		}
+
+		private void rejectAllTasks() {
+			synchronized (tasks) {
+				while (true) {
+					// Use polling and not foreach + clear to avoid race conditions (tasks being cleared but not rejected)
+					final Task task = Optional
+						.ofNullable(tasks.poll())
+						.orElseGet(observerTasks::poll);
+					if (task == null) {
+						break;
+					}
+					task.reject();
+				}
+			}
+		}
+
+		/**
+		 * Hands the pending tasks of a retired worker over to the rest of the pool.
+		 */
+		private void redispatchAllTasks() {
+			synchronized (tasks) {
+				while (true) {
+					final Task task = Optional
+						.ofNullable(tasks.poll())
+						.orElseGet(observerTasks::poll);
+					if (task == null) {
+						break;
+					}
+					if (task.isFinished()) {
+						continue;
+					}
+
+					final boolean queued = selectWorker()
+						.map(w -> w.submit(task))
+						.orElse(false);
+
+					if (!queued) {
+						task.reject();
+					}
+				}
+			}
+		}
+
+		/**
+		 * Whether the interpreter must be restarted. (framework or config changed, or pool resized)
+		 *
+		 * @return true if the interpreter is outdated.
+		 */
+		private boolean mustRestart() {
+			pollChanges();
+			return isRetired || restartGeneration != loadedRestartGeneration;
+		}
+
+		/**
+		 * Re-executes the user script in the running interpreter, when only the script changed.
+		 * The queued tasks wait for the swap and are then processed by the new script.
+		 * When the new script fails to load, the previous one keeps being used.
+		 *
+		 * @param interp the running interpreter.
+		 * @return false when the new script declares no hooks, the interpreter must then be restarted to report it.
+		 */
+		private boolean hotSwap(final SubInterpreter interp) {
+			final long swappedGeneration = generation;
+			final String scriptName = script
+				.map(File::getName)
+				.orElse("the selected script");
+
+			ScalpelLogger.info("User script has changed, reloading it...");
+
+			Optional<Throwable> error = Optional.empty();
+			try {
+				interp.invoke(Constants.RELOAD_SCRIPT_CB_NAME);
+			} catch (Throwable e) {
+				error = Optional.of(e);
+			}
+
+			loadedGeneration = swappedGeneration;
+
+			// Like on startup, don't run the event loop when no hooks are implemented.
+			if (
+				error.isEmpty() &&
+				!hasValidHooks(
+					toCallableData(interp.invoke(Constants.GET_CB_NAME))
+						.stream()
+						.map(CallableData::name)
+				)
+			) {
+				ScalpelLogger.debug(
+					"No hooks were found in the reloaded script, restarting worker #" +
+					id +
+					"."
+				);
+				return false;
+			}
+
+			// Avoid displaying the same message once per worker.
+			if (!isPrimary()) {
+				return true;
+			}
+
+			cacheCallables(interp, swappedGeneration);
+
+			if (error.isPresent()) {
+				final String trace = ScalpelLogger.exceptionToErrorMsg(
+					error.get(),
+					"Failed to reload " +
+					scriptName +
+					", the previous version is still in use"
+				);
+				ScalpelLogger.error(trace);
+				ConfigTab.clearOutputs("Failed to reload " + scriptName);
+				ConfigTab.putStringToOutput(trace, false);
+				return true;
+			}
+
+			final String msg = "Sucessfully reloaded " + scriptName;
+			ConfigTab.clearOutputs(msg);
+			ScalpelLogger.info(msg);
+
+			// Editor tabs depend on the declared hooks.
+			editorProvider.ifPresent(ScalpelEditorProvider::resetEditorsAsync);
+			return true;
+		}
+
+		private void innerTaskLoop(final SubInterpreter interp)
+			throws InterruptedException {
+			while (true) {
+				// Relaunch interpreter when the framework or the config have changed.
+				if (mustRestart()) {
+					ScalpelLogger.info(
+						"Config or framework files have changed, reloading interpreter..."
+					);
+					break;
+				}
+
+				// Swap the user script without reinitializing the interpreter (hot reload).
+				if (generation != loadedGeneration && !hotSwap(interp)) {
+					break;
+				}
+
+				if (!isEnabled) {
+					// Nobody awaits the tasks while Scalpel is disabled, drop them until it is enabled again.
+					final Task dropped = pollTask();
+					if (dropped != null) {
+						dropped.reject();
+					}
+					continue;
+				}
+
+				// Extract the oldest pending task from the queues, or wait for one.
+				final Task task = pollTask();
+
+				if (task == null || task.isFinished()) {
+					// Timed out, woken up or the task was already rejected, check for changes again.
+					continue;
+				}
+
+				if (task.isCancelled.getAsBoolean()) {
+					// Superseded while queued (e.g. another message was selected in the editor)
+					ScalpelLogger.trace("Dropped cancelled task: " + task.name);
+					task.reject();
+					continue;
+				}
+
+				// Coalesce the intercepter calls that queued up, to cross the Python boundary once.
+				final List<Task> batch = pollBatch(task);
+				final String batchHook = BATCH_CB_NAMES.get(task.name);
+
+				isBusy = true;
+				try {
+					if (
+						batch.size() > 1 ||
+						(batchHook != null && hasLoadedCallable(batchHook))
+					) {
+						processBatch(interp, "_" + batchHook, batch);
+					} else {
+						processTask(interp, task);
+					}
+				} finally {
+					isBusy = false;
+				}
+			}
+		}
+
+		// WARN: Declaring this method as synchronized cause deadlocks.
+		private void taskLoop() {
+			ScalpelLogger.debug("Starting task loop #" + id + ".");
+
+			isRunnerStarting = true;
+
+			// Record the files state this interpreter is loaded from.
+			synchronized (reloadLock) {
+				loadedGeneration = pollChanges();
+				loadedRestartGeneration = restartGeneration;
+			}
+
+			SubInterpreter interp;
+			try {
+				interp = initInterpreter();
+			} catch (Throwable e) {
+				interp = null;
+
+				// Log the error.
+				String trace = ScalpelLogger.exceptionToErrorMsg(
+					e,
+					"Failed to initialize interpreter"
+				);
+
+				// Check if Python itself is broken
+				if (trace.contains("No module named 'binascii'")) {
+					// This may happen if you messed with pyenv and installed Scalpel in a different Python version that the one in use at this time.
+					trace +=
+						"\n/!\\ SOMETHING IS WRONG WITH YOUR PYTHON SETUP /!\\\n" +
+						"You may have mixed different Python installations when installling and using Scalpel" +
+						", you may try re-installing Scalpel in your current Python environment";
+				}
+
+				ScalpelLogger.error(trace);
+
+				// Avoid displaying the same error once per worker.
+				if (isPrimary()) {
+					ConfigTab.clearOutputs(
+						"Failed to load " +
+						script.map(File::getName).orElse("the selected script.")
+					);
+					ConfigTab.putStringToOutput(trace, false);
+				}
+			}
+
+			if (interp != null) {
+				isRunnerAlive = true;
+				isRunnerStarting = false;
+
+				final String msg =
+					"Sucessfully loaded " +
+					script.map(File::getName).orElse("the selected script");
+
+				if (isPrimary()) {
+					cacheCallables(interp, loadedGeneration);
+					ConfigTab.clearOutputs(msg);
+					ScalpelLogger.info(msg);
+				} else {
+					ScalpelLogger.debug(msg + " (worker #" + id + ")");
+				}
+
+				try {
+					innerTaskLoop(interp);
+				} catch (Throwable e) {
+					// The task loop has crashed, log the stack trace.
+					ScalpelLogger.logStackTrace(e);
+				}
+				// Log the error.
+				ScalpelLogger.trace("Task loop has crashed");
+			} else {
+				isRunnerAlive = false;
+				isRunnerStarting = false;
+				// The script couldn't be loaded, wait for it to change
+				rejectAllTasks();
+				while (!isRetired && pollChanges() == loadedGeneration) {
+					rejectAllTasks();
+					IO.sleep(100);
+				}
+			}
+
+			isRunnerAlive = false;
+			isRunnerStarting = true;
+
+			if (interp != null) {
+				safeCloseInterpreter(interp);
+			}
+
+			if (isRetired) {
+				ScalpelLogger.debug(
+					"Worker #" + id + " was removed from the pool."
+				);
+				workers.remove(this);
+				redispatchAllTasks();
+				isRunnerStarting = false;
+				return;
+			}
+
+			// Relaunch the task thread
+			launch();
+		}
+
+		/**
+		 * Launches the task runner thread.
+		 */
+		private void launch() {
+			// Instantiate the task runner thread.
+			runner = new Thread(this::taskLoop, "ScalpelRunnerLoop-" + id);
+
+			// Start the task runner thread.
+			runner.start();
+
+			// Force editor tabs recreation
+			// WARN: .resetEditors() depends on the runner loop, do not call it inside of it
+			if (isPrimary()) {
+				editorProvider.ifPresent(ScalpelEditorProvider::resetEditors);
+			}
 		}
 	}
 
@@ -224,6 +743,45 @@ public class ScalpelExecutor {
 	 */
 	private final MontoyaApi API;
 
+	/**
+	 * The user hooks processing several intercepter calls at once, by framework callback name.
+	 * The corresponding framework callback is the hook name prefixed by an underscore.
+	 */
+	private static final Map<String, String> BATCH_CB_NAMES = Map.of(
+		Constants.FRAMEWORK_REQ_CB_NAME,
+		Constants.REQ_BATCH_CB_NAME,
+		Constants.FRAMEWORK_RES_CB_NAME,
+		Constants.RES_BATCH_CB_NAME
+	);
+
+	/**
+	 * The framework callbacks that only observe messages, their tasks are queued separately
+	 * and processed when no other task is pending, so they never delay Burp's traffic.
+	 */
+	private static final Set<String> OBSERVER_CB_NAMES = Set.of(
+		Constants.FRAMEWORK_ON_RES_CB_NAME
+	);
+
+	/**
+	 * The cancellation check of the tasks queued by the current thread.
+	 * @see #callCancellable(BooleanSupplier, Supplier)
+	 */
+	private final ThreadLocal<BooleanSupplier> cancellation = ThreadLocal.withInitial(() ->
+		() -> false
+	);
+
+	/**
+	 * An already finished task, queued to wake the runners up.
+	 */
+	private final Task wakeUpTask = new Task("wake_up", new Object[0], Map.of());
+
+	/**
+	 * Watches the script and framework files, so they aren't stat-ed on every task.
+	 */
+	private final FileWatcher fileWatcher = new FileWatcher(
+		this::notifyEventLoop
+	);
+
 	/**
 	 * The path of the Scalpel script that will be passed to the framework.
 	 */
@@ -235,14 +793,52 @@ public class ScalpelExecutor {
 	private Optional<File> framework = Optional.empty();
 
 	/**
-	 * The task runner thread.
+	 * The pool of task runners, each one owning a Python interpreter.
+	 */
+	private final List<Worker> workers = new CopyOnWriteArrayList<>();
+
+	/**
+	 * Incremented every time the watched files change, workers restart their interpreter when it differs from theirs.
 	 */
-	private Thread runner;
+	private volatile long generation = 0;
 
 	/**
-	 * The Python task queue.
+	 * Incremented when the framework or the config change, workers reinitialize their interpreter when it differs from theirs.
+	 * Changes to the user script alone only bump {@link #generation}, the script is then hot-swapped in the running interpreters.
 	 */
-	private final Queue<Task> tasks = new LinkedBlockingQueue<>();
+	private volatile long restartGeneration = 0;
+
+	/**
+	 * The callables and match specification declared by the loaded script, along with the reload generation they were listed for.
+	 */
+	private volatile Optional<LoadedScript> loadedScript = Optional.empty();
+
+	/**
+	 * Number of observe-only hook calls queued or being processed.
+	 */
+	private final AtomicInteger pendingObserverTasks = new AtomicInteger(0);
+
+	/**
+	 * Number of observe-only hook calls dropped because their queue was full.
+	 */
+	private final AtomicLong droppedObserverTasks = new AtomicLong(0);
+
+	/**
+	 * Latency histograms of the hook calls, shared with the interpreters.
+	 */
+	private final HookStats hookStats = new HookStats();
+
+	/**
+	 * The req_edit_in / res_edit_in results, so Burp's repeated calls for the same message run the hook once.
+	 */
+	private final EditorHookCache editorHookCache = new EditorHookCache(
+		Constants.EDITOR_HOOK_CACHE_MAX_BYTES
+	);
+
+	/**
+	 * Lock guarding the change indicators, the reload generation and the pool size.
+	 */
+	private final Object reloadLock = new Object();
 
 	/**
 	 * The timestamp of the last recorded modification to the script file.
@@ -256,13 +852,6 @@ public class ScalpelExecutor {
 
 	private long lastConfigModificationTimestamp = -1;
 
-	/**
-	 * Flag indicating whether the task runner loop is running.
-	 */
-	private Boolean isRunnerAlive = false;
-
-	private Boolean isRunnerStarting = true;
-
 	private final Config config;
 
 	private Optional<ScalpelEditorProvider> editorProvider = Optional.empty();
@@ -274,6 +863,11 @@ public class ScalpelExecutor {
 		public void write(int b) {
 			ConfigTab.pushCharToOutput(b, true);
 		}
+
+		@Override
+		public void write(byte[] b, int off, int len) {
+			ConfigTab.pushBytesToOutput(b, off, len, true);
+		}
 	};
 
 	private final OutputStream pythonStderr = new OutputStream() {
@@ -281,6 +875,11 @@ public class ScalpelExecutor {
 		public void write(int b) {
 			ConfigTab.pushCharToOutput(b, false);
 		}
+
+		@Override
+		public void write(byte[] b, int off, int len) {
+			ConfigTab.pushBytesToOutput(b, off, len, false);
+		}
 	};
 
 	/**
@@ -318,21 +917,141 @@ public class ScalpelExecutor {
 		this.script.ifPresent(s ->
 				this.lastScriptModificationTimestamp = s.lastModified()
 			);
+		watchFiles();
+
+		this.wakeUpTask.reject();
+
+		// Launch task threads.
+		this.script.ifPresent(s -> this.resizePool());
+	}
+
+	public boolean isEnabled() {
+		return this.isEnabled;
+	}
+
+	public boolean isRunning() {
+		return workers.stream().anyMatch(w -> w.isRunnerAlive);
+	}
 
-		// Launch task thread.
-		this.script.ifPresent(s -> this.runner = this.launchTaskRunner());
+	public boolean isStarting() {
+		return workers.stream().anyMatch(w -> w.isRunnerStarting);
+	}
+
+	/**
+	 * Get the number of Python interpreters hooks are dispatched to.
+	 *
+	 * @return the current pool size.
+	 */
+	public int getWorkerCount() {
+		return (int) workers.stream().filter(w -> !w.isRetired).count();
+	}
+
+	/**
+	 * Get the number of tasks queued or being processed by the pool.
+	 *
+	 * @return the total load of the workers.
+	 */
+	public int getQueueDepth() {
+		return workers.stream().mapToInt(Worker::load).sum();
+	}
+
+	/**
+	 * Makes the hook calls of the current thread cancellable.
+	 *
+	 * <p>The tasks queued by the call are dropped without reaching Python
+	 * when the check returns true by the time a runner polls them.
+	 *
+	 * @param <T> the type of the result.
+	 * @param isCancelled whether the result is no longer needed.
+	 * @param call the hook calls.
+	 * @return the result of the call.
+	 */
+	public <T> T callCancellable(BooleanSupplier isCancelled, Supplier<T> call) {
+		final BooleanSupplier previous = cancellation.get();
+		cancellation.set(isCancelled);
+		try {
+			return call.get();
+		} finally {
+			cancellation.set(previous);
+		}
+	}
+
+	/**
+	 * Get the latency histograms of the hook calls.
+	 *
+	 * @return the hook statistics.
+	 */
+	public HookStats getHookStats() {
+		return hookStats;
 	}
 
-	public boolean isEnabled() {
-		return this.isEnabled;
+	/**
+	 * Selects the available worker with the least queued tasks.
+	 *
+	 * @return the selected worker, or empty when none is running.
+	 */
+	private Optional<Worker> selectWorker() {
+		return workers
+			.stream()
+			.filter(Worker::acceptsTasks)
+			.min(Comparator.comparingInt(Worker::load));
 	}
 
-	public boolean isRunning() {
-		return this.isRunnerAlive;
+	/**
+	 * Adds or retires workers to match the configured pool size.
+	 */
+	private void resizePool() {
+		synchronized (reloadLock) {
+			final int wanted = Math.max(1, config.getWorkerCount());
+			final List<Worker> active = workers
+				.stream()
+				.filter(w -> !w.isRetired)
+				.toList();
+
+			// Retire the most recent workers first, the primary worker is always kept.
+			for (int i = active.size() - 1; i >= wanted; i--) {
+				final Worker worker = active.get(i);
+				worker.isRetired = true;
+				worker.notifyLoop();
+			}
+
+			for (int i = active.size(); i < wanted; i++) {
+				final Worker worker = new Worker(i);
+				workers.add(worker);
+				worker.launch();
+			}
+		}
 	}
 
-	public boolean isStarting() {
-		return this.isRunnerStarting;
+	/**
+	 * Checks whether the watched files changed and bumps the reload generation if so.
+	 *
+	 * @return the current reload generation.
+	 */
+	private long pollChanges() {
+		synchronized (reloadLock) {
+			// The config is tracked in memory, the files are only checked when the watcher reported an event for them,
+			// or on every poll tick when they cannot be watched.
+			if (
+				hasConfigChanged() ||
+				(fileWatcher.consumeChanges() && mustReload())
+			) {
+				// The framework, the venv and the other settings are only loaded at startup.
+				final boolean mustRestart =
+					hasFrameworkChanged() || hasConfigChanged();
+
+				resetChangeIndicators();
+				generation++;
+
+				// The cached editor contents were computed by the previous script.
+				editorHookCache.clear();
+				if (mustRestart) {
+					restartGeneration++;
+				}
+				resizePool();
+			}
+			return generation;
+		}
 	}
 
 	public void enable() {
@@ -357,22 +1076,43 @@ public class ScalpelExecutor {
 		Object[] args,
 		Map<String, Object> kwargs,
 		boolean rejectOnReload
+	) {
+		return addTask(name, args, kwargs, rejectOnReload, () -> {});
+	}
+
+	/**
+	 * Adds a new task to the queue of tasks to be executed by the script.
+	 *
+	 * @param name the name of the python function to be called.
+	 * @param args the arguments to pass to the python function.
+	 * @param kwargs the keyword arguments to pass to the python function.
+	 * @param rejectOnReload reject the task when the runner is reloading.
+	 * @param onFinished called once the task is resolved or rejected.
+	 * @return a Task object representing the added task.
+	 */
+	private Task addTask(
+		String name,
+		Object[] args,
+		Map<String, Object> kwargs,
+		boolean rejectOnReload,
+		Runnable onFinished
 	) {
 		// Create task object.
 		final Task task = new Task(name, args, kwargs);
+		task.onFinished = onFinished;
 
-		synchronized (tasks) {
-			// Ensure the runner is alive.
-			if (isEnabled && (isRunnerAlive || isRunnerStarting)) {
-				// Queue the task.
-				tasks.add(task);
+		// Queue the task to the least busy running worker.
+		final boolean queued =
+			isEnabled &&
+			selectWorker().map(w -> w.submit(task)).orElse(false);
 
-				// Release the runner's lock.
-				tasks.notifyAll();
-			} else if (rejectOnReload) {
-				// The runner is dead, reject this task to avoid blocking Burp when awaiting.
-				task.reject();
-			}
+		if (!queued && rejectOnReload) {
+			// The runners are dead, reject this task to avoid blocking Burp when awaiting.
+			task.reject();
+		}
+
+		if (queued) {
+			hookStats.recordQueueDepth(getQueueDepth());
 		}
 
 		// Return the queued or rejected task.
@@ -420,12 +1160,14 @@ public class ScalpelExecutor {
 				final Object rawResult = result.getValue();
 				final T castResult = (T) rawResult;
 
-				ScalpelLogger.trace(
-					"Successfully cast " +
-					UnObfuscator.getClassName(rawResult) +
-					" to " +
-					UnObfuscator.getClassName(castResult)
-				);
+				if (ScalpelLogger.isTraceEnabled()) {
+					ScalpelLogger.trace(
+						"Successfully cast " +
+						UnObfuscator.getClassName(rawResult) +
+						" to " +
+						UnObfuscator.getClassName(castResult)
+					);
+				}
 				// Ensure the result can be cast to the expected type.
 				return Result.success(castResult);
 			} catch (ClassCastException e) {
@@ -480,6 +1222,20 @@ public class ScalpelExecutor {
 
 		// Update the last modification date record.
 		lastConfigModificationTimestamp = config.getLastModified();
+
+		// The selected script may have changed.
+		watchFiles();
+	}
+
+	/**
+	 * Watches the current framework and script files.
+	 */
+	private void watchFiles() {
+		fileWatcher.watch(
+			Stream.of(framework, script)
+				.flatMap(Optional::stream)
+				.toList()
+		);
 	}
 
 	/**
@@ -510,27 +1266,18 @@ public class ScalpelExecutor {
 		provider.resetEditorsAsync();
 	}
 
-	public synchronized void notifyEventLoop() {
-		synchronized (tasks) {
-			tasks.notifyAll();
-		}
+	public void notifyEventLoop() {
+		workers.forEach(Worker::notifyLoop);
 	}
 
-	private synchronized void rejectAllTasks() {
-		synchronized (tasks) {
-			while (true) {
-				// Use polling and not foreach + clear to avoid race conditions (tasks being cleared but not rejected)
-				final Task task = tasks.poll();
-				if (task == null) {
-					break;
-				}
-				task.reject();
-			}
+	private void processTask(final SubInterpreter interp, final Task task) {
+		if (ScalpelLogger.isTraceEnabled()) {
+			ScalpelLogger.trace("Processing task: " + task.name);
 		}
-	}
 
-	private void processTask(final SubInterpreter interp, final Task task) {
-		ScalpelLogger.trace("Processing task: " + task.name);
+		final String hook = getHookName(task.name);
+		final long start = System.nanoTime();
+		hookStats.record(hook, "queue", start - task.createdAt);
 		try {
 			// Invoke Python function and get the returned value.
 			final Object pythonResult = interp.invoke(
@@ -539,7 +1286,9 @@ public class ScalpelExecutor {
 				task.kwargs
 			);
 
-			ScalpelLogger.trace("Executed task: " + task.name);
+			if (ScalpelLogger.isTraceEnabled()) {
+				ScalpelLogger.trace("Executed task: " + task.name);
+			}
 
 			if (pythonResult != null) {
 				task.resolve(pythonResult);
@@ -553,59 +1302,85 @@ public class ScalpelExecutor {
 				ScalpelLogger.error("Error in task loop:");
 				ScalpelLogger.logStackTrace(e);
 			}
+		} finally {
+			hookStats.record(hook, "python", System.nanoTime() - start);
 		}
 
-		ScalpelLogger.trace("Processed task");
+		if (ScalpelLogger.isTraceEnabled()) {
+			ScalpelLogger.trace("Processed task");
 
-		// Log the result value.
-		ScalpelLogger.trace(task.result.toString());
+			// Log the result value.
+			ScalpelLogger.trace(task.result.getNow(Result.empty()).toString());
+		}
 	}
 
-	private void _innerTaskLoop(final SubInterpreter interp)
-		throws InterruptedException {
-		while (true) {
-			// Relaunch interpreter when files have changed (hot reload).
-			if (mustReload()) {
-				ScalpelLogger.info(
-					"Config or Python files have changed, reloading interpreter..."
-				);
-				break;
-			}
-
-			synchronized (tasks) {
-				ScalpelLogger.trace("Runner waiting for notifications.");
-
-				if (!isEnabled) {
-					tasks.wait(1000);
-					continue;
-				}
+	/**
+	 * Processes several intercepter tasks with a single Python call.
+	 *
+	 * <p>The framework callback receives the messages and services lists,
+	 * and returns the results and error messages lists, in the same order.
+	 *
+	 * @param interp the interpreter to run the callback in.
+	 * @param batchName the name of the framework batch callback.
+	 * @param batch the tasks to process.
+	 */
+	@SuppressWarnings({ "unchecked" })
+	private void processBatch(
+		final SubInterpreter interp,
+		final String batchName,
+		final List<Task> batch
+	) {
+		if (ScalpelLogger.isTraceEnabled()) {
+			ScalpelLogger.trace(
+				"Processing " + batch.size() + " tasks with " + batchName
+			);
+		}
 
-				// Extract the oldest pending task from the queue.
-				final Task task = tasks.poll();
+		final String hook = getHookName(batchName);
+		final long start = System.nanoTime();
 
-				// Ensure a task was polled or poll again.
-				if (task == null) {
-					// Release the lock and wait for new tasks.
-					tasks.wait(1000);
-					continue;
-				}
+		final List<Object> messages = new ArrayList<>(batch.size());
+		final List<Object> services = new ArrayList<>(batch.size());
+		for (final Task task : batch) {
+			hookStats.record(
+				getHookName(task.name),
+				"queue",
+				start - task.createdAt
+			);
+			messages.add(task.args[0]);
+			services.add(task.args[1]);
+		}
 
-				if (task.isFinished()) {
-					// if for some reason a task is already finished, just remove it from the list.
-					continue;
+		try {
+			final List<List<Object>> output = (List<List<Object>>) interp.invoke(
+				batchName,
+				messages,
+				services
+			);
+			final List<Object> results = output.get(0);
+			final List<Object> errors = output.get(1);
+
+			for (int i = 0; i < batch.size(); i++) {
+				final Task task = batch.get(i);
+				if (errors.get(i) != null) {
+					task.reject(new RuntimeException((String) errors.get(i)));
+				} else if (results.get(i) != null) {
+					task.resolve(results.get(i));
+				} else {
+					task.reject();
 				}
+			}
+		} catch (Throwable e) {
+			batch.forEach(task -> task.reject(e));
 
-				processTask(interp, task);
-
-				synchronized (task) {
-					// Wake threads awaiting the task.
-					task.notifyAll();
-					ScalpelLogger.trace("Notified " + task.name);
-				}
+			ScalpelLogger.error("Error in task loop:");
+			ScalpelLogger.logStackTrace(e);
+		} finally {
+			hookStats.record(hook, "python", System.nanoTime() - start);
+		}
 
-				// Sleep the thread while there isn't any new tasks
-				tasks.wait(1000);
-			}
+		if (ScalpelLogger.isTraceEnabled()) {
+			ScalpelLogger.trace("Processed " + batch.size() + " tasks");
 		}
 	}
 
@@ -638,105 +1413,6 @@ public class ScalpelExecutor {
 		interp.exec(shutdownCode);
 	}
 
-	// WARN: Declaring this method as synchronized cause deadlocks.
-	private void taskLoop() {
-		ScalpelLogger.debug("Starting task loop.");
-
-		isRunnerStarting = true;
-
-		SubInterpreter interp;
-		try {
-			interp = initInterpreter();
-		} catch (Throwable e) {
-			interp = null;
-			ConfigTab.clearOutputs(
-				"Failed to load " +
-				script.map(File::getName).orElse("the selected script.")
-			);
-
-			// Log the error.
-			String trace = ScalpelLogger.exceptionToErrorMsg(
-				e,
-				"Failed to initialize interpreter"
-			);
-
-			// Check if Python itself is broken
-			if (trace.contains("No module named 'binascii'")) {
-				// This may happen if you messed with pyenv and installed Scalpel in a different Python version that the one in use at this time.
-				trace +=
-					"\n/!\\ SOMETHING IS WRONG WITH YOUR PYTHON SETUP /!\\\n" +
-					"You may have mixed different Python installations when installling and using Scalpel" +
-					", you may try re-installing Scalpel in your current Python environment";
-			}
-
-			ScalpelLogger.error(trace);
-			ConfigTab.putStringToOutput(trace, false);
-		}
-
-		if (interp != null) {
-			isRunnerAlive = true;
-			isRunnerStarting = false;
-
-			final String msg =
-				"Sucessfully loaded " +
-				script.map(File::getName).orElse("the selected script");
-
-			ConfigTab.clearOutputs(msg);
-			ScalpelLogger.info(msg);
-
-			try {
-				_innerTaskLoop(interp);
-			} catch (Throwable e) {
-				// The task loop has crashed, log the stack trace.
-				ScalpelLogger.logStackTrace(e);
-			}
-			// Log the error.
-			ScalpelLogger.trace("Task loop has crashed");
-		} else {
-			isRunnerAlive = false;
-			isRunnerStarting = false;
-			// The script couldn't be loaded, wait for it to change
-			this.resetChangeIndicators();
-			rejectAllTasks();
-			while (!mustReload()) {
-				rejectAllTasks();
-				IO.sleep(100);
-			}
-		}
-
-		isRunnerAlive = false;
-		isRunnerStarting = true;
-
-		this.resetChangeIndicators();
-
-		if (interp != null) {
-			safeCloseInterpreter(interp);
-		}
-
-		// Relaunch the task thread
-		this.runner = launchTaskRunner();
-	}
-
-	/**
-	 * Launches the task runner thread.
-	 *
-	 * @return the launched thread.
-	 */
-	private Thread launchTaskRunner() {
-		// Instantiate the task runner thread.
-		final Thread thread = new Thread(this::taskLoop, "ScalpelRunnerLoop");
-
-		// Start the task runner thread.
-		thread.start();
-
-		// Force editor tabs recreation
-		// WARN: .resetEditors() depends on the runner loop, do not call it inside of it
-		this.editorProvider.ifPresent(ScalpelEditorProvider::resetEditors);
-
-		// Return the running thread.
-		return thread;
-	}
-
 	private Optional<Path> getDefaultIncludePath() {
 		final Path defaultVenv = Workspace
 			.getDefaultWorkspace()
@@ -807,6 +1483,9 @@ public class ScalpelExecutor {
 
 					burpEnv.put("framework", file.getAbsolutePath());
 
+					// Let the framework record the Python side phases of the hook calls.
+					burpEnv.put("hook_stats", hookStats);
+
 					// Pass the selected venv path so it can be activated by the framework.
 					burpEnv.put(
 						"venv",
@@ -832,16 +1511,9 @@ public class ScalpelExecutor {
 					}
 
 					// Don't run the event loop when no hooks are implemented
-					final Boolean hasValidHooks = res
-						.stream()
-						.map(m -> (String) m.get("name"))
-						.anyMatch(c ->
-							Constants.VALID_HOOK_PREFIXES
-								.stream()
-								.anyMatch(c::startsWith)
-						);
-
-					if (!hasValidHooks) {
+					if (
+						!hasValidHooks(res.stream().map(m -> (String) m.get("name")))
+					) {
 						throw new RuntimeException(
 							"No hooks were found.\n" +
 							"In your Python script, you should implement at least one of the following functions:\n" +
@@ -941,6 +1613,30 @@ public class ScalpelExecutor {
 		throw new RuntimeException("Passed wrong type to geMessageCbName");
 	}
 
+	/**
+	 * Whether the script declares at least one hook, running the event loop is useless otherwise.
+	 *
+	 * @param callableNames the names of the callables declared by the script.
+	 * @return true if one of them is a hook.
+	 */
+	private static boolean hasValidHooks(Stream<String> callableNames) {
+		return callableNames.anyMatch(c ->
+			Constants.VALID_HOOK_PREFIXES.stream().anyMatch(c::startsWith)
+		);
+	}
+
+	/**
+	 * Get the hook name reported in the statistics from a framework callback name.
+	 *
+	 * @param callbackName the framework callback name (e.g. "_request")
+	 * @return the hook name (e.g. "request")
+	 */
+	private static String getHookName(String callbackName) {
+		return callbackName.startsWith("_")
+			? callbackName.substring(1)
+			: callbackName;
+	}
+
 	/**
 	 * Calls the corresponding Python callback for the given message intercepted by Proxy.
 	 *
@@ -953,15 +1649,130 @@ public class ScalpelExecutor {
 		T msg,
 		HttpService service
 	) {
+		final String callbackName = getMessageCbName(msg);
+
+		// Don't wait behind the queued tasks when the script doesn't hook this message.
+		if (!hasIntercepterHook(callbackName)) {
+			return Result.empty();
+		}
+
 		// Call the corresponding Python callback and add a debug HTTP header.
 		return safeJepInvoke(
-			getMessageCbName(msg),
+			callbackName,
 			new Object[] { msg, service },
 			Map.of(),
 			(Class<T>) msg.getClass()
 		);
 	}
 
+	/**
+	 * Whether the loaded script declares the user hook called by the given intercepter callback,
+	 * or its batch variant.
+	 * The hooks are unknown while the script is loading, they are then assumed to be declared.
+	 *
+	 * @param callbackName the framework callback name (e.g. "_response")
+	 * @return false if the callback would leave the message unmodified.
+	 */
+	private boolean hasIntercepterHook(String callbackName) {
+		return getLoadedScript()
+			.map(s ->
+				s.has(getHookName(callbackName)) ||
+				s.has(BATCH_CB_NAMES.get(callbackName))
+			)
+			.orElse(true);
+	}
+
+	/**
+	 * Whether the loaded script declares the given callable.
+	 * Only the cached callables are looked up, so this never waits for the interpreter.
+	 *
+	 * @param name the name of the Python callable.
+	 * @return true if the currently loaded script declares it.
+	 */
+	public boolean hasLoadedCallable(String name) {
+		return getLoadedScript().map(c -> c.has(name)).orElse(false);
+	}
+
+	/**
+	 * Whether a message is accepted by the MATCH specification of the loaded script.
+	 * Messages are always accepted when no specification is declared or while the script is (re)loading,
+	 * the match() hook still applies Python side.
+	 *
+	 * @param service the network service of the request.
+	 * @param request the request, or the initiating request of a response.
+	 * @param message the hooked message (the request or its response), its Content-Type is matched.
+	 * @return false if the message must not be passed to the script hooks.
+	 */
+	public boolean isInMatchSpec(
+		HttpService service,
+		HttpRequest request,
+		HttpMessage message
+	) {
+		return getLoadedScript()
+			.flatMap(LoadedScript::matchSpec)
+			.map(spec -> spec.matches(service, request, message))
+			.orElse(true);
+	}
+
+	private Optional<LoadedScript> getLoadedScript() {
+		// The cache is only valid for the currently loaded script.
+		final long currentGeneration = generation;
+		return loadedScript.filter(c -> c.generation() == currentGeneration);
+	}
+
+	/**
+	 * Queues the observe-only Python callback for the given response without waiting for it.
+	 *
+	 * <p>At most {@link Constants#OBSERVER_QUEUE_LIMIT} calls can be pending at once,
+	 * calls exceeding it are dropped or awaited depending on the configured overflow policy.
+	 *
+	 * @param response the response to pass to the callback.
+	 * @param service the network service of the initiating request.
+	 */
+	public void callObserverHook(HttpResponse response, HttpService service) {
+		if (!hasLoadedCallable(Constants.ON_RES_CB_NAME)) {
+			return;
+		}
+
+		final Object[] args = new Object[] { response, service };
+
+		if (
+			pendingObserverTasks.incrementAndGet() > Constants.OBSERVER_QUEUE_LIMIT
+		) {
+			pendingObserverTasks.decrementAndGet();
+
+			if (
+				Constants.OBSERVER_OVERFLOW_BLOCK.equals(
+					config.getObserverOverflowPolicy()
+				)
+			) {
+				// Backpressure: slow the traffic down to the hook's pace.
+				addTask(Constants.FRAMEWORK_ON_RES_CB_NAME, args, Map.of())
+					.await();
+				return;
+			}
+
+			final long dropped = droppedObserverTasks.incrementAndGet();
+			if (dropped % Constants.OBSERVER_QUEUE_LIMIT == 1) {
+				ScalpelLogger.warn(
+					Constants.ON_RES_CB_NAME +
+					"() queue is full, " +
+					dropped +
+					" response(s) were not observed so far."
+				);
+			}
+			return;
+		}
+
+		addTask(
+			Constants.FRAMEWORK_ON_RES_CB_NAME,
+			args,
+			Map.of(),
+			true,
+			pendingObserverTasks::decrementAndGet
+		);
+	}
+
 	/**
 	 * Returns the name of the corresponding Python callback for the given tab.
 	 *
@@ -998,7 +1809,7 @@ public class ScalpelExecutor {
 	 * @param expectedClass the expected class of the returned value.
 	 * @return the result of the function call.
 	 */
-	public synchronized <T extends Object> Result<T, Throwable> safeJepInvoke(
+	public <T extends Object> Result<T, Throwable> safeJepInvoke(
 		String name,
 		Object[] args,
 		Map<String, Object> kwargs,
@@ -1152,7 +1963,7 @@ public class ScalpelExecutor {
 			new Object[] {
 				msg,
 				service,
-				PythonUtils.toPythonBytes(byteArray.getBytes()),
+				PythonUtils.toDirectBuffer(byteArray),
 			},
 			msg instanceof HttpRequest,
 			isInbound,
@@ -1175,14 +1986,20 @@ public class ScalpelExecutor {
 		HttpService service,
 		String tabName
 	) {
-		return callEditorHook(
-			new Object[] { req, service },
-			req instanceof HttpRequest,
-			true,
+		return cachedEditorHookIn(
 			tabName,
-			byte[].class
-		)
-			.map(ByteArray::byteArray);
+			EditorType.REQUEST,
+			EditorHookCache.digest(service, req),
+			() ->
+				callEditorHook(
+					new Object[] { req, service },
+					req instanceof HttpRequest,
+					true,
+					tabName,
+					byte[].class
+				)
+					.map(ByteArray::byteArray)
+		);
 	}
 
 	/**
@@ -1199,14 +2016,62 @@ public class ScalpelExecutor {
 		HttpService service,
 		String tabName
 	) {
-		return callEditorHook(
-			new Object[] { res, req, service },
-			false,
-			true,
+		return cachedEditorHookIn(
 			tabName,
-			byte[].class
-		)
-			.map(ByteArray::byteArray);
+			EditorType.RESPONSE,
+			EditorHookCache.digest(service, res, req),
+			() ->
+				callEditorHook(
+					new Object[] { res, req, service },
+					false,
+					true,
+					tabName,
+					byte[].class
+				)
+					.map(ByteArray::byteArray)
+		);
+	}
+
+	/**
+	 * Calls an edit_in hook unless its result for the same messages and script version is cached.
+	 *
+	 * @param tabName the name of the tab.
+	 * @param type whether req_edit_in or res_edit_in is called.
+	 * @param digest the digest of the hook arguments.
+	 * @param call calls the hook.
+	 * @return the cached or computed result.
+	 */
+	private Result<ByteArray, Throwable> cachedEditorHookIn(
+		String tabName,
+		EditorType type,
+		String digest,
+		Supplier<Result<ByteArray, Throwable>> call
+	) {
+		final long scriptVersion = generation;
+		final EditorHookCache.Key key = new EditorHookCache.Key(
+			tabName,
+			type,
+			scriptVersion,
+			digest
+		);
+
+		final Result<ByteArray, Throwable> cached = editorHookCache.get(key);
+		if (cached != null) {
+			return cached;
+		}
+
+		final Result<ByteArray, Throwable> result = call.get();
+
+		// Rejected tasks are empty too, only cache results computed by the script the key refers to.
+		if (
+			isEnabled &&
+			isRunning() &&
+			generation == scriptVersion &&
+			!cancellation.get().getAsBoolean()
+		) {
+			editorHookCache.put(key, result);
+		}
+		return result;
 	}
 
 	/**
@@ -1227,7 +2092,7 @@ public class ScalpelExecutor {
 			new Object[] {
 				req,
 				service,
-				PythonUtils.toPythonBytes(byteArray.getBytes()),
+				PythonUtils.toDirectBuffer(byteArray),
 			},
 			true,
 			false,
@@ -1258,7 +2123,7 @@ public class ScalpelExecutor {
 				res,
 				req,
 				service,
-				PythonUtils.toPythonBytes(byteArray.getBytes()),
+				PythonUtils.toDirectBuffer(byteArray),
 			},
 			false,
 			false,
@@ -1272,23 +2137,77 @@ public class ScalpelExecutor {
 		HashMap<String, String> annotations
 	) {}
 
+	/**
+	 * The callables and compiled MATCH specification of a script for a given reload generation.
+	 */
+	private record LoadedScript(
+		long generation,
+		List<CallableData> callables,
+		Optional<MatchSpec> matchSpec
+	) {
+		boolean has(String name) {
+			return callables.stream().anyMatch(c -> c.name().equals(name));
+		}
+	}
+
 	@SuppressWarnings({ "unchecked" })
-	public List<CallableData> getCallables() throws RuntimeException {
-		// TODO: Memoize this
-		// Jep doesn't offer any way to list functions, so we have to implement it Python side.
+	private static List<CallableData> toCallableData(Object pythonCallables) {
 		// Python returns ~ [{"name": <function name>, "annotations": <func.__annotations__>},...]
-		return this.safeJepInvoke(Constants.GET_CB_NAME, List.class)
-			.map(l -> (List<HashMap<String, Object>>) l)
-			.map(List::stream)
-			.map(s ->
-				s.map(c ->
-					new CallableData(
-						(String) c.get("name"),
-						(HashMap<String, String>) c.get("annotations")
-					)
+		return ((List<HashMap<String, Object>>) pythonCallables).stream()
+			.map(c ->
+				new CallableData(
+					(String) c.get("name"),
+					(HashMap<String, String>) c.get("annotations")
 				)
 			)
-			.map(Stream::toList)
+			.toList();
+	}
+
+	/**
+	 * Lists the script callables and compiles its MATCH specification once per reload,
+	 * so editor tabs can be created and out-of-scope traffic skipped without going through the task queue.
+	 *
+	 * @param interp the freshly loaded interpreter. (must be called from its runner thread)
+	 * @param loadedGeneration the reload generation the interpreter was loaded for.
+	 */
+	@SuppressWarnings({ "unchecked" })
+	private void cacheCallables(SubInterpreter interp, long loadedGeneration) {
+		try {
+			final List<CallableData> callables = toCallableData(
+				interp.invoke(Constants.GET_CB_NAME)
+			);
+
+			// Python returns ~ {"hosts": <regex>, ...} or None when MATCH isn't declared.
+			final Optional<MatchSpec> matchSpec = Optional
+				.ofNullable(
+					(Map<String, String>) interp.invoke(
+						Constants.GET_MATCH_SPEC_CB_NAME
+					)
+				)
+				.map(MatchSpec::new);
+
+			loadedScript =
+				Optional.of(
+					new LoadedScript(loadedGeneration, callables, matchSpec)
+				);
+		} catch (Throwable e) {
+			ScalpelLogger.error("Failed to list the script callables:");
+			ScalpelLogger.logStackTrace(e);
+		}
+	}
+
+	public List<CallableData> getCallables() throws RuntimeException {
+		final Optional<List<CallableData>> cached = getLoadedScript()
+			.map(LoadedScript::callables);
+
+		if (cached.isPresent()) {
+			return cached.get();
+		}
+
+		// Jep doesn't offer any way to list functions, so we have to implement it Python side.
+		// The result isn't cached here, the loading worker may be caching a newer script concurrently.
+		return this.safeJepInvoke(Constants.GET_CB_NAME, List.class)
+			.map(ScalpelExecutor::toCallableData)
 			.getValue();
 	}
 }
@@ -53,6 +53,17 @@ public class ScalpelHttpRequestHandler implements HttpHandler {
 	public RequestToBeSentAction handleHttpRequestToBeSent(
 		HttpRequestToBeSent httpRequestToBeSent
 	) {
+		// Skip traffic excluded by the script MATCH specification without queuing it.
+		if (
+			!executor.isInMatchSpec(
+				httpRequestToBeSent.httpService(),
+				httpRequestToBeSent,
+				httpRequestToBeSent
+			)
+		) {
+			return RequestToBeSentAction.continueWith(httpRequestToBeSent);
+		}
+
 		// Call the request() Python callback
 		final Result<HttpRequest, Throwable> newReq = executor.callIntercepterHook(
 			httpRequestToBeSent,
@@ -102,7 +113,21 @@ public class ScalpelHttpRequestHandler implements HttpHandler {
 			.map(HttpRequest::httpService)
 			.orElse(null);
 
-		// Call the request() Python callback
+		// Skip traffic excluded by the script MATCH specification without queuing it.
+		if (
+			!executor.isInMatchSpec(
+				service,
+				httpResponseReceived.initiatingRequest(),
+				httpResponseReceived
+			)
+		) {
+			return ResponseReceivedAction.continueWith(httpResponseReceived);
+		}
+
+		// Queue the observe-only on_response() Python callback, Burp doesn't wait for it.
+		executor.callObserverHook(httpResponseReceived, service);
+
+		// Call the response() Python callback
 		final Result<HttpResponseReceived, Throwable> newRes = executor.callIntercepterHook(
 			httpResponseReceived,
 			service
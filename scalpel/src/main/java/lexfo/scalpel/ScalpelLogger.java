@@ -59,7 +59,36 @@ public class ScalpelLogger {
 	/**
 	 * Configured log level
 	 */
-	private static Level loggerLevel = Level.INFO;
+	private static volatile Level loggerLevel = Level.INFO;
+
+	/**
+	 * Whether messages of the given level are logged.
+	 * Allows to skip building messages that would be discarded.
+	 *
+	 * @param level The log level.
+	 * @return true if the configured level allows it.
+	 */
+	public static boolean isEnabled(Level level) {
+		return loggerLevel.value() <= level.value();
+	}
+
+	/**
+	 * Whether TRACE messages are logged.
+	 *
+	 * @return true if the configured level is TRACE.
+	 */
+	public static boolean isTraceEnabled() {
+		return isEnabled(Level.TRACE);
+	}
+
+	/**
+	 * Get the configured level value, cached by the Python logger to filter messages before crossing the bridge.
+	 *
+	 * @return The {@link Level#value()} of the configured level.
+	 */
+	public static int getLogLevelValue() {
+		return loggerLevel.value();
+	}
 
 	/**
 	 * Logs the specified message to the Burp Suite output and standard output at the TRACE level.
@@ -0,0 +1,142 @@
+package lexfo.scalpel.components;
+
+import java.awt.*;
+import java.io.File;
+import java.io.IOException;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.util.List;
+import java.util.function.IntSupplier;
+import javax.swing.*;
+import javax.swing.table.DefaultTableModel;
+import lexfo.scalpel.HookStats;
+import lexfo.scalpel.ScalpelLogger;
+
+/**
+ * Displays the hook latency histograms, refreshed every second while visible.
+ */
+public class HookStatsPanel extends JPanel {
+
+	private static final String[] COLUMNS = {
+		"Hook",
+		"Phase",
+		"Count",
+		"Mean (ms)",
+		"p50 (ms)",
+		"p95 (ms)",
+		"p99 (ms)",
+		"Max (ms)",
+	};
+
+	private static final int REFRESH_DELAY_MS = 1000;
+
+	private final transient HookStats stats;
+	private final transient IntSupplier queueDepth;
+	private final DefaultTableModel model = new DefaultTableModel(COLUMNS, 0) {
+		@Override
+		public boolean isCellEditable(int row, int column) {
+			return false;
+		}
+	};
+	private final JLabel queueDepthLabel = new JLabel();
+
+	public HookStatsPanel(HookStats stats, IntSupplier queueDepth) {
+		this.stats = stats;
+		this.queueDepth = queueDepth;
+
+		setLayout(new BorderLayout());
+
+		final JTable table = new JTable(model);
+		table.setAutoCreateRowSorter(true);
+		add(new JScrollPane(table), BorderLayout.CENTER);
+
+		final JButton resetButton = new JButton("Reset");
+		resetButton.addActionListener(e -> {
+			stats.reset();
+			refresh();
+		});
+
+		final JButton exportButton = new JButton("Export JSON…");
+		exportButton.addActionListener(e -> exportJson());
+
+		final JPanel bottomPanel = new JPanel(new FlowLayout(FlowLayout.LEFT));
+		bottomPanel.add(queueDepthLabel);
+		bottomPanel.add(resetButton);
+		bottomPanel.add(exportButton);
+		add(bottomPanel, BorderLayout.SOUTH);
+
+		final Timer timer = new Timer(
+			REFRESH_DELAY_MS,
+			e -> {
+				if (isShowing()) {
+					refresh();
+				}
+			}
+		);
+		timer.start();
+		refresh();
+	}
+
+	private static String format(double ms) {
+		return String.format("%.3f", ms);
+	}
+
+	/**
+	 * Reload the table and queue depth from the collected statistics.
+	 */
+	public void refresh() {
+		final List<HookStats.Summary> summaries = stats.getSummaries();
+
+		model.setRowCount(0);
+		for (final HookStats.Summary summary : summaries) {
+			model.addRow(
+				new Object[] {
+					summary.hook(),
+					summary.phase(),
+					summary.count(),
+					format(summary.mean()),
+					format(summary.p50()),
+					format(summary.p95()),
+					format(summary.p99()),
+					format(summary.max()),
+				}
+			);
+		}
+
+		final HookStats.Histogram depth = stats.getQueueDepth();
+		queueDepthLabel.setText(
+			"Queue depth: " +
+			queueDepth.getAsInt() +
+			" (p95: " +
+			depth.getPercentile(95) +
+			", max: " +
+			depth.getMax() +
+			")"
+		);
+	}
+
+	private void exportJson() {
+		final JFileChooser fileChooser = new JFileChooser();
+		fileChooser.setSelectedFile(new File("scalpel-hook-stats.json"));
+
+		if (fileChooser.showSaveDialog(this) != JFileChooser.APPROVE_OPTION) {
+			return;
+		}
+
+		try {
+			Files.writeString(
+				fileChooser.getSelectedFile().toPath(),
+				stats.toJson(queueDepth.getAsInt()),
+				StandardCharsets.UTF_8
+			);
+		} catch (IOException e) {
+			ScalpelLogger.logStackTrace("Failed to export hook stats:", e);
+			JOptionPane.showMessageDialog(
+				this,
+				"Failed to export hook stats: \n" + e.getMessage(),
+				"Export failed",
+				JOptionPane.ERROR_MESSAGE
+			);
+		}
+	}
+}
@@ -12,6 +12,7 @@ import burp.api.montoya.ui.editor.extension.EditorCreationContext;
 import java.awt.*;
 import java.util.Optional;
 import java.util.UUID;
+import java.util.function.BooleanSupplier;
 import javax.swing.JPanel;
 import javax.swing.JTabbedPane;
 import javax.swing.JTextPane;
@@ -36,7 +37,12 @@ public abstract class AbstractEditor implements IMessageEditor {
 	/**
 		The HTTP request or response being edited.
 	*/
-	private HttpRequestResponse _requestResponse;
+	private volatile HttpRequestResponse _requestResponse;
+
+	/**
+		Held while checking whether a render is superseded and setting _requestResponse.
+	*/
+	private final Object requestResponseLock = new Object();
 
 	/**
 		The Montoya API object.
@@ -337,7 +343,27 @@ public abstract class AbstractEditor implements IMessageEditor {
 	public final boolean setRequestResponseInternal(
 		HttpRequestResponse requestResponse
 	) {
-		this._requestResponse = requestResponse;
+		return setRequestResponseInternal(requestResponse, () -> false);
+	}
+
+	/**
+		Sets the HttpRequestResponse to be edited, unless the render it belongs to was superseded.
+		The check and the assignment are atomic, so a stale render cannot overwrite a newer message.
+
+		@param requestResponse The HttpRequestResponse to be edited.
+		@param isSuperseded Whether a newer message was set since this render started.
+		@return True when the Python callback returned bytes, false otherwise or when superseded.
+	*/
+	public final boolean setRequestResponseInternal(
+		HttpRequestResponse requestResponse,
+		BooleanSupplier isSuperseded
+	) {
+		synchronized (requestResponseLock) {
+			if (isSuperseded.getAsBoolean()) {
+				return false;
+			}
+			this._requestResponse = requestResponse;
+		}
 		return updateContent(requestResponse);
 	}
 
@@ -419,14 +445,24 @@ public abstract class AbstractEditor implements IMessageEditor {
 		}
 
 		// Update the editor's content with the returned bytes.
+		// The hook may run off the EDT, skip the update when another message was set in the meantime.
 		result.ifSuccess(bytes ->
-			SwingUtilities.invokeLater(() -> setEditorContent(bytes))
+			SwingUtilities.invokeLater(() -> {
+				if (_requestResponse == reqRes) {
+					setEditorContent(bytes);
+				}
+			})
 		);
 		result.ifError(e -> inError = Optional.of(e));
-		result.ifError(e -> SwingUtilities.invokeLater(() -> setEditorError(e))
+		result.ifError(e ->
+			SwingUtilities.invokeLater(() -> {
+				if (_requestResponse == reqRes) {
+					setEditorError(e);
+				}
+			})
 		);
 
-		updateRootPanel();
+		SwingUtilities.invokeLater(this::updateRootPanel);
 
 		// Enable the tab when there is something to display (content or stack trace)
 		return !result.isEmpty();
@@ -7,6 +7,7 @@ import burp.api.montoya.http.message.HttpRequestResponse;
 import burp.api.montoya.ui.editor.extension.EditorCreationContext;
 import burp.api.montoya.ui.editor.extension.ExtensionProvidedHttpRequestEditor;
 import burp.api.montoya.ui.editor.extension.ExtensionProvidedHttpResponseEditor;
+import java.util.function.BooleanSupplier;
 import lexfo.scalpel.EditorType;
 import lexfo.scalpel.Result;
 
@@ -22,6 +23,11 @@ public interface IMessageEditor
 
 	boolean setRequestResponseInternal(HttpRequestResponse requestResponse);
 
+	boolean setRequestResponseInternal(
+		HttpRequestResponse requestResponse,
+		BooleanSupplier isSuperseded
+	);
+
 	HttpService getHttpService();
 
 	Result<ByteArray, Throwable> executeHook(HttpRequestResponse reqRes)
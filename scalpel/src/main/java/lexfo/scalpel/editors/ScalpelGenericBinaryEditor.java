@@ -6,8 +6,6 @@ import burp.api.montoya.ui.Selection;
 import burp.api.montoya.ui.editor.extension.EditorCreationContext;
 import burp.api.montoya.ui.editor.extension.EditorMode;
 import java.awt.*;
-import java.io.IOException;
-import java.util.Optional;
 import lexfo.scalpel.EditorType;
 import lexfo.scalpel.ScalpelEditorTabbedPane;
 import lexfo.scalpel.ScalpelExecutor;
@@ -30,7 +28,25 @@ public class ScalpelGenericBinaryEditor extends AbstractEditor {
 
 	protected final CodeArea editor;
 
-	private ByteArray oldContent = null;
+	/**
+		The content last set programmatically, returned as is until the user edits it.
+	*/
+	private volatile ByteArray oldContent = null;
+
+	/**
+		Whether the content was edited since it was last set, updated by the BinEd change listener.
+	*/
+	private volatile boolean modified = false;
+
+	/**
+		The number of edits, to tell whether the document changed while it was being copied.
+	*/
+	private long edits = 0;
+
+	/**
+		The edited content, copied from the BinEd document on demand and dropped on every edit.
+	*/
+	private ByteArray snapshot = null;
 
 	/**
 		Constructs a new Scalpel editor.
@@ -73,6 +89,9 @@ public class ScalpelGenericBinaryEditor extends AbstractEditor {
 				: EditMode.READ_ONLY;
 
 			editor.setEditMode(editMode);
+
+			// Track edits instead of comparing the whole document on every isModified() call.
+			editor.addDataChangedListener(this::onDataChanged);
 		} catch (Throwable e) {
 			// Log the error.
 			ScalpelLogger.error("Couldn't instantiate new editor:");
@@ -100,35 +119,67 @@ public class ScalpelGenericBinaryEditor extends AbstractEditor {
 	 * @return Bytes as Burp format
 	 */
 	private ByteArray binaryDataToByteArray(BinaryData binaryData) {
-		// Load the data
-		final ByteArrayEditableData buffer = new ByteArrayEditableData();
-		try {
-			buffer.loadFromStream(binaryData.getDataInputStream());
-		} catch (IOException ex) {
+		final long size = binaryData.getDataSize();
+		if (size > Integer.MAX_VALUE) {
 			throw new RuntimeException(
-				"Unexpected error happened while loading bytes from hex editor"
+				"Hex editor content is too large to be converted: " + size
 			);
 		}
 
-		final byte[] bytes = buffer.getData();
+		// Copy the data in one go
+		final byte[] bytes = new byte[(int) size];
+		binaryData.copyToArray(0, bytes, 0, bytes.length);
 
 		// Convert bytes to Burp ByteArray
 		return ByteArray.byteArray(bytes);
 	}
 
+	private synchronized void onDataChanged() {
+		edits++;
+		snapshot = null;
+		modified = true;
+	}
+
 	protected void setEditorContent(ByteArray bytes) {
 		// Convert from burp format to BinEd format
 		final BinaryData newContent = byteArrayToBinaryData(bytes);
 		editor.setContentData(newContent);
 
-		// Keep the old content for isModified()
-		oldContent = bytes;
+		// Keep the old content for getEditorContent() until the user edits it
+		// (setContentData() notifies the change listener, reset the flag afterwards)
+		synchronized (this) {
+			oldContent = bytes;
+			snapshot = null;
+			modified = false;
+		}
 	}
 
 	protected ByteArray getEditorContent() {
+		if (!modified) {
+			return oldContent;
+		}
+
+		final long editsBeforeCopy;
+		synchronized (this) {
+			if (snapshot != null) {
+				return snapshot;
+			}
+			editsBeforeCopy = edits;
+		}
+
 		try {
 			// Convert BinEd format to Burp format
-			return binaryDataToByteArray(editor.getContentData());
+			final ByteArray content = binaryDataToByteArray(
+				editor.getContentData()
+			);
+
+			// Keep it until the next edit, unless an edit happened during the copy
+			synchronized (this) {
+				if (edits == editsBeforeCopy) {
+					snapshot = content;
+				}
+			}
+			return content;
 		} catch (RuntimeException ex) {
 			// We have to catch and handle this here because otherwise Burp explodes
 			ScalpelLogger.error("Couldn't convert bytes:");
@@ -174,10 +225,7 @@ public class ScalpelGenericBinaryEditor extends AbstractEditor {
 	*/
 	@Override
 	public boolean isModified() {
-		// Check if current content is the same as the provided data.
-		return Optional
-			.ofNullable(this.getEditorContent())
-			.map(c -> !c.equals(oldContent))
-			.orElse(false);
+		// Edits are tracked by the change listener, the content is only copied when the message is rebuilt.
+		return modified;
 	}
 }
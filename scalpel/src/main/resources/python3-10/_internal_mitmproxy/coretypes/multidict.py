@@ -1,8 +1,10 @@
 from abc import ABCMeta
 from abc import abstractmethod
+from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import MutableMapping
+from typing import Optional
 from typing import Sequence
 from typing import Tuple
 from typing import TypeVar
@@ -227,3 +229,175 @@ class MultiDictView(_MultiDict[KT, VT]):
 
     def copy(self) -> "MultiDict[KT,VT]":
         return MultiDict(self.fields)
+
+
+def _build_index(fields, kconv) -> Dict[KT, List[int]]:
+    """
+    Map every canonical key to the positions of its fields, in order.
+    The keys of the index are ordered by first occurrence.
+    """
+    index: Dict[KT, List[int]] = {}
+    for position, (key, _) in enumerate(fields):
+        key = kconv(key)
+        positions = index.get(key)
+        if positions is None:
+            index[key] = [position]
+        else:
+            positions.append(position)
+    return index
+
+
+class IndexedMultiDict(MultiDict[KT, VT]):
+    """
+    A MultiDict storing its fields in a list, with a key index built on first lookup.
+
+    Lookups, replacements and additions don't scan the fields, which keeps headers and forms
+    with many fields linear to process. Removals and insertions rebuild the fields and the index.
+    """
+
+    _field_list: List[Tuple[KT, VT]]
+    _fields_tuple: Optional[Tuple[Tuple[KT, VT], ...]]
+    _index: Optional[Dict[KT, List[int]]]
+
+    @property  # type: ignore
+    def fields(self) -> Tuple[Tuple[KT, VT], ...]:
+        if self._fields_tuple is None:
+            self._fields_tuple = tuple(self._field_list)
+        return self._fields_tuple
+
+    @fields.setter
+    def fields(self, value: Sequence[Tuple[KT, VT]]) -> None:
+        self._field_list = list(value)
+        self._fields_tuple = value if type(value) is tuple else None
+        self._index = None
+        self._fields_changed()
+
+    def _fields_changed(self) -> None:
+        """
+        Called after every modification of the fields.
+        """
+
+    def _modified(self) -> None:
+        self._fields_tuple = None
+        self._fields_changed()
+
+    def _get_index(self) -> Dict[KT, List[int]]:
+        if self._index is None:
+            self._index = _build_index(self._field_list, self._kconv)
+        return self._index
+
+    def __delitem__(self, key: KT) -> None:
+        positions = self._get_index().get(self._kconv(key))
+        if positions is None:
+            raise KeyError(key)
+        removed = set(positions)
+        self.fields = tuple(
+            field for position, field in enumerate(self._field_list)
+            if position not in removed
+        )
+
+    def __iter__(self) -> Iterator[KT]:
+        field_list = self._field_list
+        for positions in list(self._get_index().values()):
+            yield field_list[positions[0]][0]
+
+    def __len__(self) -> int:
+        return len(self._get_index())
+
+    def __contains__(self, key) -> bool:
+        # Subclasses convert the keys in get_all(), avoid reducing the values like __getitem__().
+        return bool(self.get_all(key))
+
+    def __copy__(self):
+        # The field list is modified in place, copies can't share it.
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        copied._field_list = list(self._field_list)
+        copied._index = None
+        return copied
+
+    def get_all(self, key: KT) -> List[VT]:
+        """
+        Return the list of all values for a given key.
+        If that key is not in the MultiDict, the return value will be an empty list.
+        """
+        positions = self._get_index().get(self._kconv(key), ())
+        field_list = self._field_list
+        return [field_list[position][1] for position in positions]
+
+    def set_all(self, key: KT, values: List[VT]) -> None:
+        """
+        Remove the old values for a key and add new ones.
+        """
+        index = self._get_index()
+        key_kconv = self._kconv(key)
+        positions = index.get(key_kconv, [])
+        if len(values) < len(positions):
+            # Fields have to be removed, which shifts the positions of the next ones.
+            removed = set(positions[len(values):])
+            replaced = dict(zip(positions, values))
+            self.fields = tuple(
+                (field[0], replaced[position]) if position in replaced else field
+                for position, field in enumerate(self._field_list)
+                if position not in removed
+            )
+            return
+
+        field_list = self._field_list
+        for position, value in zip(positions, values):
+            field_list[position] = (field_list[position][0], value)
+        for value in values[len(positions):]:
+            index.setdefault(key_kconv, []).append(len(field_list))
+            field_list.append((key, value))
+        self._modified()
+
+    def insert(self, index: int, key: KT, value: VT) -> None:
+        """
+        Insert an additional value for the given key at the specified position.
+        """
+        field_list = self._field_list
+        if index >= len(field_list):
+            if self._index is not None:
+                self._index.setdefault(self._kconv(key), []).append(len(field_list))
+            field_list.append((key, value))
+        else:
+            field_list.insert(index, (key, value))
+            # The positions of the next fields have changed.
+            self._index = None
+        self._modified()
+
+
+class IndexedMultiDictView(MultiDictView[KT, VT]):
+    """
+    A MultiDictView indexing the fields returned by the parent.
+
+    The index is reused as long as the parent returns the same fields object,
+    so lookups through the same view don't scan the fields when the parent caches them.
+    """
+
+    _indexed_fields: Optional[Tuple[Tuple[KT, VT], ...]] = None
+    _index: Optional[Dict[KT, List[int]]] = None
+
+    def _get_index(self, fields) -> Dict[KT, List[int]]:
+        # Keeping a reference to the indexed fields prevents their id from being reused.
+        if fields is not self._indexed_fields or self._index is None:
+            self._index = _build_index(fields, self._kconv)
+            self._indexed_fields = fields
+        return self._index
+
+    def __iter__(self) -> Iterator[KT]:
+        fields = self.fields
+        for positions in list(self._get_index(fields).values()):
+            yield fields[positions[0]][0]
+
+    def __len__(self) -> int:
+        return len(self._get_index(self.fields))
+
+    def get_all(self, key: KT) -> List[VT]:
+        """
+        Return the list of all values for a given key.
+        If that key is not in the MultiDict, the return value will be an empty list.
+        """
+        fields = self.fields
+        positions = self._get_index(fields).get(self._kconv(key), ())
+        return [fields[position][1] for position in positions]
@@ -21,8 +21,6 @@ from typing import Union
 from typing import cast
 from typing import Any
 
-from _internal_mitmproxy import flow
-
 # from _internal_mitmproxy.websocket import WebSocketData
 WebSocketData = ...
 from _internal_mitmproxy.coretypes import multidict
@@ -51,7 +49,7 @@ def _always_bytes(x: Union[str, bytes]) -> bytes:
 
 
 # This cannot be easily typed with mypy yet, so we just specify MultiDict without concrete types.
-class Headers(multidict.MultiDict):  # type: ignore
+class Headers(multidict.IndexedMultiDict):  # type: ignore
     """
     Header class which allows both convenient access to individual headers as well as
     direct access to the underlying raw data. Provides a full dictionary interface.
@@ -1229,67 +1227,14 @@ class Response(Message):
             self.headers.set_all("set-cookie", c)
 
 
-class HTTPFlow(flow.Flow):
-    """
-    An HTTPFlow is a collection of objects representing a single HTTP
-    transaction.
-    """
-
-    request: Request
-    """The client's HTTP request."""
-    response: Optional[Response] = None
-    """The server's HTTP response."""
-    error: Optional[flow.Error] = None
-    """
-    A connection or protocol error affecting this flow.
-
-    Note that it's possible for a Flow to have both a response and an error
-    object. This might happen, for instance, when a response was received
-    from the server, but there was an error sending it back to the client.
-    """
+def __getattr__(name: str):
+    # HTTPFlow pulls in the flow, connection and certificate modules which the HTTP messages don't need,
+    # it is only imported when accessed.
+    if name == "HTTPFlow":
+        from _internal_mitmproxy.http_flow import HTTPFlow
 
-    websocket = None
-    """
-    If this HTTP flow initiated a WebSocket connection, this attribute contains all associated WebSocket data.
-    """
-
-    def __init__(self, client_conn, server_conn, live=None, mode="regular"):
-        super().__init__("http", client_conn, server_conn, live)
-        self.mode = mode
-
-    _stateobject_attributes = flow.Flow._stateobject_attributes.copy()
-    # mypy doesn't support update with kwargs
-    _stateobject_attributes.update(
-        dict(request=Request, response=Response, websocket=WebSocketData, mode=str)
-    )
-
-    def __repr__(self):
-        s = "<HTTPFlow"
-        for a in (
-            "request",
-            "response",
-            "websocket",
-            "error",
-            "client_conn",
-            "server_conn",
-        ):
-            if getattr(self, a, False):
-                s += f"\r\n  {a} = {{flow.{a}}}"
-        s += ">"
-        return s.format(flow=self)
-
-    @property
-    def timestamp_start(self) -> float:
-        """*Read-only:* An alias for `Request.timestamp_start`."""
-        return self.request.timestamp_start
-
-    def copy(self):
-        f = super().copy()
-        if self.request:
-            f.request = self.request.copy()
-        if self.response:
-            f.response = self.response.copy()
-        return f
+        return HTTPFlow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from _internal_mitmproxy import flow
+from _internal_mitmproxy.http import Request
+from _internal_mitmproxy.http import Response
+from _internal_mitmproxy.http import WebSocketData
+
+
+class HTTPFlow(flow.Flow):
+    """
+    An HTTPFlow is a collection of objects representing a single HTTP
+    transaction.
+    """
+
+    request: Request
+    """The client's HTTP request."""
+    response: Optional[Response] = None
+    """The server's HTTP response."""
+    error: Optional[flow.Error] = None
+    """
+    A connection or protocol error affecting this flow.
+
+    Note that it's possible for a Flow to have both a response and an error
+    object. This might happen, for instance, when a response was received
+    from the server, but there was an error sending it back to the client.
+    """
+
+    websocket = None
+    """
+    If this HTTP flow initiated a WebSocket connection, this attribute contains all associated WebSocket data.
+    """
+
+    def __init__(self, client_conn, server_conn, live=None, mode="regular"):
+        super().__init__("http", client_conn, server_conn, live)
+        self.mode = mode
+
+    _stateobject_attributes = flow.Flow._stateobject_attributes.copy()
+    # mypy doesn't support update with kwargs
+    _stateobject_attributes.update(
+        dict(request=Request, response=Response, websocket=WebSocketData, mode=str)
+    )
+
+    def __repr__(self):
+        s = "<HTTPFlow"
+        for a in (
+            "request",
+            "response",
+            "websocket",
+            "error",
+            "client_conn",
+            "server_conn",
+        ):
+            if getattr(self, a, False):
+                s += f"\r\n  {a} = {{flow.{a}}}"
+        s += ">"
+        return s.format(flow=self)
+
+    @property
+    def timestamp_start(self) -> float:
+        """*Read-only:* An alias for `Request.timestamp_start`."""
+        return self.request.timestamp_start
+
+    def copy(self):
+        f = super().copy()
+        if self.request:
+            f.request = self.request.copy()
+        if self.response:
+            f.response = self.response.copy()
+        return f
@@ -6,24 +6,101 @@ import codecs
 import collections
 from io import BytesIO
 
-# import gzip
-# import zlib
-# import brotli
-# import zstandard as zstd
+from typing import Union, Optional, AnyStr, overload  # noqa
 
-gzip = ...
-zlib = ...
-brotli = ...
-zstd = ...
+# The compression modules are imported on first use:
+# brotli and zstandard are optional, and most messages are never decoded.
 
-from typing import Union, Optional, AnyStr, overload  # noqa
+# Maximum size of a decompressed body, larger ones are rejected to protect against decompression bombs.
+MAX_DECODED_SIZE = 256 * 2**20
+
+# Size of the chunks the compressed bodies are decoded by.
+_CHUNK_SIZE = 2**16
+
+
+class DecodedSizeError(ValueError):
+    """The decompressed body would be larger than MAX_DECODED_SIZE."""
 
-# We have a shared single-element cache for encoding and decoding.
+
+# We have a shared cache of the last encoded and decoded bodies.
 # This is quite useful in practice, e.g.
 # flow.request.content = flow.request.content.replace(b"foo", b"bar")
 # does not require an .encode() call if content does not contain b"foo"
+# Several entries are kept, so alternating between request and response bodies doesn't evict them.
 CachedDecode = collections.namedtuple("CachedDecode", "encoded encoding errors decoded")
-_cache = CachedDecode(None, None, None, None)
+
+
+class _DecodeCache:
+    """
+    LRU cache of encoded and decoded bodies, bounded by their total size.
+
+    Entries are found by identity first, then by equality, as bodies are usually
+    the same objects when they are decoded again.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 2**20, max_entries: int = 16):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.size = 0
+        self._entries: "collections.OrderedDict[int, CachedDecode]" = (
+            collections.OrderedDict()
+        )
+
+    @staticmethod
+    def _entry_size(entry: CachedDecode) -> int:
+        return len(entry.encoded) + len(entry.decoded)
+
+    def _find(self, field: str, value: bytes, encoding: str, errors: str):
+        entries = self._entries
+        candidates = [
+            (key, entry)
+            for key, entry in reversed(entries.items())
+            if entry.encoding == encoding and entry.errors == errors
+        ]
+        for key, entry in candidates:
+            if getattr(entry, field) is value:
+                break
+        else:
+            for key, entry in candidates:
+                if getattr(entry, field) == value:
+                    break
+            else:
+                return None
+        entries.move_to_end(key)
+        return entry
+
+    def get_decoded(self, encoded: bytes, encoding: str, errors: str):
+        entry = self._find("encoded", encoded, encoding, errors)
+        return None if entry is None else entry.decoded
+
+    def get_encoded(self, decoded: bytes, encoding: str, errors: str):
+        entry = self._find("decoded", decoded, encoding, errors)
+        return None if entry is None else entry.encoded
+
+    def add(self, entry: CachedDecode) -> None:
+        size = self._entry_size(entry)
+        if size > self.max_bytes:
+            return
+        entries = self._entries
+        # Keyed by the encoded body identity, the entry keeps it alive so its id can't be reused.
+        key = id(entry.encoded)
+        previous = entries.pop(key, None)
+        if previous is not None:
+            self.size -= self._entry_size(previous)
+        entries[key] = entry
+        self.size += size
+        while self.size > self.max_bytes or len(entries) > self.max_entries:
+            _, evicted = entries.popitem(last=False)
+            self.size -= self._entry_size(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+_cache = _DecodeCache()
+
+_CACHED_ENCODINGS = ("gzip", "deflate", "deflateraw", "br", "zstd")
 
 
 @overload
@@ -56,24 +133,20 @@ def decode(
         return None
     encoding = encoding.lower()
 
-    global _cache
-    cached = (
-        isinstance(encoded, bytes)
-        and _cache.encoded == encoded
-        and _cache.encoding == encoding
-        and _cache.errors == errors
-    )
-    if cached:
-        return _cache.decoded
+    cacheable = isinstance(encoded, bytes) and encoding in _CACHED_ENCODINGS
+    if cacheable:
+        cached = _cache.get_decoded(encoded, encoding, errors)  # type: ignore
+        if cached is not None:
+            return cached
     try:
         try:
             decoded = custom_decode[encoding](encoded)
         except KeyError:
             decoded = codecs.decode(encoded, encoding, errors)  # type: ignore
-        if encoding in ("gzip", "deflate", "deflateraw", "br", "zstd"):
-            _cache = CachedDecode(encoded, encoding, errors, decoded)
+        if cacheable:
+            _cache.add(CachedDecode(encoded, encoding, errors, decoded))
         return decoded
-    except TypeError:
+    except (TypeError, DecodedSizeError):
         raise
     except Exception as e:
         raise ValueError(
@@ -83,7 +156,7 @@ def decode(
                 repr(encoding),
                 repr(e),
             )
-        )
+        ) from e
 
 
 @overload
@@ -116,24 +189,20 @@ def encode(
         return None
     encoding = encoding.lower()
 
-    global _cache
-    cached = (
-        isinstance(decoded, bytes)
-        and _cache.decoded == decoded
-        and _cache.encoding == encoding
-        and _cache.errors == errors
-    )
-    if cached:
-        return _cache.encoded
+    cacheable = isinstance(decoded, bytes) and encoding in _CACHED_ENCODINGS
+    if cacheable:
+        cached = _cache.get_encoded(decoded, encoding, errors)  # type: ignore
+        if cached is not None:
+            return cached
     try:
         try:
             encoded = custom_encode[encoding](decoded)
         except KeyError:
             encoded = codecs.encode(decoded, encoding, errors)  # type: ignore
-        if encoding in ("gzip", "deflate", "deflateraw", "br", "zstd"):
-            _cache = CachedDecode(encoded, encoding, errors, decoded)
+        if cacheable:
+            _cache.add(CachedDecode(encoded, encoding, errors, decoded))
         return encoded
-    except TypeError:
+    except (TypeError, DecodedSizeError):
         raise
     except Exception as e:
         raise ValueError(
@@ -143,7 +212,7 @@ def encode(
                 repr(encoding),
                 repr(e),
             )
-        )
+        ) from e
 
 
 def identity(content):
@@ -154,14 +223,51 @@ def identity(content):
     return content
 
 
+def _check_size(size: int) -> None:
+    if size > MAX_DECODED_SIZE:
+        raise DecodedSizeError(
+            f"decoded content is larger than {MAX_DECODED_SIZE} bytes"
+        )
+
+
+def _zlib_decompress(content: bytes, wbits: int) -> bytes:
+    """
+    Decompresses a zlib, gzip or raw DEFLATE stream chunk by chunk, without exceeding MAX_DECODED_SIZE.
+    Concatenated gzip members are decompressed as well.
+    """
+    import zlib
+
+    chunks = []
+    size = 0
+    data = content
+    while True:
+        decompressor = zlib.decompressobj(wbits)
+        while data:
+            chunk = decompressor.decompress(data, MAX_DECODED_SIZE - size + 1)
+            size += len(chunk)
+            _check_size(size)
+            chunks.append(chunk)
+            data = decompressor.unconsumed_tail
+        if not decompressor.eof:
+            raise EOFError(
+                "Compressed file ended before the end-of-stream marker was reached"
+            )
+        chunks.append(decompressor.flush())
+        data = decompressor.unused_data
+        # Only gzip allows several members, anything else after the end of the stream is ignored.
+        if wbits != 31 or not data.startswith(b"\x1f\x8b"):
+            return b"".join(chunks)
+
+
 def decode_gzip(content: bytes) -> bytes:
     if not content:
         return b""
-    gfile = gzip.GzipFile(fileobj=BytesIO(content))
-    return gfile.read()
+    return _zlib_decompress(content, 31)
 
 
 def encode_gzip(content: bytes) -> bytes:
+    import gzip
+
     s = BytesIO()
     gf = gzip.GzipFile(fileobj=s, mode="wb")
     gf.write(content)
@@ -172,26 +278,61 @@ def encode_gzip(content: bytes) -> bytes:
 def decode_brotli(content: bytes) -> bytes:
     if not content:
         return b""
-    return brotli.decompress(content)
+    import brotli
+
+    decompressor = brotli.Decompressor()
+    if not hasattr(decompressor, "can_accept_more_data"):
+        # Older versions can't bound the output of a single process() call.
+        raise RuntimeError(
+            "Brotli >= 1.1 is required to decode content without a decompression bomb risk"
+        )
+
+    chunks = []
+    size = 0
+    for start in range(0, len(content), _CHUNK_SIZE):
+        chunk = decompressor.process(
+            content[start : start + _CHUNK_SIZE], output_buffer_limit=_CHUNK_SIZE
+        )
+        # The output is capped per call, drain it before feeding more input.
+        while chunk or not decompressor.can_accept_more_data():
+            size += len(chunk)
+            _check_size(size)
+            chunks.append(chunk)
+            if decompressor.is_finished():
+                break
+            chunk = decompressor.process(b"", output_buffer_limit=_CHUNK_SIZE)
+    if not decompressor.is_finished():
+        raise brotli.error("Brotli stream is truncated")
+    return b"".join(chunks)
 
 
 def encode_brotli(content: bytes) -> bytes:
+    import brotli
+
     return brotli.compress(content)
 
 
 def decode_zstd(content: bytes) -> bytes:
     if not content:
         return b""
-    zstd_ctx = zstd.ZstdDecompressor()
-    try:
-        return zstd_ctx.decompress(content)
-    except zstd.ZstdError:
-        # If the zstd stream is streamed without a size header,
-        # try decoding with a 10MiB output buffer
-        return zstd_ctx.decompress(content, max_output_size=10 * 2**20)
+    import zstandard as zstd
+
+    # Streaming supports frames without a content size header and stops at the limit.
+    chunks = []
+    size = 0
+    with zstd.ZstdDecompressor().stream_reader(
+        content, read_across_frames=True
+    ) as reader:
+        while chunk := reader.read(_CHUNK_SIZE):
+            size += len(chunk)
+            _check_size(size)
+            chunks.append(chunk)
+    return b"".join(chunks)
 
 
 def encode_zstd(content: bytes) -> bytes:
+    import zstandard as zstd
+
     zstd_ctx = zstd.ZstdCompressor()
     return zstd_ctx.compress(content)
 
@@ -207,16 +348,20 @@ def decode_deflate(content: bytes) -> bytes:
     """
     if not content:
         return b""
+    import zlib
+
     try:
-        return zlib.decompress(content)
-    except zlib.error:
-        return zlib.decompress(content, -15)
+        return _zlib_decompress(content, 15)
+    except (zlib.error, EOFError):
+        return _zlib_decompress(content, -15)
 
 
 def encode_deflate(content: bytes) -> bytes:
     """
     Returns compressed content, always including zlib header and checksum.
     """
+    import zlib
+
     return zlib.compress(content)
 
 
@@ -239,4 +384,4 @@ custom_encode = {
     "zstd": encode_zstd,
 }
 
-__all__ = ["encode", "decode"]
+__all__ = ["encode", "decode", "DecodedSizeError", "MAX_DECODED_SIZE"]
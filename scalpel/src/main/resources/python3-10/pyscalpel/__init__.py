@@ -4,19 +4,30 @@ This is a module providing tools to handle Burp HTTP traffic through the use of
 It provides many utilities to manipulate HTTP requests, responses and converting data.
 """
 
-from pyscalpel.http import Request, Response, Flow
-from pyscalpel.edit import editor
-from pyscalpel.burp_utils import ctx as _context
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# The context is read from _globals rather than burp_utils, so burp_utils stays lazy.
+from pyscalpel._globals import ctx as _context
 from pyscalpel.java.scalpel_types import Context
+
+# Imported eagerly: the attribute shares its name with the submodule,
+#   which would replace it once pyscalpel.logger is imported.
 from pyscalpel.logger import Logger, logger
-from pyscalpel.events import MatchEvent
-from . import http
-from . import java
-from . import encoding
-from . import utils
-from . import burp_utils
-from . import venv
-from . import edit
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyscalpel.http import Request, Response, Flow, MatchSpec
+    from pyscalpel.edit import editor
+    from pyscalpel.events import MatchEvent
+    from . import http
+    from . import java
+    from . import encoding
+    from . import utils
+    from . import burp_utils
+    from . import venv
+    from . import edit
 
 ctx: Context = _context
 """The Scalpel Python execution context
@@ -25,6 +36,39 @@ Contains the Burp Java API object, the venv directory, the user script path,
 the path to the file loading the user script and a logging object
 """
 
+# Submodules and attributes are imported on first access (PEP 562),
+#   an interpreter only pays for what the user script actually uses.
+_LAZY_SUBMODULES = {"http", "java", "encoding", "utils", "burp_utils", "venv", "edit"}
+
+_LAZY_ATTRIBUTES = {
+    "Request": "pyscalpel.http",
+    "Response": "pyscalpel.http",
+    "Flow": "pyscalpel.http",
+    "MatchSpec": "pyscalpel.http",
+    "editor": "pyscalpel.edit",
+    "MatchEvent": "pyscalpel.events",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+
+    # Cache the attribute so __getattr__ isn't called for it anymore.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    # Not written with |, the 3.8 transpiler would turn it into a Union[] of sets.
+    return sorted(set(globals()).union(__all__))
+
 
 __all__ = [
     "http",
@@ -40,6 +84,7 @@ __all__ = [
     "ctx",
     "Context",
     "MatchEvent",
+    "MatchSpec",
     "editor",
     "logger",
     "Logger",
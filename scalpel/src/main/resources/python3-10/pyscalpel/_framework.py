@@ -1,5 +1,6 @@
 import traceback
 from sys import _getframe
+from time import perf_counter_ns
 import inspect
 from typing import Callable, TypeVar, cast, Any, TypedDict
 import sys
@@ -147,23 +148,11 @@ try:
 
     sys.path.append(dirname(path))
 
-    # create a module spec based on the script path
-    spec = importlib.util.spec_from_file_location("scalpel_user_module", path)
-
-    # Assert that the provided path can be loaded
-    assert spec is not None
-    assert spec.loader is not None
-
-    # create a module based on the spec
-    user_module = importlib.util.module_from_spec(spec)
-
-    # load the user_module into memory
-    spec.loader.exec_module(user_module)
-
-    from pyscalpel.burp_utils import IHttpRequest, IHttpResponse
+    from pyscalpel.burp_utils import IHttpRequest, IHttpResponse, to_bytes
     from pyscalpel.java.burp.http_service import IHttpService
     from pyscalpel.http import Request, Response, Flow
     from pyscalpel.events import MatchEvent
+    from pyscalpel.http.match import CompiledMatchSpec, compile_match_spec
     from pyscalpel.utils import removeprefix
 
     # Declare convenient types for the callbacks
@@ -171,38 +160,116 @@ try:
 
     CallbackType = Callable[..., CallbackReturn]
 
-    # Get all the callable objects from the user module
-    callable_objs: dict[str, Callable] = {
-        name: obj for name, obj in inspect.getmembers(user_module) if callable(obj)
-    }
-
-    match_callback: Callable[[Flow, MatchEvent], bool] = callable_objs.get("match") or (
-        lambda _, __: True
-    )
-
     class CallableData(TypedDict):
         name: str
         annotations: dict[str, Any]
 
-    def _get_callables() -> list[CallableData]:
-        logger.trace("Python: _get_callables() called")
+    def _load_user_module() -> None:
+        """Executes the user script and builds the hooks dispatch table from it.
+
+        The table is only replaced once the script is fully loaded,
+            so a broken script leaves the previous one in place.
+        """
+        global user_module, callable_objs, match_callback, match_arity, match_spec, editor_hooks, callables_data  # pylint: disable=global-statement
+
+        # create a module spec based on the script path
+        spec = importlib.util.spec_from_file_location("scalpel_user_module", path)
+
+        # Assert that the provided path can be loaded
+        assert spec is not None
+        assert spec.loader is not None
+
+        # create a module based on the spec
+        new_module = importlib.util.module_from_spec(spec)
+
+        # load the user_module into memory
+        spec.loader.exec_module(new_module)
+
+        # Get all the callable objects from the user module
+        new_callables: dict[str, Callable] = {
+            name: obj for name, obj in inspect.getmembers(new_module) if callable(obj)
+        }
+
+        new_match_callback: Callable[[Flow, MatchEvent], bool] = new_callables.get(
+            "match"
+        ) or (lambda _, __: True)
+
+        # Declarative match() specification, checked before match() and also evaluated by Burp.
+        new_match_spec: CompiledMatchSpec | None = None
+        if getattr(new_module, "MATCH", None) is not None:
+            new_match_spec = compile_match_spec(new_module.MATCH)
+
+        # Number of parameters accepted by match(), so it can be called without inspecting it every time.
+        new_match_arity = len(inspect.signature(new_match_callback).parameters)
+
+        user_module = new_module
+        callable_objs = new_callables
+        match_callback = new_match_callback
+        match_arity = new_match_arity
+        match_spec = new_match_spec
+
+        # Editor hooks indexed by prefix and tab suffix (e.g. editor_hooks["req_edit_in"]["_hex"])
+        editor_hooks = {
+            prefix: {
+                name[len(prefix) :]: obj
+                for name, obj in callable_objs.items()
+                if name.startswith(prefix)
+            }
+            for prefix in (
+                "req_edit_in",
+                "req_edit_out",
+                "res_edit_in",
+                "res_edit_out",
+            )
+        }
+
         # Also return the annotations because they contain the editor mode (hex,raw)
         # Annotations are a dict so they will be converted to HashMap
         # https://github.com/ninia/jep/wiki/How-Jep-Works#objects:~:text=Dict%20%2D%3E%20java.util.HashMap
-        return [
+        callables_data = [
             {"name": name, "annotations": getattr(hook, "__annotations__", {})}
             for name, hook in callable_objs.items()
         ]
 
+    # The dispatch table is built once per script load.
+    user_module: Any
+    callable_objs: dict[str, Callable]
+    match_callback: Callable[[Flow, MatchEvent], bool]
+    match_arity: int
+    match_spec: CompiledMatchSpec | None
+    editor_hooks: dict[str, dict[str, Callable]]
+    callables_data: list[CallableData]
+
+    _load_user_module()
+
+    def _reload_user_script() -> None:
+        """Hot-swaps the user script in the live interpreter.
+
+        Called by Burp when only the user script changed, the framework and the venv packages stay loaded.
+        Modules imported by the user script are not reloaded.
+        """
+        logger.all("Python: Reloading the user script ...")
+        _load_user_module()
+        logger.all("Python: Reloaded the user script")
+
+    def _get_callables() -> list[CallableData]:
+        logger.trace("Python: _get_callables() called")
+        return callables_data
+
+    def _get_match_spec() -> dict[str, str] | None:
+        logger.trace("Python: _get_match_spec() called")
+        # Converted to a HashMap, Burp compiles the regexes to skip out-of-scope traffic early.
+        return match_spec.regexes if match_spec is not None else None
+
     def call_match_callback(*args) -> bool:
         """Calls the match callback with the correct parameters.
 
         Returns:
             bool: The match callback result
         """
-        params_len = len(inspect.signature(match_callback).parameters)
-        filtered_args = args[:params_len]
-        return match_callback(*filtered_args)
+        if match_spec is not None and not match_spec.matches(*args):
+            return False
+        return match_callback(*args[:match_arity])
 
     def fun_name(frame=1):
         """Returns the name of the caller function
@@ -227,7 +294,7 @@ try:
         @wraps(callback)
         def _wrapped_cb(*args, **kwargs):
             try:
-                logger.trace(f"Python: _wrapped_cb() for {callback.__name__} called")
+                logger.trace("Python: _wrapped_cb() for %s called", callback.__name__)
                 return callback(*args, **kwargs)
             except Exception as ex:  # pylint: disable=broad-except
                 msg = f"Python: {callback.__name__}() error:\n{ex}\n{traceback.format_exc()}"
@@ -241,7 +308,7 @@ try:
     def _try_if_present(
         callback: Callable[..., CallbackReturn]
     ) -> Callable[..., CallbackReturn]:
-        """Decorator to return a  None lambda when the callback is not present in the user script.
+        """Decorator returning None instead of calling the callback when it is not present in the user script.
 
         Args:
             callback (Callable[..., CallbackReturn]): The callback to wrap
@@ -249,31 +316,50 @@ try:
         Returns:
             Callable[..., CallbackReturn]: The wrapped callback
         """
-        logger.trace(f"Python: _try_if_present({callback.__name__}) called")
+        logger.trace("Python: _try_if_present(%s) called", callback.__name__)
 
         # Remove the leading underscore from the callback name
         name = removeprefix(callback.__name__, "_")
 
-        # Get the user callback from the user script's callable objects
-        user_cb = callable_objs.get(name)
+        # Wrap the user callback in a try catch block and return it
+        # @_try_wrap
+        @wraps(callback)
+        def new_cb(*args, **kwargs) -> CallbackReturn:
+            # Get the user callback from the user script's callable objects,
+            #   looked up on each call because the user script can be hot-swapped.
+            user_cb = callable_objs.get(name)
+
+            # Ignore the callback when it isn't present in the user script.
+            if user_cb is None:
+                return None
+
+            return callback(*args, **kwargs, callback=user_cb)
 
-        # Ensure the user callback is present
-        if user_cb is not None:
-            logger.trace(f"Python: {name}() is present")
+        # Return the wrapped callback
+        return new_cb
 
-            # Wrap the user callback in a try catch block and return it
-            # @_try_wrap
-            @wraps(user_cb)
-            def new_cb(*args, **kwargs) -> CallbackReturn:
-                return callback(*args, **kwargs, callback=user_cb)
+    # Latency histograms shared with Burp, absent when the framework isn't loaded by Scalpel.
+    _hook_stats = ctx.get("hook_stats")
 
-            # Return the wrapped callback
-            return new_cb
+    class _PhaseTimer:
+        """Records how long each phase of a hook call took in Burp's hook statistics."""
 
-        logger.trace(f"Python: {name}() is not present")
+        __slots__ = ("hook", "last")
 
-        # Ignore the callback.
-        return lambda *_, **__: None
+        def __init__(self, hook: str):
+            self.hook = hook
+            self.last = perf_counter_ns()
+
+        def lap(self, phase: str) -> None:
+            """Records the time elapsed since the previous phase.
+
+            Args:
+                phase (str): The phase that just ended (from_burp, match, hook or to_burp)
+            """
+            now = perf_counter_ns()
+            if _hook_stats is not None:
+                _hook_stats.record(self.hook, phase, now - self.last)
+            self.last = now
 
     _HookReturnTp = TypeVar("_HookReturnTp")
 
@@ -299,19 +385,27 @@ try:
         Returns:
             IHttpRequest | None: The modified request object or None for an unmodified request
         """
+        timer = _PhaseTimer("request")
         py_req = Request.from_burp(req, service)
 
         flow = Flow(
             scheme=py_req.scheme, host=py_req.host, port=py_req.port, request=py_req
         )
-        if not call_match_callback(flow, "request"):
+        timer.lap("from_burp")
+
+        matched = call_match_callback(flow, "request")
+        timer.lap("match")
+        if not matched:
             return None
 
         # Call the user callback
         processed_req = _hook_type_check(callback.__name__, Request, callback(py_req))
+        timer.lap("hook")
 
         # Convert the request to a Burp request
-        return processed_req and processed_req.to_burp()
+        result = processed_req and processed_req.to_burp()
+        timer.lap("to_burp")
+        return result
 
     @_try_if_present
     def _response(
@@ -326,6 +420,7 @@ try:
         Returns:
             IHttpResponse | None: The modified response object or None for an unmodified response
         """
+        timer = _PhaseTimer("response")
         py_res = Response.from_burp(res, service)
 
         flow = Flow(
@@ -335,12 +430,199 @@ try:
             request=py_res.request,
             response=py_res,
         )
-        if not call_match_callback(flow, "response"):
+        timer.lap("from_burp")
+
+        matched = call_match_callback(flow, "response")
+        timer.lap("match")
+        if not matched:
             return None
 
         result_res = _hook_type_check(callback.__name__, Response, callback(py_res))
+        timer.lap("hook")
+
+        result = result_res.to_burp() if result_res is not None else None
+        timer.lap("to_burp")
+        return result
+
+    def _call_batch_hook(
+        hook_name: MatchEvent,
+        count: int,
+        convert: Callable[[int], tuple[Request | Response, Flow]],
+        expected_type: type[Request] | type[Response],
+        timer: _PhaseTimer,
+    ) -> list[list[Any]]:
+        """Calls the user batch hook with the matching messages,
+            or falls back to calling the single message hook for each of them.
+
+        A message failing to convert or match is only rejected itself, the rest of the batch is still processed.
+
+        Args:
+            hook_name (MatchEvent): The single message hook name (request or response)
+            count (int): The number of messages to process
+            convert (Callable[[int], tuple[Request | Response, Flow]]): Converts the Burp message at an index
+                to the message and the flow passed to match()
+            expected_type (type[Request] | type[Response]): The type the hooks must return
+            timer (_PhaseTimer): Records the duration of the batch phases
+
+        Returns:
+            list[list[Any]]: The Burp messages (or None when unmodified)
+                and the error messages (or None on success), in the same order as the input messages.
+        """
+        results: list[Any] = [None] * count
+        errors: list[str | None] = [None] * count
+
+        def fail(index: int, ex: Exception):
+            msg = f"Python: {hook_name}() error:\n{ex}\n{traceback.format_exc()}"
+            logger.error(msg)
+            errors[index] = msg
+
+        messages: list[Any] = [None] * count
+        flows: dict[int, Flow] = {}
+        for index in range(count):
+            try:
+                messages[index], flows[index] = convert(index)
+            except Exception as ex:  # pylint: disable=broad-except
+                fail(index, ex)
+        timer.lap("from_burp")
+
+        matched: list[int] = []
+        for index, flow in flows.items():
+            try:
+                if call_match_callback(flow, hook_name):
+                    matched.append(index)
+            except Exception as ex:  # pylint: disable=broad-except
+                fail(index, ex)
+        timer.lap("match")
+
+        batch_callback = callable_objs.get(hook_name + "_batch")
+        if batch_callback is not None:
+            try:
+                processed = batch_callback([messages[i] for i in matched])
+                timer.lap("hook")
+                if processed is None:
+                    processed = [None] * len(matched)
+
+                if len(processed) != len(matched):
+                    raise ValueError(
+                        f"{batch_callback.__name__}() returned {len(processed)} items instead of {len(matched)}"
+                    )
+            except Exception as ex:  # pylint: disable=broad-except
+                # The results cannot be matched to the messages, reject all of them.
+                for index in matched:
+                    fail(index, ex)
+                return [results, errors]
+
+            for index, result in zip(matched, processed):
+                try:
+                    result = _hook_type_check(
+                        batch_callback.__name__, expected_type, result
+                    )
+                    results[index] = result.to_burp() if result is not None else None
+                except Exception as ex:  # pylint: disable=broad-except
+                    fail(index, ex)
+
+            timer.lap("to_burp")
+            return [results, errors]
+
+        callback = callable_objs.get(hook_name)
+        if callback is None:
+            return [results, errors]
+
+        for index in matched:
+            try:
+                result = _hook_type_check(
+                    callback.__name__, expected_type, callback(messages[index])
+                )
+                results[index] = result.to_burp() if result is not None else None
+            except Exception as ex:  # pylint: disable=broad-except
+                fail(index, ex)
+
+        # The conversions are interleaved with the hook calls here.
+        timer.lap("hook")
+        return [results, errors]
+
+    def _request_batch(
+        reqs: list[IHttpRequest], services: list[IHttpService]
+    ) -> list[list[Any]]:
+        """Wrapper for the batched request callback
+
+        Args:
+            reqs (list[IHttpRequest]): The request objects
+            services (list[IHttpService]): The network service of each request
+
+        Returns:
+            list[list[Any]]: The modified requests (or None) and the error messages (or None)
+        """
+        logger.trace("Python: _request_batch() called with %s requests", len(reqs))
+        timer = _PhaseTimer("request_batch")
+
+        def convert(index: int) -> tuple[Request, Flow]:
+            req = Request.from_burp(reqs[index], services[index])
+            return req, Flow(
+                scheme=req.scheme, host=req.host, port=req.port, request=req
+            )
+
+        return _call_batch_hook("request", len(reqs), convert, Request, timer)
+
+    def _response_batch(
+        ress: list[IHttpResponse], services: list[IHttpService]
+    ) -> list[list[Any]]:
+        """Wrapper for the batched response callback
+
+        Args:
+            ress (list[IHttpResponse]): The response objects
+            services (list[IHttpService]): The network service of each response
+
+        Returns:
+            list[list[Any]]: The modified responses (or None) and the error messages (or None)
+        """
+        logger.trace("Python: _response_batch() called with %s responses", len(ress))
+        timer = _PhaseTimer("response_batch")
+
+        def convert(index: int) -> tuple[Response, Flow]:
+            res = Response.from_burp(ress[index], services[index])
+            return res, Flow(
+                scheme=res.scheme,
+                host=res.host,
+                port=res.port,
+                request=res.request,
+                response=res,
+            )
+
+        return _call_batch_hook("response", len(ress), convert, Response, timer)
+
+    @_try_if_present
+    def _on_response(
+        res: IHttpResponse, service: IHttpService, callback: CallbackType = ...
+    ) -> None:
+        """Wrapper for the observe-only response callback
+
+        Burp does not wait for this callback, its return value is ignored.
 
-        return result_res.to_burp() if result_res is not None else None
+        Args:
+            res (IHttpResponse): The response object
+            callback (CallbackType, optional): The user callback.
+        """
+        timer = _PhaseTimer("on_response")
+        py_res = Response.from_burp(res, service)
+
+        flow = Flow(
+            scheme=py_res.scheme,
+            host=py_res.host,
+            port=py_res.port,
+            request=py_res.request,
+            response=py_res,
+        )
+        timer.lap("from_burp")
+
+        matched = call_match_callback(flow, "on_response")
+        timer.lap("match")
+        if not matched:
+            return None
+
+        callback(py_res)
+        timer.lap("hook")
+        return None
 
     def _req_edit_in(
         req: IHttpRequest, service: IHttpService, callback_suffix: str = ...
@@ -354,28 +636,35 @@ try:
         Returns:
             bytes | None: The bytes to display in the editor or None for a disabled editor
         """
-        logger.trace(f"Python: _req_edit_in -> {callback_suffix}")
-        callback = callable_objs.get("req_edit_in" + callback_suffix)
+        logger.trace("Python: _req_edit_in -> %s", callback_suffix)
+        callback = editor_hooks["req_edit_in"].get(callback_suffix)
         if callback is None:
             return None
 
+        timer = _PhaseTimer("req_edit_in")
         py_req = Request.from_burp(req, service)
 
         flow = Flow(
             scheme=py_req.scheme, host=py_req.host, port=py_req.port, request=py_req
         )
-        if not call_match_callback(flow, "req_edit_in"):
+        timer.lap("from_burp")
+
+        matched = call_match_callback(flow, "req_edit_in")
+        timer.lap("match")
+        if not matched:
             return None
 
-        logger.trace(f"Python: calling {callback.__name__}")
+        logger.trace("Python: calling %s", callback.__name__)
 
         # Call the user callback, ensure the type is correct and return the bytes to display in the editor
-        return _hook_type_check(callback.__name__, bytes, callback(py_req))
+        result = _hook_type_check(callback.__name__, bytes, callback(py_req))
+        timer.lap("hook")
+        return result
 
     def _req_edit_out(
         req: IHttpRequest,
         service: IHttpService,
-        text: list[int],
+        text: memoryview,
         callback_suffix: str = ...,
     ) -> IHttpRequest | None:
         """Wrapper for the request edit callback
@@ -383,36 +672,44 @@ try:
         Args:
             req (IHttpRequest): The request object
             service (IHttpService): The network service (contains target IP and port)
-            text (list[int]): The editor content
+            text (memoryview): The editor content
             callback (CallbackType, optional): The user callback.
 
         Returns:
             bytes | None: The bytes to construct the new request from
                 or None for an unmodified request
         """
-        logger.trace(f"Python: _req_edit_out -> {callback_suffix}")
-        callback = callable_objs.get("req_edit_out" + callback_suffix)
+        logger.trace("Python: _req_edit_out -> %s", callback_suffix)
+        callback = editor_hooks["req_edit_out"].get(callback_suffix)
         if callback is None:
             return None
 
+        timer = _PhaseTimer("req_edit_out")
         py_req = Request.from_burp(req, service)
+        content = to_bytes(text)
 
         flow = Flow(
             scheme=py_req.scheme,
             host=py_req.host,
             port=py_req.port,
             request=py_req,
-            text=bytes(text),
+            text=content,
         )
-        if not call_match_callback(flow, "req_edit_out"):
+        timer.lap("from_burp")
+
+        matched = call_match_callback(flow, "req_edit_out")
+        timer.lap("match")
+        if not matched:
             return None
 
-        logger.trace(f"Python: calling {callback.__name__}")
+        logger.trace("Python: calling %s", callback.__name__)
         # Call the user callback and return the bytes to construct the new request from
-        result = _hook_type_check(
-            callback.__name__, Request, callback(py_req, bytes(text))
-        )
-        return result and result.to_burp()
+        result = _hook_type_check(callback.__name__, Request, callback(py_req, content))
+        timer.lap("hook")
+
+        burp_req = result and result.to_burp()
+        timer.lap("to_burp")
+        return burp_req
 
     # @_try_wrap
     def _res_edit_in(
@@ -432,11 +729,12 @@ try:
         Returns:
             bytes | None: The bytes to display in the editor or None for a disabled editor
         """
-        logger.trace(f"Python: _res_edit_in -> {callback_suffix}")
-        callback = callable_objs.get("res_edit_in" + callback_suffix)
+        logger.trace("Python: _res_edit_in -> %s", callback_suffix)
+        callback = editor_hooks["res_edit_in"].get(callback_suffix)
         if callback is None:
             return None
 
+        timer = _PhaseTimer("res_edit_in")
         py_res = Response.from_burp(res, service=service, request=request)
 
         flow = Flow(
@@ -446,19 +744,25 @@ try:
             request=py_res.request,
             response=py_res,
         )
-        if not call_match_callback(flow, "res_edit_in"):
+        timer.lap("from_burp")
+
+        matched = call_match_callback(flow, "res_edit_in")
+        timer.lap("match")
+        if not matched:
             return None
 
-        logger.trace(f"Python: calling {callback.__name__}")
+        logger.trace("Python: calling %s", callback.__name__)
         # Call the user callback and return the bytes to display in the editor
-        return _hook_type_check(callback.__name__, bytes, callback(py_res))
+        result = _hook_type_check(callback.__name__, bytes, callback(py_res))
+        timer.lap("hook")
+        return result
 
     # @_try_wrap
     def _res_edit_out(
         res: IHttpResponse,
         req: IHttpRequest,
         service: IHttpService,
-        text: list[int],
+        text: memoryview,
         callback_suffix: str = ...,
     ) -> IHttpResponse | None:
         """Wrapper for the response edit callback
@@ -467,19 +771,21 @@ try:
             res (IHttpResponse): The response object
             req (IHttpRequest): The initiating request
             service (IHttpService): The network service (contains target IP and port)
-            text (list[int]): The editor content
+            text (memoryview): The editor content
             callback (CallbackType, optional): The user callback.
 
         Returns:
             bytes | None: The bytes to construct the new response from
                 or None for an unmodified response
         """
-        logger.trace(f"Python: _res_edit_out -> {callback_suffix}")
-        callback = callable_objs.get("res_edit_out" + callback_suffix)
+        logger.trace("Python: _res_edit_out -> %s", callback_suffix)
+        callback = editor_hooks["res_edit_out"].get(callback_suffix)
         if callback is None:
             return None
 
+        timer = _PhaseTimer("res_edit_out")
         py_res = Response.from_burp(res, service=service, request=req)
+        content = to_bytes(text)
 
         flow = Flow(
             scheme=py_res.scheme,
@@ -487,17 +793,25 @@ try:
             port=py_res.port,
             request=py_res.request,
             response=py_res,
-            text=bytes(text),
+            text=content,
         )
-        if not call_match_callback(flow, "res_edit_out"):
+        timer.lap("from_burp")
+
+        matched = call_match_callback(flow, "res_edit_out")
+        timer.lap("match")
+        if not matched:
             return None
 
-        logger.trace(f"Python: calling {callback.__name__}")
+        logger.trace("Python: calling %s", callback.__name__)
         # Call the user callback and return the bytes to construct the new response from
         result = _hook_type_check(
-            callback.__name__, Response, callback(py_res, bytes(text))
+            callback.__name__, Response, callback(py_res, content)
         )
-        return result and result.to_burp()
+        timer.lap("hook")
+
+        burp_res = result and result.to_burp()
+        timer.lap("to_burp")
+        return burp_res
 
     logger.all("Python: Loaded _framework.py")
 
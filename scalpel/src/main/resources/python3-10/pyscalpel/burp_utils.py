@@ -11,7 +11,6 @@ from pyscalpel.java.bytes import JavaBytes
 from pyscalpel.java.scalpel_types.utils import PythonUtils
 from pyscalpel.encoding import always_bytes, urldecode, urlencode_all
 
-
 ctx = pyscalpel._globals.ctx
 
 
@@ -68,14 +67,36 @@ def _byte_array_str(string: str) -> IByteArray:  # pragma: no cover
     return ByteArray.byteArray(string)
 
 
+def get_buffer(array: IByteArray) -> memoryview:  # pragma: no cover
+    """Get a read-only view over the content of a Burp :class:`IByteArray`
+
+    Burp copies the content out of the ByteArray, which is then copied into a direct Java buffer
+    exposed to Python through the buffer protocol, instead of being converted byte per byte.
+    The view is only copied again when it is turned into bytes.
+    """
+    if PythonUtils is None:
+        # Not running in Burp (e.g. unit tests)
+        return memoryview(to_bytes(array.getBytes()))
+
+    if array.length() == 0:
+        return memoryview(b"")
+
+    return memoryview(PythonUtils.toDirectBuffer(array)).cast("B").toreadonly()
+
+
 def get_bytes(array: IByteArray) -> bytes:  # pragma: no cover
-    return to_bytes(array.getBytes())
+    return get_buffer(array).tobytes()
 
 
 def to_bytes(obj: ByteArraySerialisable | JavaBytes) -> bytes:  # pragma: no cover
     # Handle java signed bytes
     if isinstance(obj, Iterable):
-        # Convert java signed bytes to python unsigned bytes
-        return bytes([b & 0xFF for b in cast(JavaBytes, obj)])
+        try:
+            # Buffer-capable objects (bytes, direct buffers, Java primitive arrays)
+            #   are copied in one go.
+            return bytes(memoryview(cast(bytes, obj)))
+        except TypeError:
+            # Convert java signed bytes to python unsigned bytes
+            return bytes([b & 0xFF for b in cast(JavaBytes, obj)])
 
     return get_bytes(cast(ByteArraySerialisable, obj).toByteArray())
@@ -5,6 +5,7 @@ from typing import Literal, get_args
 MatchEvent = Literal[
     "request",
     "response",
+    "on_response",
     "req_edit_in",
     "req_edit_out",
     "res_edit_in",
@@ -6,6 +6,7 @@ from .request import Request, Headers
 from .response import Response
 from .flow import Flow
 from .utils import match_patterns, host_is
+from .match import MatchSpec, compile_match_spec
 from . import body
 
 __all__ = [
@@ -16,4 +17,6 @@ __all__ = [
     "Flow",
     "host_is",
     "match_patterns",
+    "MatchSpec",
+    "compile_match_spec",
 ]
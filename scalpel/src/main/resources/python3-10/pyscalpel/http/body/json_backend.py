@@ -0,0 +1,108 @@
+"""
+JSON parsing backends
+
+orjson or ujson are used to parse JSON forms when they are installed in the venv, the stdlib json module is the fallback.
+
+The stdlib is still used to parse the documents the accelerated backend rejects or may parse differently
+(numbers out of the 64 bits range, NaN, non UTF-8 encodings...), so the parsed forms are the same whatever the backend.
+
+Serialization always uses the stdlib encoder (also implemented in C):
+the other backends format the output differently, which would modify the requests content depending on the venv.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable
+
+# Backend names, by order of preference.
+BACKENDS = ("orjson", "ujson", "json")
+
+# orjson parses integers out of the 64 bits range as floats, the stdlib keeps them exact.
+_LONG_NUMBER = re.compile(rb"\d{19}")
+_LONG_NUMBER_STR = re.compile(r"\d{19}")
+
+_loads: Callable[[bytes | str], Any] | None = None
+_backend_name: str | None = None
+
+
+def _import_loads(name: str) -> Callable[[bytes | str], Any]:
+    match name:
+        case "orjson":
+            import orjson
+
+            return orjson.loads
+        case "ujson":
+            import ujson
+
+            return ujson.loads
+        case "json":
+            return json.loads
+        case _:
+            raise ValueError(f"Unknown JSON backend: {name}")
+
+
+def select_backend(name: str | None = None) -> str:
+    """Select the JSON parsing backend
+
+    Args:
+        name (str | None, optional): The backend to use, the first installed one of BACKENDS when None.
+
+    Raises:
+        ImportError: The requested backend is not installed.
+
+    Returns:
+        str: The selected backend name
+    """
+    global _loads, _backend_name
+
+    candidates = BACKENDS if name is None else (name,)
+    for candidate in candidates:
+        try:
+            loads = _import_loads(candidate)
+        except ImportError:
+            if name is not None:
+                raise
+            continue
+
+        _loads, _backend_name = loads, candidate
+        return candidate
+
+    raise ImportError("No JSON backend available")  # pragma: no cover
+
+
+def get_backend() -> str:
+    """Get the JSON parsing backend name, selecting it on first use
+
+    Returns:
+        str: The backend name
+    """
+    return _backend_name or select_backend()
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document
+
+    Args:
+        data (bytes | str): The JSON document
+
+    Raises:
+        json.JSONDecodeError: The document is not valid JSON.
+
+    Returns:
+        Any: The parsed document
+    """
+    if _loads is None:
+        select_backend()
+
+    backend_loads = _loads
+    long_number = _LONG_NUMBER_STR if isinstance(data, str) else _LONG_NUMBER
+    if backend_loads is not json.loads and long_number.search(data) is None:
+        try:
+            return backend_loads(data)  # type: ignore[misc]
+        except (ValueError, OverflowError):
+            # Let the stdlib decide, it accepts more than the other backends.
+            pass
+
+    return json.loads(data)
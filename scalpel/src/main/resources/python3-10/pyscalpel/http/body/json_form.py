@@ -6,7 +6,7 @@ from collections.abc import Mapping
 import re
 import string
 import json
-from typing import Any
+from typing import Any, Iterable
 
 import qs
 
@@ -16,6 +16,8 @@ from pyscalpel.http.body.abstract import (
     ExportedForm,
 )
 from pyscalpel.encoding import always_bytes
+from pyscalpel.http.body import json_backend
+from pyscalpel.http.body.tracking import Mutations, TrackedDict, TrackedList
 from pyscalpel.http.body.urlencoded import URLEncodedFormSerializer
 from pyscalpel.utils import removesuffix
 
@@ -31,31 +33,114 @@ JSON_VALUE_TYPES = (
 )
 
 
+class _JSONMutations(Mutations):
+    __slots__ = ()
+
+    def tracks(self, value: Any) -> bool:
+        # Objects and arrays inserted by the user may still be modified through their own references.
+        if isinstance(value, (TrackedDict, TrackedList)):
+            return value._mutations is self
+        return value is None or isinstance(value, (str, int, float, bytes))
+
+
+def _track(parsed: dict, form: JSONForm) -> None:
+    """Copy a parsed object into a form, converting the nested objects and arrays to tracked containers
+
+    Iterative, so deeply nested documents don't hit the recursion limit.
+    """
+    mutations = form._mutations
+    stack: list[tuple[Any, dict | list]] = [(parsed, form)]
+    while stack:
+        source, destination = stack.pop()
+
+        # Copy everything at once, then replace the containers.
+        items: Iterable[tuple[Any, Any]]
+        if isinstance(destination, list):
+            list.extend(destination, source)
+            items = enumerate(source)
+            set_item = list.__setitem__
+        else:
+            dict.update(destination, source)
+            items = source.items()
+            set_item = dict.__setitem__
+
+        for key, value in items:
+            tracked: TrackedDict | TrackedList
+            value_type = type(value)
+            if value_type is dict:
+                tracked = TrackedDict()
+            elif value_type is list:
+                tracked = TrackedList()
+            else:
+                continue
+
+            tracked._mutations = mutations
+            set_item(destination, key, tracked)
+            stack.append((value, tracked))
+
+
 # TODO: JSON keys are actually only strings, so we should wrap
 #   getter and setter  to always convert the keys to string.
-class JSONForm(dict[JSON_KEY_TYPES, JSON_VALUE_TYPES]):
+class JSONForm(TrackedDict, dict[JSON_KEY_TYPES, JSON_VALUE_TYPES]):
     """Form representing a JSON object {}
 
-    Implemented by a plain dict
+    Implemented by a dict tracking its mutations and the ones of the objects and arrays it contains.
 
     Args:
         dict (_type_): A dict containing JSON-compatible types.
     """
 
-    pass
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._mutations = _JSONMutations()
+        self._mutations.touch(self.values())
+
+    @classmethod
+    def _from_parsed(cls, parsed: dict) -> JSONForm:
+        """Create a form from a freshly parsed object, tracking the objects and arrays it contains in place
+
+        Args:
+            parsed (dict): The parsed object, which must not be referenced elsewhere.
+
+        Returns:
+            JSONForm: The form
+        """
+        form = cls()
+        _track(parsed, form)
+        return form
+
+    @property
+    def _version(self) -> int | None:
+        return self._mutations.get_version()
+
+
+_PRINTABLE_BYTES = string.printable.encode("utf-8")
+
+# The escaped representation of every byte value.
+_ESCAPED_BYTES = tuple(
+    chr(ch) if ch in _PRINTABLE_BYTES else f"\\u{ch:04x}" for ch in range(256)
+)
+
+_UNICODE_ESCAPE = re.compile(r"\\u([0-9a-fA-F]{4})")
 
 
 def json_escape_bytes(data: bytes) -> str:
-    printable = string.printable.encode("utf-8")
+    # Most values are printable, avoid building them byte per byte.
+    if not data.translate(None, _PRINTABLE_BYTES):
+        return data.decode("ascii")
+
+    return "".join(map(_ESCAPED_BYTES.__getitem__, data))
+
 
-    return "".join(chr(ch) if ch in printable else f"\\u{ch:04x}" for ch in data)
+def _decode_unicode_escape(match: re.Match[str]) -> str:
+    return chr(int(match.group(1), 16))
 
 
 def json_unescape(escaped: str) -> str:
-    def decode_match(match):
-        return chr(int(match.group(1), 16))
+    if "\\u" not in escaped:
+        return escaped
 
-    return re.sub(r"\\u([0-9a-fA-F]{4})", decode_match, escaped)
+    return _UNICODE_ESCAPE.sub(_decode_unicode_escape, escaped)
 
 
 def json_unescape_bytes(escaped: str) -> bytes:
@@ -133,19 +218,25 @@ def json_encode_exported_form(
 
 
 def encode_JSON_form(
-    d: dict[JSON_KEY_TYPES, JSON_VALUE_TYPES]
+    d: dict[JSON_KEY_TYPES, JSON_VALUE_TYPES],
 ) -> dict[JSON_KEY_TYPES, JSON_VALUE_TYPES]:
-    new_dict = {}
-    for k, v in d.items():
-        new_key = json_unescape(k) if isinstance(k, str) else k
-        if isinstance(v, dict):
-            new_value = encode_JSON_form(v)
-        elif isinstance(v, str):
-            new_value = json_unescape(v)
-        else:
-            new_value = v
-        new_dict[new_key] = new_value
-    return new_dict
+    root: dict[JSON_KEY_TYPES, JSON_VALUE_TYPES] = {}
+
+    # Walk the nested dicts iteratively, each one is filled after being inserted in its parent.
+    stack: list[tuple[dict, dict]] = [(d, root)]
+    while stack:
+        source, new_dict = stack.pop()
+        for k, v in source.items():
+            new_key = json_unescape(k) if isinstance(k, str) else k
+            if isinstance(v, dict):
+                new_value: JSON_VALUE_TYPES = {}
+                stack.append((v, new_value))
+            elif isinstance(v, str):
+                new_value = json_unescape(v)
+            else:
+                new_value = v
+            new_dict[new_key] = new_value
+    return root
 
 
 class JSONFormSerializer(FormSerializer):
@@ -156,11 +247,11 @@ class JSONFormSerializer(FormSerializer):
 
     def deserialize(self, body: bytes, req=...) -> JSONForm | None:
         try:
-            parsed = json.loads(body)
+            parsed = json_backend.loads(body)
         except json.JSONDecodeError:
             return None
 
-        return JSONForm(parsed) if isinstance(parsed, dict) else None
+        return JSONForm._from_parsed(parsed) if isinstance(parsed, dict) else None
 
     def get_empty_form(self, req=...) -> JSONForm:
         return JSONForm()
@@ -185,5 +276,5 @@ class JSONFormSerializer(FormSerializer):
         # Parse array keys like "key1[key2][key3]" and place value to the correct path
         # e.g: ("key1[key2][key3]", "nested_value") -> {"key1": {"key2" : {"key3" : "nested_value"}}}
         dict_form = qs.qs_parse_pairs(list(json_encode_exported_form(exported)))
-        json_form = JSONForm(dict_form.items())
+        json_form = JSONForm._from_parsed(dict_form)
         return json_form
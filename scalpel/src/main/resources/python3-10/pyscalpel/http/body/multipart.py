@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import Literal, Sequence, Any, Iterator
-from requests.structures import CaseInsensitiveDict
+from typing import Literal, Sequence, Any, Iterator, Generic, TYPE_CHECKING
 from io import TextIOWrapper, BufferedReader, IOBase
 import mimetypes
 
@@ -11,11 +10,10 @@ from collections.abc import Mapping, MutableMapping
 from pyscalpel.encoding import always_bytes, always_str
 
 from typing import cast, Any, Iterable, TypeVar
-from requests_toolbelt.multipart.decoder import (
-    BodyPart,
-    MultipartDecoder,
-    ImproperBodyPartContentException,
-)
+from copy import deepcopy
+
+if TYPE_CHECKING:  # pragma: no cover
+    from requests_toolbelt.multipart.decoder import BodyPart
 from urllib.parse import quote as urllibquote
 from pyscalpel.http.mime import (
     unparse_header_value,
@@ -32,6 +30,7 @@ from pyscalpel.http.body.abstract import (
 )
 
 from .abstract import FormSerializer, ObjectWithHeaders, Scalars
+from .tracking import Mutations, TrackedList, get_form_version, next_version
 
 # Define constants to avoid typos.
 CONTENT_TYPE_KEY = "Content-Type"
@@ -65,6 +64,63 @@ def get_mime(filename: str | None) -> str:
 
 AnyStr = TypeVar("AnyStr", str, bytes)
 
+_VT = TypeVar("_VT")
+
+
+# Taken from requests.structures, to avoid importing requests with pyscalpel.
+class CaseInsensitiveDict(MutableMapping, Generic[_VT]):
+    """A case-insensitive dict-like object, remembering the case of the last key set.
+
+    Querying and contains testing is case insensitive, iterating yields the case-sensitive keys.
+    """
+
+    def __init__(
+        self,
+        data: Mapping[str, _VT] | Iterable[tuple[str, _VT]] | None = None,
+        **kwargs: _VT,
+    ) -> None:
+        self._store: dict[str, tuple[str, _VT]] = {}
+        self._version = next_version()
+        if data is None:
+            data = {}
+        self.update(data, **kwargs)
+
+    def __setitem__(self, key: str, value: _VT) -> None:
+        # Use the lowercased key for lookups, but store the actual key alongside the value.
+        self._store[key.lower()] = (key, value)
+        self._version = next_version()
+
+    def __getitem__(self, key: str) -> _VT:
+        return self._store[key.lower()][1]
+
+    def __delitem__(self, key: str) -> None:
+        del self._store[key.lower()]
+        self._version = next_version()
+
+    def __iter__(self) -> Iterator[str]:
+        return (casedkey for casedkey, _ in self._store.values())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def lower_items(self) -> Iterator[tuple[str, _VT]]:
+        """Like items(), but with all lowercase keys."""
+        return ((lowerkey, keyval[1]) for (lowerkey, keyval) in self._store.items())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        # Compare insensitively
+        return dict(self.lower_items()) == dict(
+            CaseInsensitiveDict(other).lower_items()
+        )
+
+    def copy(self) -> CaseInsensitiveDict[_VT]:
+        return CaseInsensitiveDict(self._store.values())
+
+    def __repr__(self) -> str:
+        return str(dict(self.items()))
+
 
 def escape_parameter(param: str | bytes, extended=False) -> str:
     if not extended:
@@ -82,6 +138,89 @@ def escape_parameter(param: str | bytes, extended=False) -> str:
     return urllibquote(param, safe=attr_chars)
 
 
+class ImproperBodyPartContentException(ValueError):
+    """Raised when a multipart body part has no headers / content separator."""
+
+
+def _parse_part_headers(raw: bytes, encoding: str) -> CaseInsensitiveDict[str]:
+    """Parse the header block of a body part
+
+    Args:
+        raw (bytes): The raw headers, without the trailing empty line
+        encoding (str): The encoding to decode the headers with
+
+    Returns:
+        CaseInsensitiveDict[str]: The parsed headers
+    """
+    headers: CaseInsensitiveDict[str] = CaseInsensitiveDict()
+    last_key: str | None = None
+    for line in raw.decode(encoding).split("\r\n"):
+        if line[:1] in (" ", "\t"):
+            # Folded header line (obsolete, RFC 7230 3.2.4)
+            if last_key is not None:
+                headers[last_key] += " " + line.strip()
+            continue
+
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+
+        last_key = key
+        headers[key] = value.lstrip(" \t")
+    return headers
+
+
+def _parse_parts(
+    content: bytes, boundary: bytes, encoding: str
+) -> Iterator[tuple[CaseInsensitiveDict[str], memoryview]]:
+    """Split a multipart body into its parts in a single pass
+
+    The part contents are views on the original buffer, they are not copied.
+
+    Args:
+        content (bytes): The raw multipart body
+        boundary (bytes): The multipart boundary
+        encoding (str): The encoding to decode the part headers with
+
+    Raises:
+        ImproperBodyPartContentException: A part has no headers / content separator.
+
+    Yields:
+        tuple[CaseInsensitiveDict[str], memoryview]: The headers and content of each part
+    """
+    view = memoryview(content)
+    delimiter = b"\r\n--" + boundary
+    delimiter_len = len(delimiter)
+    size = len(content)
+
+    # The first delimiter isn't preceded by a line break.
+    opening = b"--" + boundary
+    start = len(opening) if content.startswith(opening) else 0
+
+    while start <= size:
+        end = content.find(delimiter, start)
+        if end == -1:
+            end = size
+
+        part_len = end - start
+        # Skip the preamble / epilogue and the closing delimiter.
+        if not (
+            part_len == 0
+            or (part_len == 2 and content.startswith(b"\r\n", start))
+            or (part_len == 2 and content.startswith(b"--", start))
+            or content.startswith(b"--\r\n", start, end)
+        ):
+            separator = content.find(b"\r\n\r\n", start, end)
+            if separator == -1:
+                raise ImproperBodyPartContentException(
+                    "content does not contain CR-LF-CR-LF"
+                )
+            headers = _parse_part_headers(content[start:separator].lstrip(), encoding)
+            yield headers, view[separator + 4 : end]
+
+        start = end + delimiter_len
+
+
 class MultiPartFormField:
     """
     This class represents a field in a multipart/form-data request.
@@ -99,19 +238,62 @@ class MultiPartFormField:
     """
 
     headers: CaseInsensitiveDict[str]
-    content: bytes
     encoding: str
 
+    # Parsed fields reference the original body until their content is accessed.
+    _content: bytes | memoryview
+
+    # Version of the last attribute assignment.
+    _attributes_version: int
+
     def __init__(
         self,
         headers: CaseInsensitiveDict[str],
-        content: bytes = b"",
+        content: bytes | memoryview = b"",
         encoding: str = "utf-8",
     ):
         self.headers = headers
-        self.content = content
+        self._content = content
         self.encoding = encoding
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        super().__setattr__("_attributes_version", next_version())
+
+    @property
+    def _version(self) -> int | None:
+        headers_version = get_form_version(self.headers)
+        if headers_version is None:
+            return None
+        return max(self._attributes_version, headers_version)
+
+    @property
+    def content(self) -> bytes:
+        content = self._content
+        if isinstance(content, memoryview):
+            content = content.tobytes()
+            # Not a modification, keep the version.
+            object.__setattr__(self, "_content", content)
+        return content
+
+    @content.setter
+    def content(self, content: bytes) -> None:
+        self._content = content
+
+    def __getstate__(self) -> dict[str, Any]:
+        # memoryviews cannot be pickled.
+        state = self.__dict__.copy()
+        state["_content"] = self.content
+        return state
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> MultiPartFormField:
+        # The content is immutable, share it instead of copying the whole body.
+        copied = MultiPartFormField(
+            deepcopy(self.headers, memo), self._content, self.encoding
+        )
+        memo[id(self)] = copied
+        return copied
+
     @classmethod
     def from_body_part(cls, body_part: BodyPart):
         headers = cls._fix_headers(cast(Mapping[bytes, bytes], body_part.headers))
@@ -157,7 +339,6 @@ class MultiPartFormField:
 
         return cls(headers, body, encoding)
 
-    # TODO: Rewrite request_toolbelt multipart parser to get rid of encoding.
     @staticmethod
     def from_file(
         name: str,
@@ -206,25 +387,21 @@ class MultiPartFormField:
 
     @staticmethod
     def __serialize_content(
-        content: bytes, headers: Mapping[str | bytes, str | bytes]
+        content: bytes | memoryview, headers: Mapping[str | bytes, str | bytes]
     ) -> bytes:
         # Prepend content with headers
-        merged_content: bytes = b""
-        header_lines = (
+        header_lines = b"\r\n".join(
             always_bytes(key) + b": " + always_bytes(value)
             for key, value in headers.items()
         )
-        merged_content += b"\r\n".join(header_lines)
-        merged_content += b"\r\n\r\n"
-        merged_content += content
-        return merged_content
+        return b"".join((header_lines, b"\r\n\r\n", content))
 
     def __bytes__(self) -> bytes:
         return self.__serialize_content(
-            self.content,
+            self._content,
             cast(Mapping[bytes | str, bytes | str], self.headers),
         )
-    
+
     def __eq__(self, other) -> bool:
         match other:
             case MultiPartFormField() | bytes():
@@ -363,21 +540,49 @@ class MultiPartForm(Mapping[str, MultiPartFormField]):
         - Iterator[MultiPartFormField]: Yields each field in the form.
     """
 
-    fields: list[MultiPartFormField]
     content_type: str
     encoding: str
 
+    # Tracks the fields list and the form attributes, fields track their own mutations.
+    _mutations: Mutations
+    _fields: TrackedList
+
     def __init__(
         self,
         fields: Sequence[MultiPartFormField],
         content_type: str,
         encoding: str = "utf-8",
     ):
+        self._mutations = Mutations()
         self.content_type = content_type
         self.encoding = encoding
         super().__init__()
         self.fields = list(fields)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self._mutations.touch()
+
+    @property
+    def fields(self) -> list[MultiPartFormField]:
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields: Iterable[MultiPartFormField]) -> None:
+        tracked = TrackedList(fields)
+        tracked._mutations = self._mutations
+        self._fields = tracked
+
+    @property
+    def _version(self) -> int | None:
+        version = self._mutations.version
+        for field in self._fields:
+            field_version = get_form_version(field)
+            if field_version is None:
+                return None
+            version = max(version, field_version)
+        return version
+
     @classmethod
     def from_bytes(
         cls, content: bytes, content_type: str, encoding: str = "utf-8"
@@ -392,10 +597,12 @@ class MultiPartForm(Mapping[str, MultiPartFormField]):
         - Returns:
            - MultiPartForm: The parsed multipart form
         """
-        decoder = MultipartDecoder(content, content_type, encoding=encoding)
-        parts: tuple[BodyPart] = decoder.parts
+        # Field contents are views on the body, which must not change under them.
+        content = bytes(content)
+        boundary = extract_boundary(content_type, encoding)
         fields: tuple[MultiPartFormField, ...] = tuple(
-            MultiPartFormField.from_body_part(body_part) for body_part in parts
+            MultiPartFormField(headers, field_content, encoding)
+            for headers, field_content in _parse_parts(content, boundary, encoding)
         )
         return cls(fields, content_type, encoding)
 
@@ -409,22 +616,27 @@ class MultiPartForm(Mapping[str, MultiPartFormField]):
         return extract_boundary(self.content_type, self.encoding)
 
     def __bytes__(self) -> bytes:
-        boundary = self.boundary
-        serialized = b""
+        delimiter = b"--" + self.boundary
         encoding = self.encoding
+
+        # Collect the chunks and join them once, the field contents are not copied until then.
+        chunks: list[bytes | memoryview] = []
+        append = chunks.append
         for field in self.fields:
-            serialized += b"--" + boundary + b"\r\n"
+            append(delimiter)
+            append(b"\r\n")
 
             # Format the headers
             for key, val in field.headers.items():
-                serialized += (
-                    key.encode(encoding) + b": " + val.encode(encoding) + b"\r\n"
-                )
-            serialized += b"\r\n" + field.content + b"\r\n"
+                append(key.encode(encoding) + b": " + val.encode(encoding) + b"\r\n")
+            append(b"\r\n")
+            append(field._content)
+            append(b"\r\n")
 
         # Format the final boundary
-        serialized += b"--" + boundary + b"--\r\n\r\n"
-        return serialized
+        append(delimiter)
+        append(b"--\r\n\r\n")
+        return b"".join(chunks)
 
     # Override
     def get_all(self, key: str) -> list[MultiPartFormField]:
@@ -0,0 +1,201 @@
+"""
+Mutation tracking for forms
+
+Request.content has to know whether the form was modified since it was parsed or serialized,
+to avoid serializing it again (and altering the original formatting) when it wasn't.
+
+Forms expose a `_version` changed by every mutation, taken from a global counter so versions
+of different objects can be compared: the greatest version of a form and its parts only changes
+when one of them is mutated. A `None` version means mutations cannot be tracked and the form must be
+assumed modified.
+"""
+
+from __future__ import annotations
+
+from itertools import count
+from typing import Any, Iterable, SupportsIndex
+
+_versions = count(1)
+
+
+def next_version() -> int:
+    """Get a version greater than every version returned before
+
+    Returns:
+        int: The new version
+    """
+    return next(_versions)
+
+
+def get_form_version(form: Any) -> int | None:
+    """Get the version of a form
+
+    Args:
+        form (Any): The form
+
+    Returns:
+        int | None: The form version, None if the form mutations are not tracked.
+    """
+    return getattr(form, "_version", None)
+
+
+class Mutations:
+    """Version shared by a form and the containers nested in it"""
+
+    __slots__ = ("version", "is_tracked")
+
+    def __init__(self) -> None:
+        self.version = next_version()
+        self.is_tracked = True
+
+    def tracks(self, value: Any) -> bool:
+        """Whether the mutations of a value inserted in the form are reported
+
+        Args:
+            value (Any): The inserted value
+
+        Returns:
+            bool: True by default, values are assumed to be immutable or to track their own mutations.
+        """
+        return True
+
+    def touch(self, values: Iterable[Any] = ()) -> None:
+        """Record a mutation
+
+        Args:
+            values (Iterable[Any], optional): The values inserted by the mutation.
+        """
+        self.version = next_version()
+        if self.is_tracked and not all(map(self.tracks, values)):
+            self.is_tracked = False
+
+    def get_version(self) -> int | None:
+        """Get the current version
+
+        Returns:
+            int | None: The version, None once an untracked value was inserted.
+        """
+        return self.version if self.is_tracked else None
+
+
+class TrackedDict(dict):
+    """dict reporting its mutations"""
+
+    # Forms may contain many containers, avoid allocating a __dict__ for each.
+    __slots__ = ("_mutations",)
+
+    _mutations: Mutations
+
+    def _mutated(self, values: Iterable[Any] = ()) -> None:
+        # Unpickling fills the dict before restoring the attributes.
+        mutations = getattr(self, "_mutations", None)
+        if mutations is not None:
+            mutations.touch(values)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._mutated((value,))
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._mutated()
+
+    def __ior__(self, other: Any) -> TrackedDict:
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._mutated()
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        value = super().pop(key, *default)
+        self._mutated()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        self._mutated()
+        return item
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+
+        self[key] = default
+        return default
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        updated = dict(*args, **kwargs)
+        super().update(updated)
+        self._mutated(updated.values())
+
+
+class TrackedList(list):
+    """list reporting its mutations"""
+
+    # Forms may contain many containers, avoid allocating a __dict__ for each.
+    __slots__ = ("_mutations",)
+
+    _mutations: Mutations
+
+    def _mutated(self, values: Iterable[Any] = ()) -> None:
+        # Unpickling fills the list before restoring the attributes.
+        mutations = getattr(self, "_mutations", None)
+        if mutations is not None:
+            mutations.touch(values)
+
+    def __setitem__(self, index: SupportsIndex | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            value = values = list(value)
+        else:
+            values = [value]
+        super().__setitem__(index, value)
+        self._mutated(values)
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        super().__delitem__(index)
+        self._mutated()
+
+    def __iadd__(self, values: Iterable[Any]) -> TrackedList:
+        self.extend(values)
+        return self
+
+    def __imul__(self, times: SupportsIndex) -> TrackedList:
+        super().__imul__(times)
+        self._mutated()
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(value)
+        self._mutated((value,))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        values = list(values)
+        super().extend(values)
+        self._mutated(values)
+
+    def insert(self, index: SupportsIndex, value: Any) -> None:
+        super().insert(index, value)
+        self._mutated((value,))
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        value = super().pop(index)
+        self._mutated()
+        return value
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        self._mutated()
+
+    def clear(self) -> None:
+        super().clear()
+        self._mutated()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._mutated()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._mutated()
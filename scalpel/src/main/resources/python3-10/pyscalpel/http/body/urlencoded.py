@@ -1,5 +1,5 @@
 from __future__ import annotations
-from urllib.parse import quote_from_bytes as quote, parse_qsl
+from urllib.parse import quote_from_bytes as quote, unquote, unquote_to_bytes
 from typing import Any, Iterable
 
 import sys
@@ -13,9 +13,10 @@ from pyscalpel.http.body.abstract import (
 from _internal_mitmproxy.coretypes import multidict
 
 from .abstract import FormSerializer, ExportedForm
+from .tracking import next_version
 
 
-class URLEncodedFormView(multidict.MultiDictView[str, str]):
+class URLEncodedFormView(multidict.IndexedMultiDictView[str, str]):
     def __init__(self, origin: multidict.MultiDictView[str, str]) -> None:
         super().__init__(origin._getter, origin._setter)
 
@@ -23,7 +24,9 @@ class URLEncodedFormView(multidict.MultiDictView[str, str]):
         super().__setitem__(always_str(key), always_str(value))
 
 
-class URLEncodedForm(multidict.MultiDict[bytes, bytes]):
+class URLEncodedForm(multidict.IndexedMultiDict[bytes, bytes]):
+    _version: int
+
     def __init__(self, fields: Iterable[tuple[str | bytes, str | bytes]]) -> None:
         fields_converted_to_bytes: Iterable[tuple[bytes, bytes]] = (
             (
@@ -34,12 +37,29 @@ class URLEncodedForm(multidict.MultiDict[bytes, bytes]):
         )
         super().__init__(fields_converted_to_bytes)
 
+    @classmethod
+    def _from_fields(cls, fields: tuple[tuple[bytes, bytes], ...]) -> URLEncodedForm:
+        """Create a form from parsed fields, without converting them
+
+        Args:
+            fields (tuple[tuple[bytes, bytes], ...]): The fields, already as bytes.
+
+        Returns:
+            URLEncodedForm: The form
+        """
+        form = cls.__new__(cls)
+        form.fields = fields
+        return form
+
     def __setitem__(self, key: int | str | bytes, value: int | str | bytes) -> None:
         super().__setitem__(always_bytes(key), always_bytes(value))
 
     def __getitem__(self, key: int | bytes | str) -> bytes:
         return super().__getitem__(always_bytes(key))
 
+    def _fields_changed(self) -> None:
+        self._version = next_version()
+
 
 def convert_for_urlencode(val: str | float | bool | bytes | int) -> str | bytes:
     match val:
@@ -51,34 +71,76 @@ def convert_for_urlencode(val: str | float | bool | bytes | int) -> str | bytes:
             return str(val)
 
 
+# Bytes left as is by quote(kv, safe="[]").
+_QUOTE_SAFE_BYTES = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~[]"
+)
+
+
+def _quote(data: bytes) -> bytes:
+    # Most keys and values don't need quoting, avoid the str round trip.
+    if not data.translate(None, _QUOTE_SAFE_BYTES):
+        return data
+    return quote(data, safe="[]").encode()
+
+
+def _unquote(data: bytes) -> bytes:
+    unquoted = unquote_to_bytes(data)
+    if unquoted.isascii():
+        return unquoted
+
+    # Escaped non-ascii bytes are decoded as UTF-8 by unquote(), which the JSON forms rely on,
+    # while unescaped ones are kept as is.
+    if data.isascii():
+        return unquoted.decode("utf-8", "replace").encode("latin-1")
+    return unquote(data.decode("latin-1")).encode("latin-1")
+
+
+def parse_urlencoded(body: bytes) -> tuple[tuple[bytes, bytes], ...]:
+    """Parse an urlencoded body without decoding the fields that don't need it
+
+    Same result as parse_qsl(body.decode("latin-1"), keep_blank_values=True) with the fields encoded back to latin-1.
+
+    Args:
+        body (bytes): The urlencoded body
+
+    Raises:
+        UnicodeEncodeError: An escaped UTF-8 sequence decodes to a character out of the latin-1 range.
+
+    Returns:
+        tuple[tuple[bytes, bytes], ...]: The decoded (key, value) fields
+    """
+    # Spaces are never escaped in the fields, replace them all at once.
+    if b"+" in body:
+        body = body.replace(b"+", b" ")
+
+    fields = []
+    append = fields.append
+    for field in body.split(b"&"):
+        if not field:
+            continue
+
+        key, _, val = field.partition(b"=")
+        if b"%" in field:
+            key = _unquote(key) if b"%" in key else key
+            val = _unquote(val) if b"%" in val else val
+        append((key, val))
+    return tuple(fields)
+
+
 class URLEncodedFormSerializer(FormSerializer):
     def serialize(
         self, deserialized_body: multidict.MultiDict[bytes, bytes], req=...
     ) -> bytes:
         return b"&".join(
-            b"=".join(quote(kv, safe="[]").encode() for kv in field)
-            for field in deserialized_body.fields
+            b"=".join(map(_quote, field)) for field in deserialized_body.fields
         )
 
     def deserialize(self, body: bytes, req=...) -> URLEncodedForm:
+        # urllib.parse.parse_qsl() decodes bytes as ascii, which fails on non-ascii bytes,
+        # and decoding the body as latin-1 to parse it as str would have to copy every field back to bytes.
         try:
-            # XXX: urllib is broken when passing bytes to parse_qsl because it tries to decode it
-            # but doesn't pass the specified encoding and instead the internal one is used (i.e: ascii, which can't decode some bytes)
-            # This should be enough:
-            # fields = urllib.parse.parse_qsl(body)
-
-            # But because urllib is broken we need all of this:
-            # (I may be wrong)
-            decoded = body.decode("latin-1")
-            parsed = parse_qsl(decoded, keep_blank_values=True)
-            fields = (
-                (
-                    key.encode("latin-1"),
-                    val.encode("latin-1"),
-                )
-                for key, val in parsed
-            )
-            return URLEncodedForm(fields)
+            return URLEncodedForm._from_fields(parse_urlencoded(bytes(body)))
         except UnicodeEncodeError as exc:  # pragma: no cover
             print("Query string crashed urrlib parser:", body, file=sys.stderr)
             raise exc
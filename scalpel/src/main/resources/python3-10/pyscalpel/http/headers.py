@@ -9,9 +9,44 @@ from _internal_mitmproxy.http import (
 
 
 from pyscalpel.java.burp.http_header import IHttpHeader, HttpHeader
+from pyscalpel.java.scalpel_types.utils import PythonUtils
 from pyscalpel.encoding import always_bytes, always_str
 
 
+def parse_header_block(block: bytes) -> tuple[tuple[bytes, bytes], ...]:
+    """Parse an HTTP/1 header block, as returned by PythonUtils.toHeaderBlock()
+
+    Args:
+        block (bytes): The header block, one b"name: value\\r\\n" line per header.
+
+    Raises:
+        ValueError: A line has no separator.
+
+    Returns:
+        tuple[tuple[bytes, bytes], ...]: The (name, value) fields
+    """
+    lines = block.split(b"\r\n")
+    if lines[-1] == b"":
+        lines.pop()
+
+    fields = []
+    for line in lines:
+        # Pseudo headers (e.g. :authority) start with a colon.
+        separator = line.find(b": ", 1)
+        if separator == -1:
+            raise ValueError(f"Invalid header line: {line!r}")
+        fields.append((line[:separator], line[separator + 2 :]))
+    return tuple(fields)
+
+
+def _is_block_safe(fields: tuple[tuple[bytes, bytes], ...], block: bytes) -> bool:
+    """Whether the fields can be parsed back unchanged from their header block"""
+    # Every line break has to be a header separator.
+    return block.count(b"\n") == len(fields) == block.count(b"\r") and all(
+        name and b":" not in name[1:] for name, _ in fields
+    )
+
+
 class Headers(MITMProxyHeaders):
     """A wrapper around the MITMProxy Headers.
 
@@ -49,7 +84,12 @@ class Headers(MITMProxyHeaders):
         :return: A Headers with the same headers as the Burp suite HttpHeader array.
         """
 
-        # print(f"burp: {headers}")
+        if PythonUtils is not None:
+            # Fetch every header in a single call instead of two per header.
+            block = PythonUtils.toHeaderBlock(headers)
+            if block is not None:
+                return cls.from_header_block(memoryview(block).cast("B").tobytes())
+
         # Convert the list of Burp IHttpHeaders to a list of tuples: (key, value)
         return cls(
             (
@@ -61,10 +101,23 @@ class Headers(MITMProxyHeaders):
             )
         )
 
+    @classmethod
+    def from_header_block(cls, block: bytes) -> Headers:
+        """Construct an instance of the Headers class from an HTTP/1 header block.
+        :param block: The header block, one b"name: value\\r\\n" line per header.
+        :return: A Headers with the headers of the block.
+        """
+        return cls(parse_header_block(block))
+
     def to_burp(self) -> list[IHttpHeader]:  # pragma: no cover
         """Convert the headers to a Burp suite HttpHeader array.
         :return: A Burp suite HttpHeader array.
         """
+        fields = self.fields
+        block = bytes(self)
+        if PythonUtils is not None and _is_block_safe(fields, block):
+            # Hand every header to Java in a single call.
+            return list(PythonUtils.fromHeaderBlock(PythonUtils.toJavaBytes(block)))
 
         # Convert the list of tuples: (key, value) to a list of Burp IHttpHeaders
         return [
@@ -0,0 +1,192 @@
+"""
+Declarative alternative to the match() hook.
+
+Scripts may declare a `MATCH` constant instead of (or in addition to) a match() hook:
+
+```python
+MATCH = {
+    "hosts": ["*.example.com"],
+    "paths": ["/api/*"],
+    "methods": ["GET", "POST"],
+    "content_types": ["application/json", "text/*"],
+}
+```
+
+The specification is compiled once when the script is loaded,
+    and is also evaluated by Burp before any hook is queued,
+    so out-of-scope traffic never reaches the Python interpreter.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, TypedDict
+
+from pyscalpel.events import MatchEvent
+from pyscalpel.http.flow import Flow
+from pyscalpel.http.mime import get_header_value_without_params
+
+
+class MatchSpec(TypedDict, total=False):
+    """Declarative match() specification
+
+    Every field is optional, a flow matches when it satisfies all the declared fields.
+
+    Fields:
+        hosts: Wildcard patterns matched against the target host (e.g. "*.example.com"), case insensitive
+        paths: Wildcard patterns matched against the request path, query string included (e.g. "/api/*")
+        methods: Accepted request methods (e.g. "GET"), case insensitive
+        content_types: Wildcard patterns matched against the hooked message Content-Type without parameters (e.g. "text/*"), case insensitive
+    """
+
+    hosts: list[str]
+    paths: list[str]
+    methods: list[str]
+    content_types: list[str]
+
+
+MATCH_SPEC_FIELDS = ("hosts", "paths", "methods", "content_types")
+
+# Events where the hooked message is the response, the request otherwise.
+_RESPONSE_EVENTS: set[MatchEvent] = {
+    "response",
+    "on_response",
+    "res_edit_in",
+    "res_edit_out",
+}
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a unix-like wildcard pattern to a regular expression
+
+    Supports `*`, `?`, `[seq]` and `[!seq]` like fnmatch,
+        the result is valid for both Python's re and Java's java.util.regex.
+
+    Args:
+        pattern (str): The wildcard pattern
+
+    Returns:
+        str: The corresponding regular expression, to be matched against the whole string
+    """
+    parts: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        i += 1
+        if char == "*":
+            parts.append(".*")
+        elif char == "?":
+            parts.append(".")
+        elif char == "[":
+            # Same bracket parsing as fnmatch.translate()
+            j = i
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            j = pattern.find("]", j)
+            if j == -1:
+                parts.append(re.escape(char))
+                continue
+
+            seq = pattern[i:j]
+            i = j + 1
+            negate = seq.startswith("!")
+            if negate:
+                seq = seq[1:]
+
+            # Escape everything but ranges, Java gives a meaning to more characters than Python in classes.
+            escaped = "".join(c if c.isalnum() or c == "-" else "\\" + c for c in seq)
+            parts.append(f"[{'^' if negate else ''}{escaped}]")
+        else:
+            parts.append(re.escape(char))
+
+    return "".join(parts)
+
+
+def _join_regexes(regexes: Iterable[str], ignore_case: bool) -> str:
+    joined = "|".join(f"(?:{regex})" for regex in regexes)
+    return f"(?i)(?:{joined})" if ignore_case else f"(?:{joined})"
+
+
+class CompiledMatchSpec:
+    """A MatchSpec compiled to a single regular expression per field"""
+
+    regexes: dict[str, str]
+    """The regular expression of each declared field, shared with the Java side."""
+
+    def __init__(self, spec: MatchSpec):
+        unknown = set(spec) - set(MATCH_SPEC_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown MATCH fields: {', '.join(sorted(unknown))} (expected {', '.join(MATCH_SPEC_FIELDS)})"
+            )
+
+        self.regexes = {}
+        for field, values in spec.items():
+            if values is None:
+                continue
+
+            if isinstance(values, str):
+                values = (values,)
+
+            if field == "methods":
+                regexes = (re.escape(method) for method in values)
+            else:
+                regexes = (glob_to_regex(pattern) for pattern in values)
+
+            self.regexes[field] = _join_regexes(regexes, ignore_case=field != "paths")
+
+        self._patterns = {
+            field: re.compile(regex) for field, regex in self.regexes.items()
+        }
+
+    def _field_matches(self, field: str, value: str) -> bool:
+        pattern = self._patterns.get(field)
+        return pattern is None or pattern.fullmatch(value) is not None
+
+    def matches(self, flow: Flow, event: MatchEvent) -> bool:
+        """Whether the flow satisfies every declared field
+
+        Args:
+            flow (Flow): The hooked flow
+            event (MatchEvent): The hook type, decides which message the Content-Type is read from
+
+        Returns:
+            bool: True if the flow matches the specification
+        """
+        req = flow.request
+        if not self._field_matches("hosts", flow.host):
+            return False
+
+        if not self._field_matches("paths", req.path if req else ""):
+            return False
+
+        if not self._field_matches("methods", req.method if req else ""):
+            return False
+
+        if "content_types" in self._patterns:
+            message = flow.response if event in _RESPONSE_EVENTS else req
+            content_type = (
+                message.headers.get("Content-Type") if message is not None else None
+            )
+            mime = get_header_value_without_params(content_type or "")
+            if not self._field_matches("content_types", mime):
+                return False
+
+        return True
+
+
+def compile_match_spec(spec: MatchSpec) -> CompiledMatchSpec:
+    """Compile a declarative match() specification
+
+    Args:
+        spec (MatchSpec): The specification, usually the MATCH constant of a script
+
+    Raises:
+        ValueError: The specification contains unknown fields
+
+    Returns:
+        CompiledMatchSpec: The compiled specification
+    """
+    return CompiledMatchSpec(spec)
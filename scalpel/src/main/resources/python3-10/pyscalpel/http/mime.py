@@ -1,6 +1,5 @@
 import re
 from urllib.parse import quote as urllibquote
-from requests_toolbelt.multipart.encoder import MultipartEncoder, encode_with
 from typing import Sequence
 
 
@@ -96,6 +95,13 @@ def _split_on_find(content, bound):
     return content[:point], content[point + len(bound) :]
 
 
+# Taken from requests_toolbelt
+def encode_with(string: str | bytes, encoding: str) -> bytes:
+    if isinstance(string, bytes):
+        return string
+    return string.encode(encoding)
+
+
 # Taken from requests_toolbelt
 def extract_boundary(content_type: str, encoding: str) -> bytes:
     ct_info = tuple(x.strip() for x in content_type.split(";"))
@@ -15,7 +15,7 @@ from typing import (
     Mapping,
     TYPE_CHECKING,
 )
-from copy import deepcopy
+from functools import cached_property
 from pyscalpel.java.burp import (
     IHttpRequest,
     HttpRequest,
@@ -23,7 +23,7 @@ from pyscalpel.java.burp import (
     HttpService,
     IByteArray,
 )
-from pyscalpel.burp_utils import get_bytes
+from pyscalpel.burp_utils import get_buffer
 from pyscalpel.java.scalpel_types.utils import PythonUtils
 from pyscalpel.encoding import always_bytes, always_str
 from pyscalpel.http.headers import Headers
@@ -44,6 +44,7 @@ from pyscalpel.http.body import (
     IMPLEMENTED_CONTENT_TYPES,
     ImplementedContentType,
 )
+from pyscalpel.http.body.tracking import get_form_version
 
 from _internal_mitmproxy.coretypes import multidict
 from _internal_mitmproxy.net.http.url import (
@@ -87,26 +88,24 @@ class Request:
     _Content = bytes
     _Path = str
 
-    host: _Host
-    port: _Port
-    method: _Method
-    scheme: _Scheme
-    authority: _Authority
-
-    # Path also includes URI parameters (;), query (?) and fragment (#)
-    # Simply because it is more conveninent to manipulate that way in a pentensting context
-    # It also mimics the way mitmproxy works.
-    path: _Path
-
-    http_version: _HttpVersion
-    _headers: Headers
-    _serializer: FormSerializer | None = None
     _deserialized_content: Any = None
-    _content: _Content | None = None
-    _old_deserialized_content: Any = None
+    _raw_content: _Content | None = None
+    # The form as of the last content update, with its version at that time.
+    _clean_form: Any = None
+    _clean_form_version: int | None = None
+
+    # Path the query was last parsed from, and the parsed query.
+    _query_cache: tuple[_Path, _ParsedQuery] | None = None
     _is_form_initialized: bool = False
     update_content_length: bool = True
 
+    # Set by from_burp(), the fields below are then fetched from Burp on first access.
+    _burp_request: IHttpRequest | None = None
+    _burp_service: IHttpService | None = None
+
+    # Values fetched from Burp, used by to_burp() to detect untouched requests.
+    _burp_fields: dict[str, Any] | None = None
+
     def __init__(
         self,
         method: str,
@@ -119,7 +118,7 @@ class Request:
             Headers | tuple[tuple[bytes, bytes], ...] | Iterable[tuple[bytes, bytes]]
         ),
         authority: str,
-        content: bytes | None,
+        content: bytes | memoryview | None,
     ):
         self.scheme = scheme
         self.host = host
@@ -136,9 +135,157 @@ class Request:
             self.headers.get("Content-Type"), fail_silently=True
         )
 
-        # Initialize old deserialized content to avoid modifying content if it has not been modified
+        # Mark the parsed form as clean to avoid modifying content if it has not been modified
         # (see test_content_do_not_modify_json() in scalpel/src/main/resources/python/pyscalpel/tests/test_request.py)
-        self._old_deserialized_content = deepcopy(self._deserialized_content)
+        self._mark_form_clean()
+
+    def _from_burp_field(self, name: str, value: Any) -> Any:
+        if self._burp_fields is not None:
+            self._burp_fields[name] = value
+        return value
+
+    @cached_property
+    def scheme(self) -> _Scheme:  # pragma: no cover (uses Java API)
+        """The request scheme (http or https)"""
+        service = self._burp_service
+        scheme = "https" if service and service.secure() else "http"
+        return self._from_burp_field("scheme", scheme)
+
+    @cached_property
+    def host(self) -> _Host:  # pragma: no cover (uses Java API)
+        """The target host"""
+        service = self._burp_service
+        return self._from_burp_field("host", service.host() if service else "")
+
+    @cached_property
+    def port(self) -> _Port:  # pragma: no cover (uses Java API)
+        """The target port"""
+        service = self._burp_service
+        return self._from_burp_field("port", service.port() if service else 0)
+
+    @cached_property
+    def method(self) -> _Method:  # pragma: no cover (uses Java API)
+        """The request method (GET,POST,PUT,PATCH, DELETE,TRACE,...)"""
+        return self._from_burp_field(
+            "method", cast(IHttpRequest, self._burp_request).method()
+        )
+
+    @cached_property
+    def path(self) -> _Path:  # pragma: no cover (uses Java API)
+        """The request path
+
+        Path also includes URI parameters (;), query (?) and fragment (#)
+        Simply because it is more conveninent to manipulate that way in a pentensting context
+        It also mimics the way mitmproxy works.
+        """
+        # request.url() gives a relative url for some reason
+        # So we have to parse and unparse to get the full path
+        #   (path + parameters + query + fragment)
+        url = cast(IHttpRequest, self._burp_request).url()
+        _, _, path, parameters, query, fragment = urllib.parse.urlparse(url)
+
+        # Concatenate the path components
+        # Empty parameters,query and fragment are lost in the process
+        # e.g.: http://example.com;?# becomes http://example.com
+        # To use such an URL, the user must set the path directly
+        # To fix this we would need to write our own URL parser, which is a bit overkill for now.
+        path = urllib.parse.urlunparse(("", "", path, parameters, query, fragment))
+        return self._from_burp_field("path", path)
+
+    @cached_property
+    def http_version(self) -> _HttpVersion:  # pragma: no cover (uses Java API)
+        """The HTTP version (e.g. HTTP/1.1)"""
+        version = cast(IHttpRequest, self._burp_request).httpVersion()
+        return self._from_burp_field("http_version", version or "HTTP/1.1")
+
+    @cached_property
+    def authority(self) -> _Authority:  # pragma: no cover (uses Java API)
+        """The request authority (:authority pseudo header or Host header)"""
+        headers = self._headers
+        return self._from_burp_field(
+            "authority", headers.get(":authority") or headers.get("Host") or ""
+        )
+
+    @cached_property
+    def _headers(self) -> Headers:  # pragma: no cover (uses Java API)
+        # Burp will give you lowercased and pseudo headers when using HTTP/2.
+        # https://portswigger.net/burp/documentation/desktop/http2/http2-normalization-in-the-message-editor#sending-requests-without-any-normalization:~:text=are%20converted%20to-,lowercase,-.
+        # https://blog.yaakov.online/http-2-header-casing/
+        headers = Headers.from_burp(cast(IHttpRequest, self._burp_request).headers())
+        self._from_burp_field("_headers", headers.fields)
+        return headers
+
+    def _is_burp_body_absent(self, length: int) -> bool:
+        # Burp gives a 0 length byte array body even when it doesn't exist, instead of null.
+        # Empty but existing bodies without a Content-Length header are lost in the process.
+        return not length and not self._headers.get("Content-Length")
+
+    @cached_property
+    def _content_buffer(self) -> memoryview | None:
+        if self._burp_request is None:
+            return None
+
+        body: memoryview | None = get_buffer(self._burp_request.body())
+        if self._is_burp_body_absent(len(body)):
+            body = None
+
+        return self._from_burp_field("_content", body)
+
+    @cached_property
+    def _serializer(self) -> FormSerializer | None:
+        if self._burp_request is None:
+            return None
+
+        # Deferred from __init__ so the body is only parsed when a form is used.
+        self.__dict__["_serializer"] = None
+        self.update_serializer_from_content_type(
+            self.headers.get("Content-Type"), fail_silently=True
+        )
+        self._mark_form_clean()
+        return self.__dict__["_serializer"]
+
+    def _is_untouched(self) -> bool:
+        """Whether this request was built by from_burp() and left unmodified since"""
+        fields = self._burp_fields
+        if fields is None:
+            return False
+
+        # Fields that were never accessed cannot have been modified.
+        loaded = self.__dict__
+        for name in ("scheme", "host", "port", "method", "path", "http_version"):
+            if name in loaded and (name not in fields or loaded[name] != fields[name]):
+                return False
+
+        if "_headers" in loaded and self._headers.fields != fields.get("_headers"):
+            return False
+
+        if "_content_buffer" in loaded or "_raw_content" in loaded:
+            if "_content" not in fields:
+                return False
+
+            original = fields["_content"]
+            buffer = loaded.get("_content_buffer")
+            if buffer is None and self._raw_content != original:
+                return False
+            if buffer is not None and buffer is not original:
+                return False
+
+        return not (
+            "_serializer" in loaded and self._has_deserialized_content_changed()
+        )
+
+    def _get_content_length(self) -> int | None:
+        if self._burp_request is not None and "_content_buffer" not in self.__dict__:
+            # Ask Burp for the body length instead of fetching the body.
+            length = self._burp_request.body().length()
+            return None if self._is_burp_body_absent(length) else length
+
+        content = (
+            self._content_buffer
+            if self._content_buffer is not None
+            else self._raw_content
+        )
+        return None if content is None else len(content)
 
     def _del_header(self, header: str) -> bool:
         if header in self._headers.keys():
@@ -147,12 +294,32 @@ class Request:
 
         return False
 
+    @property
+    def _content(self) -> _Content | None:
+        # Bodies coming from Burp are wrapped as a memoryview over the Java buffer
+        #   and only copied to bytes when something actually reads them.
+        if self._content_buffer is not None:
+            self._raw_content = self._content_buffer.tobytes()
+            self._content_buffer = None
+
+        return self._raw_content
+
+    @_content.setter
+    def _content(self, value: _Content | memoryview | None):
+        if isinstance(value, memoryview):
+            self._content_buffer = value
+            self._raw_content = None
+        else:
+            self._content_buffer = None
+            self._raw_content = value
+
     def _update_content_length(self) -> None:
         if self.update_content_length:
-            if self._content is None:
+            # Measure the body without materializing it.
+            length = self._get_content_length()
+            if length is None:
                 self._del_header("Content-Length")
             else:
-                length = len(cast(bytes, self._content))
                 self._headers["Content-Length"] = str(length)
 
     @staticmethod
@@ -255,53 +422,18 @@ class Request:
         cls, request: IHttpRequest, service: IHttpService | None = None
     ) -> Request:  # pragma: no cover (uses Java API)
         """Construct an instance of the Request class from a Burp suite HttpRequest.
+
+        Fields are fetched from the Burp request on first access,
+            so untouched fields are never converted.
+
         :param request: The Burp suite HttpRequest to convert.
         :return: A Request with the same data as the Burp suite HttpRequest.
         """
-        service = service or request.httpService()
-        body = get_bytes(request.body())
-
-        # Burp will give you lowercased and pseudo headers when using HTTP/2.
-        # https://portswigger.net/burp/documentation/desktop/http2/http2-normalization-in-the-message-editor#sending-requests-without-any-normalization:~:text=are%20converted%20to-,lowercase,-.
-        # https://blog.yaakov.online/http-2-header-casing/
-        headers: Headers = Headers.from_burp(request.headers())
-
-        # Burp gives a 0 length byte array body even when it doesn't exist, instead of null.
-        # Empty but existing bodies without a Content-Length header are lost in the process.
-        if not body and not headers.get("Content-Length"):
-            body = None
-
-        # request.url() gives a relative url for some reason
-        # So we have to parse and unparse to get the full path
-        #   (path + parameters + query + fragment)
-        _, _, path, parameters, query, fragment = urllib.parse.urlparse(request.url())
-
-        # Concatenate the path components
-        # Empty parameters,query and fragment are lost in the process
-        # e.g.: http://example.com;?# becomes http://example.com
-        # To use such an URL, the user must set the path directly
-        # To fix this we would need to write our own URL parser, which is a bit overkill for now.
-        path = urllib.parse.urlunparse(("", "", path, parameters, query, fragment))
-
-        host = ""
-        port = 0
-        scheme = "http"
-        if service:
-            host = service.host()
-            port = service.port()
-            scheme = "https" if service.secure() else "http"
-
-        return cls(
-            method=request.method(),
-            scheme=scheme,
-            host=host,
-            port=port,
-            path=path,
-            http_version=request.httpVersion() or "HTTP/1.1",
-            headers=headers,
-            authority=headers.get(":authority") or headers.get("Host") or "",
-            content=body,
-        )
+        req = cls.__new__(cls)
+        req._burp_request = request
+        req._burp_service = service or request.httpService()
+        req._burp_fields = {}
+        return req
 
     def __bytes__(self) -> bytes:
         """Convert the request to bytes
@@ -334,16 +466,29 @@ class Request:
             b"%s: %s\r\n" % (key, val) for key, val in mapped_headers
         )
 
-        # Set a default value for the request's body. (None -> b"")
-        body = self.content or b""
+        body = self._get_serialized_body()
+
+        # Construct the whole request and return it, the body is copied once.
+        return b"".join((first_line, headers_lines, b"\r\n", body))
 
-        # Construct the whole request and return it.
-        return first_line + headers_lines + b"\r\n" + body
+    def _get_serialized_body(self) -> bytes | memoryview:
+        # A body from Burp that was never read nor parsed as a form is serialized from its buffer,
+        #   instead of being copied to bytes first.
+        if "_serializer" not in self.__dict__ and self._content_buffer is not None:
+            self._update_content_length()
+            return self._content_buffer
+
+        # Set a default value for the request's body. (None -> b"")
+        return self.content or b""
 
     def to_burp(self) -> IHttpRequest:  # pragma: no cover
         """Convert the request to a Burp suite :class:`IHttpRequest`.
         :return: The request as a Burp suite :class:`IHttpRequest`.
         """
+        # Unmodified requests are handed back as is instead of being reserialized.
+        if self._is_untouched():
+            return cast(IHttpRequest, self._burp_request)
+
         # Convert the request to a Burp ByteArray.
         request_byte_array: IByteArray = PythonUtils.toByteArray(bytes(self))
 
@@ -415,8 +560,16 @@ class Request:
         )
 
     def _get_query(self) -> _ParsedQuery:
+        # The query views parse the query on every access, reuse the last result until the path changes.
+        path = self.path
+        cache = self._query_cache
+        if cache is not None and cache[0] == path:
+            return cache[1]
+
         query = urllib.parse.urlparse(self.url).query
-        return tuple(url_decode(query))
+        parsed = tuple(url_decode(query))
+        self._query_cache = (path, parsed)
+        return parsed
 
     def _set_query(self, query_data: Sequence[_QueryParam]):
         query = url_encode(query_data)
@@ -438,8 +591,21 @@ class Request:
     def query(self, value: Sequence[tuple[str, str]]):
         self._set_query(value)
 
+    def _mark_form_clean(self):
+        self._clean_form = self._deserialized_content
+        self._clean_form_version = get_form_version(self._deserialized_content)
+
     def _has_deserialized_content_changed(self) -> bool:
-        return self._deserialized_content != self._old_deserialized_content
+        form = self._deserialized_content
+        if form is not self._clean_form:
+            return True
+
+        if form is None:
+            return False
+
+        # Forms that don't track their mutations are always considered modified.
+        version = get_form_version(form)
+        return version is None or version != self._clean_form_version
 
     def _serialize_content(self):
         if self._serializer is None:
@@ -460,7 +626,7 @@ class Request:
 
         # Update the parsed form
         self._deserialized_content = self._serializer.deserialize(serialized, self)
-        self._old_deserialized_content = deepcopy(self._deserialized_content)
+        self._mark_form_clean()
 
         # Set the raw content directly
         self._content = serialized
@@ -480,11 +646,12 @@ class Request:
 
         if deserialized is None:
             self._deserialized_content = None
-            self._old_deserialized_content = None
+            self._mark_form_clean()
             return
 
         self._deserialized_content = deserialized
         self._content = self._serializer.serialize(deserialized, self)
+        self._mark_form_clean()
         self._update_content_length()
 
     @property
@@ -496,7 +663,6 @@ class Request:
         """
         if self._serializer and self._has_deserialized_content_changed():
             self._update_deserialized_content(self._deserialized_content)
-            self._old_deserialized_content = deepcopy(self._deserialized_content)
 
         self._update_content_length()
 
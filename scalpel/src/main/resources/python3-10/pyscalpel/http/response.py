@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import time
-from typing import Literal, cast
+from functools import cached_property
+from typing import Any, Literal, cast
 from _internal_mitmproxy.http import (
     Response as MITMProxyResponse,
+    ResponseData,
 )
 
 from pyscalpel.java.burp.http_response import IHttpResponse, HttpResponse
-from pyscalpel.burp_utils import get_bytes
+from pyscalpel.burp_utils import get_buffer
 from pyscalpel.java.burp.byte_array import IByteArray
 from pyscalpel.java.scalpel_types.utils import PythonUtils
 from pyscalpel.encoding import always_bytes
@@ -36,13 +38,19 @@ class Response(MITMProxyResponse):
     port: int = 0
     request: Request | None = None
 
+    # Set by from_burp(), the message data is then fetched from Burp on first access.
+    _burp_response: IHttpResponse | None = None
+
+    # Values fetched from Burp, used by to_burp() to detect untouched responses.
+    _burp_fields: dict[str, Any] | None = None
+
     def __init__(
         self,
         http_version: bytes,
         status_code: int,
         reason: bytes,
         headers: Headers | tuple[tuple[bytes, bytes], ...],
-        content: bytes | None,
+        content: bytes | memoryview | None,
         trailers: Headers | tuple[tuple[bytes, bytes], ...] | None,
         scheme: Literal["http", "https"] = "http",
         host: str = "",
@@ -54,7 +62,7 @@ class Response(MITMProxyResponse):
             status_code,
             reason,
             headers,
-            content,
+            None if isinstance(content, memoryview) else content,
             trailers,
             timestamp_start=time.time(),
             timestamp_end=time.time(),
@@ -63,6 +71,90 @@ class Response(MITMProxyResponse):
         self.host = host
         self.port = port
 
+        if isinstance(content, memoryview):
+            self._content_buffer = content
+
+    @cached_property
+    def data(self) -> ResponseData:  # pragma: no cover (uses Java API)
+        response = cast(IHttpResponse, self._burp_response)
+        now = time.time()
+        data = ResponseData(
+            http_version=always_bytes(response.httpVersion() or "HTTP/1.1"),
+            status_code=response.statusCode(),
+            reason=always_bytes(response.reasonPhrase() or b""),
+            headers=Headers.from_burp(response.headers()),
+            content=None,
+            trailers=None,
+            timestamp_start=now,
+            timestamp_end=now,
+        )
+        if self._burp_fields is not None:
+            self._burp_fields["data"] = self._get_message_fields(data)
+        return data
+
+    @cached_property
+    def _content_buffer(self) -> memoryview | None:
+        if self._burp_response is None:
+            return None
+
+        body = self._burp_response.body()
+        buffer = get_buffer(cast(IByteArray, body)) if body else memoryview(b"")
+        if self._burp_fields is not None:
+            self._burp_fields["content"] = buffer
+        return buffer
+
+    @staticmethod
+    def _get_message_fields(data: ResponseData) -> tuple:
+        return (
+            data.http_version,
+            data.status_code,
+            data.reason,
+            data.headers.fields,
+            data.trailers,
+        )
+
+    def _is_untouched(self) -> bool:
+        """Whether this response was built by from_burp() and left unmodified since"""
+        fields = self._burp_fields
+        if fields is None:
+            return False
+
+        # Data that was never accessed cannot have been modified.
+        loaded = self.__dict__
+        if "data" in loaded and self._get_message_fields(self.data) != fields["data"]:
+            return False
+
+        if "_content_buffer" not in loaded:
+            return "data" not in loaded or self.data.content is None
+
+        if "content" not in fields:
+            return False
+
+        return (
+            loaded["_content_buffer"] is fields["content"]
+            or self.data.content == fields["content"]
+        )
+
+    @property
+    def raw_content(self) -> bytes | None:
+        # Bodies coming from Burp are wrapped as a memoryview over the Java buffer
+        #   and only copied to bytes when something actually reads them.
+        if self._content_buffer is not None:
+            self.data.content = self._content_buffer.tobytes()
+            self._content_buffer = None
+
+        return self.data.content
+
+    @raw_content.setter
+    def raw_content(self, content: bytes | None) -> None:
+        self._content_buffer = None
+        self.data.content = content
+
+    def get_state(self):
+        # Materialize the body before handing the underlying data out.
+        _ = self.raw_content
+        return super().get_state()
+
     @classmethod
     # https://docs.mitmproxy.org/stable/api/mitmproxy/http.html#Response
     # link to mitmproxy documentation
@@ -76,7 +168,7 @@ class Response(MITMProxyResponse):
             response.status_code,
             always_bytes(response.reason),
             Headers.from_mitmproxy(response.headers),
-            response.content,
+            response.raw_content,
             Headers.from_mitmproxy(response.trailers) if response.trailers else None,
         )
 
@@ -88,15 +180,10 @@ class Response(MITMProxyResponse):
         request: IHttpRequest | None = None,
     ) -> Response:
         """Construct an instance of the Response class from a Burp suite :class:`IHttpResponse`."""
-        body = get_bytes(cast(IByteArray, response.body())) if response.body() else b""
-        scalpel_response = cls(
-            always_bytes(response.httpVersion() or "HTTP/1.1"),
-            response.statusCode(),
-            always_bytes(response.reasonPhrase() or b""),
-            Headers.from_burp(response.headers()),
-            body,
-            None,
-        )
+        # The message data and body are fetched from Burp on first access.
+        scalpel_response = cls.__new__(cls)
+        scalpel_response._burp_response = response
+        scalpel_response._burp_fields = {}
 
         burp_request: IHttpRequest | None = request
         if burp_request is None:
@@ -140,13 +227,23 @@ class Response(MITMProxyResponse):
         )
 
         # Set a default value for the response's body. (None -> b"")
-        body = self.content or b""
+        # The body is sent as is, still encoded according to Content-Encoding.
+        # A body from Burp that was never read is serialized from its buffer instead of being copied to bytes first.
+        body = (
+            self._content_buffer
+            if self._content_buffer is not None
+            else self.raw_content or b""
+        )
 
-        # Build the whole response and return it.
-        return first_line + headers_lines + b"\r\n" + body
+        # Build the whole response and return it, the body is copied once.
+        return b"".join((first_line, headers_lines, b"\r\n", body))
 
     def to_burp(self) -> IHttpResponse:  # pragma: no cover (uses Java API)
         """Convert the response to a Burp suite :class:`IHttpResponse`."""
+        # Unmodified responses are handed back as is instead of being reserialized.
+        if self._is_untouched():
+            return cast(IHttpResponse, self._burp_response)
+
         response_byte_array: IByteArray = PythonUtils.toByteArray(bytes(self))
 
         return HttpResponse.httpResponse(response_byte_array)
@@ -184,6 +281,13 @@ class Response(MITMProxyResponse):
         # Use the base/inherited make method to construct a MITMProxy response.
         mitmproxy_res = MITMProxyResponse.make(status_code, content, headers)
 
+        # The content is the body as sent, mitmproxy encoded it again according to Content-Encoding.
+        mitmproxy_res.raw_content = mitmproxy_res.get_content(strict=False)
+        if "transfer-encoding" not in mitmproxy_res.headers:
+            mitmproxy_res.headers["content-length"] = str(
+                len(mitmproxy_res.raw_content or b"")
+            )
+
         res = cls.from_mitmproxy(mitmproxy_res)
         res.host = host
         res.scheme = scheme
@@ -1,4 +1,15 @@
-from fnmatch import fnmatch
+import os
+import re
+from fnmatch import translate
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern:
+    # Same semantics as fnmatch() but a single regex for all the patterns, compiled once.
+    return re.compile(
+        "|".join(f"(?:{translate(os.path.normcase(pattern))})" for pattern in patterns)
+    )
 
 
 def match_patterns(to_match: str, *patterns: str) -> bool:
@@ -11,10 +22,9 @@ def match_patterns(to_match: str, *patterns: str) -> bool:
     Returns:
         bool: The match result (True if at least one pattern matches, else False)
     """
-    for pattern in patterns:
-        if fnmatch(to_match, pattern):
-            return True
-    return False
+    if not patterns:
+        return False
+    return _compile_patterns(patterns).match(os.path.normcase(to_match)) is not None
 
 
 def host_is(host: str, *patterns: str) -> bool:
@@ -26,3 +26,6 @@ class Context(TypedDict):
 
     venv: str
     """The venv the script was loaded in"""
+
+    hook_stats: Any
+    """The Java object collecting the hook latency histograms (shown in the "Hook stats" tab)"""
@@ -7,6 +7,7 @@ from pyscalpel.java.bytes import JavaBytes
 from pyscalpel.java.burp.http_request import IHttpRequest
 from pyscalpel.java.burp.http_response import IHttpResponse
 from pyscalpel.java.burp.byte_array import IByteArray
+from pyscalpel.java.burp.http_header import IHttpHeader
 from pyscalpel.java.import_java import import_java
 
 RequestOrResponse = TypeVar("RequestOrResponse", bound=IHttpRequest | IHttpResponse)
@@ -27,6 +28,18 @@ class IPythonUtils(JavaObject):  # pragma: no cover
     def toByteArray(self, python_bytes: bytes | list[int] | bytearray) -> IByteArray:
         pass
 
+    @abstractmethod
+    def toDirectBuffer(self, byte_array: IByteArray) -> memoryview:
+        pass
+
+    @abstractmethod
+    def toHeaderBlock(self, headers: list[IHttpHeader]) -> memoryview | None:
+        pass
+
+    @abstractmethod
+    def fromHeaderBlock(self, block: JavaBytes) -> list[IHttpHeader]:
+        pass
+
     @abstractmethod
     def getClassName(self, msg: JavaObject) -> str:
         pass
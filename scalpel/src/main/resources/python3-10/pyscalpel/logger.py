@@ -1,4 +1,7 @@
 import sys
+from time import monotonic
+from typing import Any
+
 from pyscalpel.java import import_java
 
 
@@ -64,8 +67,80 @@ class Logger:  # pragma: no cover
         print(f"(default): {msg}", file=sys.stderr)
 
 
+# Values of lexfo.scalpel.ScalpelLogger.Level
+TRACE = 1
+DEBUG = 2
+INFO = 3
+WARN = 4
+ERROR = 5
+FATAL = 6
+ALL = 7
+
+LEVEL_REFRESH_INTERVAL = 1.0
+"""How long the configured level is cached, in seconds."""
+
+
+class LevelGatedLogger(Logger):
+    """Forwards the messages enabled by the configured level to the Java logger.
+
+    The level is cached Python side, so disabled messages are neither formatted nor sent to Java.
+    Messages are formatted lazily with the %-style arguments, e.g: `logger.trace("Got %d requests", len(reqs))`
+    """
+
+    __slots__ = ("_java_logger", "_level", "_refresh_at")
+
+    def __init__(self, java_logger: Any):
+        self._java_logger = java_logger
+        self._level = TRACE
+        self._refresh_at = 0.0
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether messages of the given level are logged
+
+        Args:
+            level (int): The level value (TRACE, DEBUG, INFO, ...)
+
+        Returns:
+            bool: True if the configured level allows it
+        """
+        now = monotonic()
+        if now >= self._refresh_at:
+            self._level = self._java_logger.getLogLevelValue()
+            self._refresh_at = now + LEVEL_REFRESH_INTERVAL
+        return level >= self._level
+
+    def all(self, msg: str, *args: Any):
+        self._java_logger.all(msg % args if args else msg)
+
+    def trace(self, msg: str, *args: Any):
+        if self.is_enabled_for(TRACE):
+            self._java_logger.trace(msg % args if args else msg)
+
+    def debug(self, msg: str, *args: Any):
+        if self.is_enabled_for(DEBUG):
+            self._java_logger.debug(msg % args if args else msg)
+
+    def info(self, msg: str, *args: Any):
+        if self.is_enabled_for(INFO):
+            self._java_logger.info(msg % args if args else msg)
+
+    def warn(self, msg: str, *args: Any):
+        if self.is_enabled_for(WARN):
+            self._java_logger.warn(msg % args if args else msg)
+
+    def fatal(self, msg: str, *args: Any):
+        self._java_logger.fatal(msg % args if args else msg)
+
+    def error(self, msg: str, *args: Any):
+        # Errors are always displayed, whatever the configured level.
+        self._java_logger.error(msg % args if args else msg)
+
+
 try:
-    logger: Logger = import_java("lexfo.scalpel", "ScalpelLogger", Logger)
+    _java_logger = import_java("lexfo.scalpel", "ScalpelLogger")
+    logger: Logger = (
+        LevelGatedLogger(_java_logger) if _java_logger is not None else None  # type: ignore
+    )
 except ImportError as ex:  # pragma: no cover
     logger: Logger = Logger()
     logger.error("(default): Couldn't import logger")
@@ -0,0 +1,56 @@
+"""
+Measures how long the edit_out wrappers take to turn the editor content into bytes, against the body size.
+
+The Java side of the conversion is measured by ./gradlew editorContentBenchmark.
+
+- list: the previous path, the int[] from PythonUtils.toPythonBytes() is received as a list of ints,
+    converted once for the Flow and once for the hook.
+- buffer: the direct buffer from PythonUtils.toDirectBuffer() is received as a memoryview, copied once.
+
+Usage (from the python3-10 directory):
+    _DO_NOT_IMPORT_JAVA=1 python3 -m pyscalpel.tests.bench_edit_out [runs]
+"""
+
+import random
+from typing import Any, Callable
+
+from pyscalpel.burp_utils import to_bytes
+from pyscalpel.tests.bench_utils import int_arg, measure, report
+
+SIZES = {
+    "1 KiB": 1024,
+    "64 KiB": 64 * 1024,
+    "2 MiB": 2 * 1024 * 1024,
+    "8 MiB": 8 * 1024 * 1024,
+}
+
+
+def from_list(text: list[int]) -> Callable[[], Any]:
+    def run() -> None:
+        bytes(text)
+        bytes(text)
+
+    return run
+
+
+def from_buffer(text: memoryview) -> Callable[[], Any]:
+    def run() -> None:
+        to_bytes(text)
+
+    return run
+
+
+def main(runs: int) -> None:
+    rng = random.Random(1234)
+    for name, size in SIZES.items():
+        content = rng.randbytes(size)
+        cases = {
+            "list": from_list(list(content)),
+            "buffer": from_buffer(memoryview(bytearray(content))),
+        }
+        for kind, func in cases.items():
+            report(f"{name:<7} {kind:<7}", measure(func, runs), f"{runs} runs")
+
+
+if __name__ == "__main__":
+    main(int_arg(1, 10))
@@ -0,0 +1,105 @@
+"""
+Measures how long the JSON form operations take on representative API payloads, for every installed backend.
+
+Usage (from the python3-10 directory):
+    _DO_NOT_IMPORT_JAVA=1 python3 -m pyscalpel.tests.bench_json [runs]
+"""
+
+import json
+from typing import Any, Callable
+
+from pyscalpel.http.body import json_backend
+from pyscalpel.http.body.json_form import JSONFormSerializer
+from pyscalpel.tests.bench_utils import int_arg, measure, report
+
+
+def graphql_response(edges: int) -> dict[str, Any]:
+    """A paginated GraphQL connection, deeply nested with small values"""
+    return {
+        "data": {
+            "repository": {
+                "issues": {
+                    "totalCount": edges,
+                    "pageInfo": {"hasNextPage": True, "endCursor": "Y3Vyc29yOnYyOpK5"},
+                    "edges": [
+                        {
+                            "cursor": f"Y3Vyc29yOnYyOpK5{i}",
+                            "node": {
+                                "id": f"I_kwDOAbc{i}",
+                                "number": i,
+                                "title": f"Issue number {i} with a descriptive title",
+                                "state": "OPEN" if i % 3 else "CLOSED",
+                                "author": {"login": f"user{i % 50}", "url": None},
+                                "labels": {
+                                    "nodes": [{"name": "bug"}, {"name": "help wanted"}]
+                                },
+                                "reactions": {"totalCount": i % 7},
+                            },
+                        }
+                        for i in range(edges)
+                    ],
+                }
+            }
+        }
+    }
+
+
+def rest_listing(items: int) -> dict[str, Any]:
+    """A flat REST collection, wide records with longer strings"""
+    return {
+        "count": items,
+        "results": [
+            {
+                "id": i,
+                "uuid": f"6f1c2d3e-4b5a-6978-8a9b-{i:012d}",
+                "email": f"user{i}@example.com",
+                "score": i * 1.5,
+                "active": bool(i % 2),
+                "bio": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+                "tags": ["alpha", "beta", "gamma"],
+            }
+            for i in range(items)
+        ],
+    }
+
+
+PAYLOADS = {
+    "graphql 1k": json.dumps(graphql_response(1_000)).encode(),
+    "graphql 10k": json.dumps(graphql_response(10_000)).encode(),
+    "rest 10k": json.dumps(rest_listing(10_000)).encode(),
+}
+
+
+def main(runs: int) -> None:
+    serializer = JSONFormSerializer()
+    for backend in json_backend.BACKENDS:
+        try:
+            json_backend.select_backend(backend)
+        except ImportError:
+            print(f"{backend}: not installed")
+            continue
+
+        for name, body in PAYLOADS.items():
+            form = serializer.deserialize(body)
+            assert form is not None
+            exported = serializer.export_form(form)
+
+            steps: dict[str, Callable[[], Any]] = {
+                "deserialize": lambda: serializer.deserialize(body),
+                "serialize": lambda: serializer.serialize(form),
+            }
+            # The qs conversions are orders of magnitude slower, keep them to the smallest payload.
+            if len(body) < 1024 * 1024:
+                steps["export_form"] = lambda: serializer.export_form(form)
+                steps["import_form"] = lambda: serializer.import_form(exported)
+
+            for step, func in steps.items():
+                report(
+                    f"{backend:<7} {name:<12} {step:<12}",
+                    measure(func, runs),
+                    f"{len(body) // 1024} KiB, {runs} runs",
+                )
+
+
+if __name__ == "__main__":
+    main(int_arg(1, 10))
@@ -0,0 +1,90 @@
+"""
+Measures how long header and form accesses take with the scanning MultiDict and the IndexedMultiDict,
+and with the Headers and URLEncodedForm built on the latter.
+
+Usage (from the python3-10 directory):
+    _DO_NOT_IMPORT_JAVA=1 python3 -m pyscalpel.tests.bench_multidict [runs]
+"""
+
+from typing import Any, Callable
+
+from _internal_mitmproxy.coretypes import multidict
+from pyscalpel.http.body.urlencoded import URLEncodedForm
+from pyscalpel.http.headers import Headers
+from pyscalpel.tests.bench_utils import int_arg, measure, report
+
+
+class ScanningHeaders(multidict.MultiDict):
+    """Case-insensitive MultiDict, scanning its fields on every access, as Headers did"""
+
+    @staticmethod
+    def _kconv(key):
+        return key.lower()
+
+
+class IndexedHeaders(multidict.IndexedMultiDict):
+    """Case-insensitive IndexedMultiDict"""
+
+    @staticmethod
+    def _kconv(key):
+        return key.lower()
+
+
+def wide_headers(cls: type, count: int) -> Callable[[], Any]:
+    """A hook reading and rewriting every header of a wide request"""
+    fields = [(b"X-Header-%d" % i, b"value %d" % i) for i in range(count)]
+
+    def run() -> None:
+        headers = cls(fields)
+        for i in range(count):
+            name = b"x-header-%d" % i
+            headers[name] = headers[name]
+        headers.add(b"X-Added", b"1")
+        assert b"Host" not in headers
+
+    return run
+
+
+def large_form(cls: type, count: int) -> Callable[[], Any]:
+    """A hook reading and rewriting every field of a large form"""
+    fields = [(b"field%d" % i, b"value%d" % i) for i in range(count)]
+
+    def run() -> None:
+        form = cls(fields)
+        for i in range(count):
+            key = b"field%d" % i
+            form[key] = form[key] + b"!"
+
+    return run
+
+
+def main(runs: int) -> None:
+    cases = {
+        "headers 50": (wide_headers, 50),
+        "headers 1k": (wide_headers, 1_000),
+        "form 100": (large_form, 100),
+        "form 5k": (large_form, 5_000),
+    }
+    implementations = {
+        wide_headers: (
+            ("scanning", ScanningHeaders),
+            ("indexed", IndexedHeaders),
+            ("Headers", Headers),
+        ),
+        large_form: (
+            ("scanning", multidict.MultiDict),
+            ("indexed", multidict.IndexedMultiDict),
+            ("form", URLEncodedForm),
+        ),
+    }
+    for name, (make_case, count) in cases.items():
+        for kind, cls in implementations[make_case]:
+            report(
+                f"{name:<11} {kind:<9}",
+                measure(make_case(cls, count), runs),
+                f"{runs} runs",
+            )
+
+
+if __name__ == "__main__":
+    main(int_arg(1, 10))
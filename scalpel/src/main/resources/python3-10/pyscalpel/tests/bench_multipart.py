@@ -0,0 +1,56 @@
+"""
+Measures how long parsing and serializing multipart forms takes.
+
+Two shapes are measured: a form with many small fields, and a form with a single huge file.
+
+Usage (from the python3-10 directory):
+    _DO_NOT_IMPORT_JAVA=1 python3 -m pyscalpel.tests.bench_multipart [runs]
+"""
+
+import os
+
+from pyscalpel.http.body.multipart import MultiPartForm, MultiPartFormField
+from pyscalpel.tests.bench_utils import int_arg, measure, report
+
+CONTENT_TYPE = "multipart/form-data; boundary=----BenchBoundary"
+
+
+def make_form(fields: list[MultiPartFormField]) -> bytes:
+    return bytes(MultiPartForm(fields, CONTENT_TYPE))
+
+
+FORMS = {
+    "many fields": make_form(
+        [
+            MultiPartFormField.make(f"field{i}", body=str(i).encode())
+            for i in range(10_000)
+        ]
+    ),
+    "huge file": make_form(
+        [
+            MultiPartFormField.make("name", body=b"value"),
+            MultiPartFormField.make(
+                "file", filename="file.bin", body=os.urandom(64 * 1024 * 1024)
+            ),
+        ]
+    ),
+}
+
+
+def main(runs: int) -> None:
+    for name, body in FORMS.items():
+        form = MultiPartForm.from_bytes(body, CONTENT_TYPE)
+        steps = {
+            "parse": lambda: MultiPartForm.from_bytes(body, CONTENT_TYPE),
+            "serialize": lambda: bytes(form),
+        }
+        for step, func in steps.items():
+            report(
+                f"{name:<12} {step:<10}",
+                measure(func, runs),
+                f"{len(body) // 1024} KiB, {runs} runs",
+            )
+
+
+if __name__ == "__main__":
+    main(int_arg(1, 10))
@@ -0,0 +1,50 @@
+"""
+Measures how long a fresh interpreter takes to import pyscalpel.
+
+Every Scalpel worker (and every evalAndCaptureOutput() call) starts a new interpreter,
+so the import time is paid once per interpreter.
+
+Usage (from the python3-10 directory):
+    python3 pyscalpel/tests/bench_startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import pyscalpel": "import pyscalpel",
+    "import messages": "from pyscalpel import Request, Response, Flow",
+    "parse a form": "from pyscalpel import Request; Request.make('POST', 'http://localhost', b'a=1', {'Content-Type': 'application/x-www-form-urlencoded'}).form",
+}
+
+TIMER = (
+    "import time; _start = time.perf_counter(); {}; print(time.perf_counter() - _start)"
+)
+
+
+def measure(statement: str, runs: int) -> list[float]:
+    """Runs the statement in `runs` fresh interpreters and returns the elapsed times in seconds."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, _DO_NOT_IMPORT_JAVA="1")
+    return [
+        float(
+            subprocess.check_output(
+                [sys.executable, "-c", TIMER.format(statement)], cwd=root, env=env
+            )
+        )
+        for _ in range(runs)
+    ]
+
+
+def main(runs: int) -> None:
+    for name, statement in STATEMENTS.items():
+        times = [t * 1000 for t in measure(statement, runs)]
+        print(
+            f"{name:<16} min {min(times):7.2f} ms   median {statistics.median(times):7.2f} ms   ({runs} runs)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
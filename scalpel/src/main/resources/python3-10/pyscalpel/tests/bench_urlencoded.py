@@ -0,0 +1,67 @@
+"""
+Measures how long the urlencoded form and query string operations take on representative payloads.
+
+Usage (from the python3-10 directory):
+    _DO_NOT_IMPORT_JAVA=1 python3 -m pyscalpel.tests.bench_urlencoded [runs]
+"""
+
+from typing import Any, Callable
+
+from pyscalpel.http.body.urlencoded import URLEncodedFormSerializer
+from pyscalpel.http.headers import Headers
+from pyscalpel.http.request import Request
+from pyscalpel.tests.bench_utils import int_arg, measure, report
+
+
+def login_form(fields: int) -> bytes:
+    """A form with short plain values, as most HTML forms"""
+    return b"&".join(b"field%d=value%d" % (i, i) for i in range(fields))
+
+
+def encoded_form(fields: int) -> bytes:
+    """A form with escaped values, as forms holding tokens or JSON"""
+    return b"&".join(
+        b"data[%d]=%%7B%%22token%%22%%3A%%22abc%%2Bdef%%3D%%3D%%22%%7D+%%C3%%A9" % i
+        for i in range(fields)
+    )
+
+
+PAYLOADS = {
+    "plain 10": login_form(10),
+    "plain 10k": login_form(10_000),
+    "encoded 10k": encoded_form(10_000),
+}
+
+
+def query_reads(query: bytes, reads: int) -> Callable[[], Any]:
+    """Reads a query string parameter `reads` times, as hooks do through req.query"""
+    req = Request.make("GET", "http://example.com/?" + query.decode())
+
+    def read() -> None:
+        for _ in range(reads):
+            req.query["field0"]
+
+    return read
+
+
+def main(runs: int) -> None:
+    serializer = URLEncodedFormSerializer()
+    for name, body in PAYLOADS.items():
+        form = serializer.deserialize(body)
+        steps: dict[str, Callable[[], Any]] = {
+            "deserialize": lambda: serializer.deserialize(body),
+            "serialize": lambda: serializer.serialize(form),
+        }
+        if name.startswith("plain"):
+            steps["query x100"] = query_reads(body, 100)
+
+        for step, func in steps.items():
+            report(
+                f"{name:<12} {step:<12}",
+                measure(func, runs),
+                f"{len(body) // 1024} KiB, {runs} runs",
+            )
+
+
+if __name__ == "__main__":
+    main(int_arg(1, 10))
@@ -0,0 +1,31 @@
+"""
+Helpers shared by the bench_*.py and qs/bench.py benchmarks.
+"""
+
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+
+def measure(func: Callable[[], Any], runs: int) -> list[float]:
+    """Calls func `runs` times and returns the elapsed times in seconds."""
+    times: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(label: str, times: list[float], details: str) -> None:
+    """Prints the min and median of the elapsed times in milliseconds."""
+    ms = [t * 1000 for t in times]
+    print(
+        f"{label}   min {min(ms):9.3f} ms   median {statistics.median(ms):9.3f} ms   ({details})"
+    )
+
+
+def int_arg(index: int, default: int) -> int:
+    """Returns the command line argument at `index` as an int, or default when it is missing."""
+    return int(sys.argv[index]) if len(sys.argv) > index else default
@@ -0,0 +1,167 @@
+import gzip
+import importlib.util
+import unittest
+import zlib
+from unittest.mock import patch
+
+from _internal_mitmproxy.net import encoding
+
+# brotli and zstandard are optional dependencies.
+HAS_BROTLI = importlib.util.find_spec("brotli") is not None
+HAS_ZSTD = importlib.util.find_spec("zstandard") is not None
+
+
+class ContentEncodingTestCase(unittest.TestCase):
+    def setUp(self):
+        encoding._cache.clear()
+
+    def test_gzip_roundtrip(self):
+        content = b"Hello World! " * 100
+        encoded = encoding.encode(content, "gzip")
+        self.assertEqual(gzip.decompress(encoded), content)
+        self.assertEqual(encoding.decode(encoded, "GZIP"), content)
+        self.assertEqual(encoding.decode(b"", "gzip"), b"")
+
+    def test_gzip_members(self):
+        encoded = gzip.compress(b"Hello ") + gzip.compress(b"World")
+        self.assertEqual(encoding.decode(encoded, "gzip"), b"Hello World")
+
+    def test_truncated_gzip(self):
+        encoded = gzip.compress(b"Hello World! " * 100)
+        with self.assertRaises(ValueError):
+            encoding.decode(encoded[:-10], "gzip")
+
+    def test_deflate(self):
+        content = b"Hello World! " * 100
+        self.assertEqual(encoding.decode(zlib.compress(content), "deflate"), content)
+        raw = zlib.compressobj(wbits=-15)
+        raw_deflate = raw.compress(content) + raw.flush()
+        self.assertEqual(encoding.decode(raw_deflate, "deflate"), content)
+
+        # Encoding returns the cached raw stream otherwise.
+        encoding._cache.clear()
+        self.assertEqual(
+            zlib.decompress(encoding.encode(content, "deflate")),
+            content,
+        )
+
+    def test_decompression_bomb(self):
+        bomb = gzip.compress(b"\0" * 2**20)
+        with patch.object(encoding, "MAX_DECODED_SIZE", 2**19):
+            with self.assertRaises(encoding.DecodedSizeError):
+                encoding.decode(bomb, "gzip")
+
+        with patch.object(encoding, "MAX_DECODED_SIZE", 2**20):
+            self.assertEqual(len(encoding.decode(bomb, "gzip")), 2**20)
+
+    def _check_optional_codec(self, name: str):
+        content = bytes(range(256)) * 1000
+        encoded = encoding.encode(content, name)
+        encoding._cache.clear()
+        self.assertEqual(encoding.decode(encoded, name), content)
+        self.assertEqual(encoding.decode(b"", name), b"")
+
+        # A single small input chunk must not expand past the limit.
+        bomb = encoding.encode(b"\0" * 2**24, name)
+        encoding._cache.clear()
+        self.assertLess(len(bomb), encoding._CHUNK_SIZE)
+        with patch.object(encoding, "MAX_DECODED_SIZE", 2**20):
+            with self.assertRaises(encoding.DecodedSizeError):
+                encoding.decode(bomb, name)
+
+    @unittest.skipUnless(HAS_BROTLI, "brotli is not installed")
+    def test_brotli(self):
+        self._check_optional_codec("br")
+
+        encoded = encoding.encode(b"Hello World! " * 100, "br")
+        with self.assertRaises(ValueError):
+            encoding.decode(encoded[: len(encoded) // 2], "br")
+
+    @unittest.skipUnless(HAS_BROTLI, "brotli is not installed")
+    def test_brotli_output_is_bounded_per_call(self):
+        import brotli
+
+        outputs: list[int] = []
+        decompressor_type = brotli.Decompressor
+
+        class RecordingDecompressor:
+            def __init__(self):
+                self._decompressor = decompressor_type()
+                self.can_accept_more_data = self._decompressor.can_accept_more_data
+                self.is_finished = self._decompressor.is_finished
+
+            def process(self, data, **kwargs):
+                output = self._decompressor.process(data, **kwargs)
+                outputs.append(len(output))
+                return output
+
+        bomb = brotli.compress(b"\0" * 2**24)
+        with patch.object(brotli, "Decompressor", RecordingDecompressor):
+            with patch.object(encoding, "MAX_DECODED_SIZE", 2**20):
+                with self.assertRaises(encoding.DecodedSizeError):
+                    encoding.decode(bomb, "br")
+
+        self.assertLessEqual(max(outputs), 2 * encoding._CHUNK_SIZE)
+        self.assertLessEqual(sum(outputs), 2**20 + 2 * encoding._CHUNK_SIZE)
+
+    @unittest.skipUnless(HAS_BROTLI, "brotli is not installed")
+    def test_brotli_without_output_limit(self):
+        import brotli
+
+        class OldDecompressor:
+            def process(self, data):
+                return b""
+
+        encoded = brotli.compress(b"content")
+        with patch.object(brotli, "Decompressor", OldDecompressor):
+            with self.assertRaises(ValueError):
+                encoding.decode(encoded, "br")
+
+    @unittest.skipUnless(HAS_ZSTD, "zstandard is not installed")
+    def test_zstd(self):
+        self._check_optional_codec("zstd")
+
+    def test_missing_codec(self):
+        with patch.dict("sys.modules", {"brotli": None, "zstandard": None}):
+            with self.assertRaises(ValueError):
+                encoding.decode(b"content", "br")
+            with self.assertRaises(ValueError):
+                encoding.decode(b"content", "zstd")
+
+    def test_cache_keeps_several_bodies(self):
+        request_body = gzip.compress(b"request")
+        response_body = gzip.compress(b"response")
+        with patch.object(
+            encoding, "decode_gzip", wraps=encoding.decode_gzip
+        ) as decode_gzip, patch.dict(encoding.custom_decode, gzip=decode_gzip):
+            for _ in range(3):
+                self.assertEqual(encoding.decode(request_body, "gzip"), b"request")
+                self.assertEqual(encoding.decode(response_body, "gzip"), b"response")
+            self.assertEqual(decode_gzip.call_count, 2)
+
+        # Equal bodies are found as well.
+        self.assertEqual(
+            encoding.encode(bytes(bytearray(b"response")), "gzip"), response_body
+        )
+
+    def test_cache_is_bounded(self):
+        cache = encoding._DecodeCache(max_bytes=100, max_entries=2)
+        entries = [
+            encoding.CachedDecode(bytes([i]) * 10, "gzip", "strict", bytes([i]) * 20)
+            for i in range(3)
+        ]
+        for entry in entries:
+            cache.add(entry)
+        self.assertIsNone(cache.get_decoded(entries[0].encoded, "gzip", "strict"))
+        self.assertEqual(
+            cache.get_decoded(entries[2].encoded, "gzip", "strict"),
+            entries[2].decoded,
+        )
+        self.assertEqual(cache.size, 60)
+
+        cache.add(encoding.CachedDecode(b"x" * 60, "gzip", "strict", b"y" * 60))
+        self.assertEqual(cache.size, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -198,6 +198,26 @@ class URLEncodedFormSerializerTestCase(unittest.TestCase):
         result = serializer.deserialize(body)
         self.assertEqual(result, expected)
 
+    def test_deserialize_decodes_fields(self):
+        serializer = URLEncodedFormSerializer()
+        body = b"a+b=c%20d&&flag&e=%3D%zz&raw=\xe9&utf8=%C3%A9"
+        result = serializer.deserialize(body)
+        self.assertEqual(
+            result.fields,
+            (
+                (b"a b", b"c d"),
+                (b"flag", b""),
+                (b"e", b"=%zz"),
+                (b"raw", b"\xe9"),
+                (b"utf8", b"\xe9"),
+            ),
+        )
+
+    def test_serialize_deserialize_roundtrip(self):
+        serializer = URLEncodedFormSerializer()
+        body = b"a=1&list[]=x%20y&b=%2B%26%3D&empty="
+        self.assertEqual(serializer.serialize(serializer.deserialize(body)), body)
+
     def test_get_empty_form(self):
         serializer = URLEncodedFormSerializer()
         expected = URLEncodedForm([])
@@ -0,0 +1,241 @@
+import os
+import runpy
+import sys
+import tempfile
+import unittest
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+import pyscalpel
+import pyscalpel._globals
+from pyscalpel.http import Request, Response
+
+_FRAMEWORK_PATH = os.path.join(os.path.dirname(__file__), "..", "_framework.py")
+
+_USER_SCRIPT = """
+calls = []
+
+def request(req):
+    calls.append(req.path)
+
+def response(res):
+    calls.append(res.request.path)
+"""
+
+
+_USER_BATCH_SCRIPT = """
+calls = []
+
+def batch_result(messages):
+    return None
+
+def request_batch(reqs):
+    calls.append([req.path for req in reqs])
+    return batch_result(reqs)
+
+def response_batch(ress):
+    calls.append([res.request.path for res in ress])
+    return batch_result(ress)
+"""
+
+
+def _from_burp(message, service=None, **_):
+    if message == "malformed":
+        raise ValueError("malformed message")
+    return message
+
+
+def _load_framework(test: unittest.TestCase, script: str) -> dict:
+    """Runs the framework with the given user script, the global state is restored afterwards."""
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as user_script:
+        user_script.write(script)
+    test.addCleanup(os.remove, user_script.name)
+
+    with ExitStack() as stack:
+        # The framework sets the global context and extends sys.path, restore them afterwards.
+        stack.enter_context(patch.dict(os.environ))
+        stack.enter_context(patch.object(sys, "path", list(sys.path)))
+        stack.enter_context(patch.object(pyscalpel, "ctx", pyscalpel.ctx))
+        stack.enter_context(
+            patch.object(pyscalpel._globals, "ctx", pyscalpel._globals.ctx)
+        )
+        # The Java logger is not available outside of Burp.
+        stack.enter_context(patch("pyscalpel.logger.logger", MagicMock()))
+
+        return runpy.run_path(
+            _FRAMEWORK_PATH,
+            init_globals={
+                "__scalpel__": {"venv": None, "user_script": user_script.name}
+            },
+        )
+
+
+class BatchHookTestCase(unittest.TestCase):
+    def setUp(self):
+        self.framework = _load_framework(self, _USER_SCRIPT)
+        self.calls = self.framework["user_module"].calls
+
+    def test_malformed_request_only_fails_itself(self):
+        reqs = [
+            Request.make("GET", "http://example.com/first"),
+            "malformed",
+            Request.make("GET", "http://example.com/third"),
+        ]
+        with patch.object(Request, "from_burp", side_effect=_from_burp):
+            results, errors = self.framework["_request_batch"](reqs, [None] * 3)
+
+        self.assertEqual(self.calls, ["/first", "/third"])
+        self.assertEqual(results, [None, None, None])
+        self.assertIsNone(errors[0])
+        self.assertIn("malformed message", errors[1])
+        self.assertIsNone(errors[2])
+
+    def test_malformed_response_only_fails_itself(self):
+        res = Response.make(200)
+        res.request = Request.make("GET", "http://example.com/first")
+        with patch.object(Response, "from_burp", side_effect=_from_burp):
+            results, errors = self.framework["_response_batch"](
+                ["malformed", res], [None] * 2
+            )
+
+        self.assertEqual(self.calls, ["/first"])
+        self.assertEqual(results, [None, None])
+        self.assertIn("malformed message", errors[0])
+        self.assertIsNone(errors[1])
+
+
+class UserBatchHookTestCase(unittest.TestCase):
+    def setUp(self):
+        self.framework = _load_framework(self, _USER_BATCH_SCRIPT)
+        self.user_module = self.framework["user_module"]
+        for message_type in (Request, Response):
+            patcher = patch.object(message_type, "from_burp", side_effect=_from_burp)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.reqs = [
+            Request.make("GET", "http://example.com/first"),
+            Request.make("GET", "http://example.com/second"),
+            Request.make("GET", "http://example.com/third"),
+        ]
+
+    def request_batch(self, batch_result):
+        self.user_module.batch_result = batch_result
+        with patch.object(Request, "to_burp", lambda req: ("burp", req.path)):
+            return self.framework["_request_batch"](self.reqs, [None] * 3)
+
+    def test_results_are_returned_in_order(self):
+        results, errors = self.request_batch(lambda reqs: [reqs[0], None, reqs[2]])
+
+        self.assertEqual(self.user_module.calls, [["/first", "/second", "/third"]])
+        self.assertEqual(results, [("burp", "/first"), None, ("burp", "/third")])
+        self.assertEqual(errors, [None, None, None])
+
+    def test_none_leaves_all_messages_unmodified(self):
+        results, errors = self.request_batch(lambda reqs: None)
+
+        self.assertEqual(self.user_module.calls, [["/first", "/second", "/third"]])
+        self.assertEqual(results, [None, None, None])
+        self.assertEqual(errors, [None, None, None])
+
+    def test_wrong_length_rejects_all_messages(self):
+        results, errors = self.request_batch(lambda reqs: reqs[:2])
+
+        self.assertEqual(results, [None, None, None])
+        for error in errors:
+            self.assertIn("request_batch() returned 2 items instead of 3", error)
+
+    def test_wrong_item_type_only_rejects_its_message(self):
+        results, errors = self.request_batch(
+            lambda reqs: [reqs[0], "not a request", reqs[2]]
+        )
+
+        self.assertEqual(results, [("burp", "/first"), None, ("burp", "/third")])
+        self.assertIsNone(errors[0])
+        self.assertIn("request_batch() returned type <class 'str'>", errors[1])
+        self.assertIsNone(errors[2])
+
+    def test_malformed_message_is_not_passed_to_the_hook(self):
+        self.reqs[1] = "malformed"
+        results, errors = self.request_batch(lambda reqs: reqs)
+
+        self.assertEqual(self.user_module.calls, [["/first", "/third"]])
+        self.assertEqual(results, [("burp", "/first"), None, ("burp", "/third")])
+        self.assertIsNone(errors[0])
+        self.assertIn("malformed message", errors[1])
+        self.assertIsNone(errors[2])
+
+    def test_response_batch_wrong_item_type(self):
+        ress = []
+        for req in self.reqs[:2]:
+            res = Response.make(200)
+            res.request = req
+            ress.append(res)
+        self.user_module.batch_result = lambda ress: [ress[0].request, ress[1]]
+
+        with patch.object(Response, "to_burp", lambda res: ("burp", res.status_code)):
+            results, errors = self.framework["_response_batch"](ress, [None] * 2)
+
+        self.assertEqual(self.user_module.calls, [["/first", "/second"]])
+        self.assertEqual(results, [None, ("burp", 200)])
+        self.assertIn("response_batch() returned type", errors[0])
+        self.assertIsNone(errors[1])
+
+
+class ReloadTestCase(unittest.TestCase):
+    def setUp(self):
+        self.framework = _load_framework(self, _USER_SCRIPT)
+        self.script_path = self.framework["__scalpel__"]["user_script"]
+
+    def reload(self, script: str):
+        with open(self.script_path, "w", encoding="utf-8") as user_script:
+            user_script.write(script)
+        self.framework["_reload_user_script"]()
+
+    def dispatch_request(self) -> list:
+        req = Request.make("GET", "http://example.com/path")
+        with patch.object(Request, "from_burp", side_effect=_from_burp):
+            self.framework["_request"](req, None)
+        return self.framework["_request"].__globals__["user_module"].calls
+
+    def test_broken_script_keeps_previous_hooks(self):
+        for script, error in (
+            ("def request(req:\n    pass\n", SyntaxError),
+            (
+                "def request(req):\n    pass\n\nraise RuntimeError('broken')\n",
+                RuntimeError,
+            ),
+            (
+                "def request(req):\n    pass\n\nMATCH = {'unknown': 'field'}\n",
+                ValueError,
+            ),
+        ):
+            with self.subTest(script=script):
+                with self.assertRaises(error):
+                    self.reload(script)
+
+                self.assertEqual(self.dispatch_request()[-1], "/path")
+                callables = self.framework["_get_callables"]()
+                self.assertIn("response", [c["name"] for c in callables])
+
+    def test_dispatch_table_is_rebuilt_on_reload(self):
+        framework_globals = self.framework["_request"].__globals__
+        table = framework_globals["callable_objs"]
+
+        # The table is built once per load, hooks added to the module later are not dispatched.
+        framework_globals["user_module"].response_batch = lambda ress: None
+        self.assertEqual(self.dispatch_request(), ["/path"])
+        self.assertIs(framework_globals["callable_objs"], table)
+        self.assertNotIn("response_batch", table)
+
+        # Removing a hook stops dispatching it.
+        self.reload("calls = []\n\ndef response(res):\n    calls.append(res)\n")
+        self.assertIsNot(framework_globals["callable_objs"], table)
+        self.assertEqual(self.dispatch_request(), [])
+
+        # Adding it back dispatches it again.
+        self.reload(_USER_SCRIPT)
+        self.assertEqual(self.dispatch_request(), ["/path"])
+
+
+if __name__ == "__main__":
+    unittest.main()
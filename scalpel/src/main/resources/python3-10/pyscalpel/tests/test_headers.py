@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
 from pyscalpel.http.headers import *
 
@@ -28,6 +29,25 @@ class HeadersTest(unittest.TestCase):
         self.headers["Accept"] = "application/text"
         self.assertEqual(self.headers["Accept"], "application/text")
 
+    def test_lookups_after_modifications(self):
+        self.headers.add("accept", "text/html")
+        self.headers["ACCEPT"] = "application/json"
+        self.headers.insert(0, b"X-First", b"1")
+        del self.headers["content-type"]
+
+        self.assertIn("Accept", self.headers)
+        self.assertIn(b"x-first", self.headers)
+        self.assertNotIn("Content-Type", self.headers)
+        self.assertEqual(list(self.headers), ["X-First", "Host", "accept"])
+        self.assertEqual(
+            self.headers.fields,
+            (
+                (b"X-First", b"1"),
+                (b"Host", b"example.com"),
+                (b"accept", b"application/json"),
+            ),
+        )
+
     def test_bytes_representation(self):
         expected_bytes = b"Host: example.com\r\nContent-Type: application/xml\r\n"
         self.assertEqual(bytes(self.headers), expected_bytes)
@@ -82,5 +102,67 @@ class HeadersTest(unittest.TestCase):
         self.assertEqual("Abc: ééé\r\n", dec)
 
 
+class HeaderBlockTest(unittest.TestCase):
+    fields = (
+        (b":authority", b"example.com"),
+        (b"Host", b"example.com"),
+        (b"Set-Cookie", b"a=b: c"),
+        (b"X-Empty", b""),
+        (b"X-Latin", b"caf\xe9"),
+    )
+
+    def test_parse_header_block(self):
+        block = b"".join(name + b": " + value + b"\r\n" for name, value in self.fields)
+        self.assertEqual(parse_header_block(block), self.fields)
+        self.assertEqual(parse_header_block(b""), ())
+
+    def test_parse_invalid_header_block(self):
+        with self.assertRaises(ValueError):
+            parse_header_block(b"Host example.com\r\n")
+
+    def test_roundtrip(self):
+        headers = Headers(self.fields)
+        self.assertEqual(Headers.from_header_block(bytes(headers)), headers)
+
+    def test_from_burp_uses_the_header_block(self):
+        block = bytes(Headers(self.fields))
+        with patch("pyscalpel.http.headers.PythonUtils") as utils:
+            utils.toHeaderBlock.return_value = memoryview(block)
+            headers = Headers.from_burp(["java headers"])  # type: ignore
+
+        utils.toHeaderBlock.assert_called_once_with(["java headers"])
+        self.assertEqual(headers.fields, self.fields)
+
+    def test_from_burp_falls_back_to_each_header(self):
+        header = MagicMock()
+        header.name.return_value = "X-Multi"
+        header.value.return_value = "a\r\nb"
+        with patch("pyscalpel.http.headers.PythonUtils") as utils:
+            utils.toHeaderBlock.return_value = None
+            headers = Headers.from_burp([header])
+
+        self.assertEqual(headers.fields, ((b"X-Multi", b"a\r\nb"),))
+
+    def test_to_burp_uses_the_header_block(self):
+        headers = Headers(self.fields)
+        with patch("pyscalpel.http.headers.PythonUtils") as utils:
+            utils.toJavaBytes.side_effect = lambda block: block
+            utils.fromHeaderBlock.return_value = ["java headers"]
+            self.assertEqual(headers.to_burp(), ["java headers"])
+
+        utils.fromHeaderBlock.assert_called_once_with(bytes(headers))
+
+    def test_to_burp_falls_back_to_each_header(self):
+        for fields in (((b"X-Multi", b"a\nb"),), ((b"X:Colon", b"a"),)):
+            headers = Headers(fields)
+            with patch("pyscalpel.http.headers.PythonUtils") as utils, patch(
+                "pyscalpel.http.headers.HttpHeader"
+            ) as http_header:
+                headers.to_burp()
+
+            utils.fromHeaderBlock.assert_not_called()
+            self.assertEqual(http_header.httpHeader.call_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
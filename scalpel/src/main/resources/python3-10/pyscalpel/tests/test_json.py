@@ -1,7 +1,9 @@
-""" Most JSON code is covered in test_form.py, this covers the rest """
+"""Most JSON code is covered in test_form.py, this covers the rest"""
 
+import json
 import unittest
 import pyscalpel.http.body.json_form as json_form
+from pyscalpel.http.body import json_backend
 
 
 class TestJson(unittest.TestCase):
@@ -100,3 +102,63 @@ class TestJson(unittest.TestCase):
             1: 2,
         }
         self.assertEqual(json_form.transform_tuple_to_dict(data), expected)
+
+    def test_json_escape_bytes(self):
+        self.assertEqual(json_form.json_escape_bytes(b"abc\n"), "abc\n")
+        self.assertEqual(json_form.json_escape_bytes(b"a\x00\xff"), "a\\u0000\\u00ff")
+        self.assertEqual(
+            json_form.json_unescape_bytes(
+                json_form.json_escape_bytes(bytes(range(256)))
+            ),
+            bytes(range(256)),
+        )
+
+    def test_encode_JSON_form_deeply_nested(self):
+        depth = 5000
+        nested: dict = {"v": "\\u0041"}
+        for _ in range(depth):
+            nested = {"k": nested}
+
+        encoded = json_form.encode_JSON_form(nested)
+        for _ in range(depth):
+            encoded = encoded["k"]
+        self.assertEqual(encoded, {"v": "A"})
+
+
+class TestJsonBackend(unittest.TestCase):
+    def tearDown(self):
+        json_backend.select_backend()
+
+    def test_backends_parse_the_same(self):
+        documents = [
+            b'{"a": [1, 2.5, {"b": null}], "c": "\\u00e9", "d": true}',
+            b'{"big": 123456789012345678901234567890, "neg": -9223372036854775808}',
+            b'{"nan": NaN, "inf": 1e400}',
+            '{"utf16": 1}'.encode("utf-16"),
+        ]
+        for backend in json_backend.BACKENDS:
+            try:
+                json_backend.select_backend(backend)
+            except ImportError:
+                continue
+
+            for document in documents:
+                with self.subTest(backend=backend, document=document):
+                    self.assertEqual(
+                        repr(json_backend.loads(document)), repr(json.loads(document))
+                    )
+
+    def test_invalid_document(self):
+        for backend in json_backend.BACKENDS:
+            try:
+                json_backend.select_backend(backend)
+            except ImportError:
+                continue
+
+            with self.subTest(backend=backend):
+                with self.assertRaises(json.JSONDecodeError):
+                    json_backend.loads(b'{"a": ')
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            json_backend.select_backend("simdjson")
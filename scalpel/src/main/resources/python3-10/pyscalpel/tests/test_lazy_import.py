@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import unittest
+
+
+def loaded_modules(statement: str) -> set[str]:
+    """Returns the modules loaded by a fresh interpreter after running the statement."""
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print('\\n'.join(sys.modules))",
+        ],
+        env=dict(os.environ, _DO_NOT_IMPORT_JAVA="1"),
+    )
+    return set(output.decode().splitlines())
+
+
+class LazyImportTestCase(unittest.TestCase):
+    def test_package_import_is_lazy(self):
+        modules = loaded_modules("import pyscalpel")
+        self.assertIn("pyscalpel", modules)
+        self.assertNotIn("pyscalpel.http", modules)
+        self.assertNotIn("pyscalpel.venv", modules)
+        self.assertNotIn("pyscalpel.burp_utils", modules)
+
+    def test_messages_dont_import_heavy_modules(self):
+        modules = loaded_modules("from pyscalpel import Request, Response, Flow")
+        self.assertIn("pyscalpel.http.request", modules)
+        self.assertNotIn("requests", modules)
+        self.assertNotIn("requests_toolbelt", modules)
+        self.assertNotIn("_internal_mitmproxy.flow", modules)
+
+    def test_lazy_attributes(self):
+        import pyscalpel
+        from pyscalpel.http import Request
+        from _internal_mitmproxy import http
+
+        self.assertIs(Request, pyscalpel.Request)
+        self.assertIs(pyscalpel.venv, sys.modules["pyscalpel.venv"])
+        self.assertTrue(
+            issubclass(http.HTTPFlow, sys.modules["_internal_mitmproxy.flow"].Flow)
+        )
+        self.assertIn("Request", dir(pyscalpel))
+        self.assertIn("burp_utils", dir(pyscalpel))
+        self.assertIs(pyscalpel.burp_utils, sys.modules["pyscalpel.burp_utils"])
+
+        with self.assertRaises(AttributeError):
+            pyscalpel.does_not_exist  # pylint: disable=pointless-statement
+
+    def test_logger_is_not_shadowed_by_its_module(self):
+        import pyscalpel
+        import pyscalpel.logger  # pylint: disable=redefined-outer-name
+
+        self.assertIs(pyscalpel.logger, sys.modules["pyscalpel.logger"].logger)
+
+
+if __name__ == "__main__":
+    unittest.main()
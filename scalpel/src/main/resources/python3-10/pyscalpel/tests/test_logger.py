@@ -0,0 +1,78 @@
+import sys
+import unittest
+from unittest import mock
+
+from pyscalpel.logger import LevelGatedLogger, TRACE, INFO
+
+logger_module = sys.modules["pyscalpel.logger"]
+
+
+class FakeJavaLogger:
+    def __init__(self, level: int):
+        self.level = level
+        self.level_reads = 0
+        self.messages: list[tuple[str, str]] = []
+
+    def getLogLevelValue(self) -> int:
+        self.level_reads += 1
+        return self.level
+
+    def __getattr__(self, name: str):
+        return lambda msg: self.messages.append((name, msg))
+
+
+class Unformattable:
+    def __str__(self) -> str:
+        raise AssertionError("disabled messages must not be formatted")
+
+
+class LevelGatedLoggerTestCase(unittest.TestCase):
+    def test_disabled_messages_are_not_formatted(self):
+        java = FakeJavaLogger(INFO)
+        logger = LevelGatedLogger(java)
+
+        logger.trace("hook %s called", Unformattable())
+        logger.debug("hook %s called", Unformattable())
+
+        self.assertEqual(java.messages, [])
+
+    def test_enabled_messages_are_formatted(self):
+        java = FakeJavaLogger(TRACE)
+        logger = LevelGatedLogger(java)
+
+        logger.trace("Got %d requests", 3)
+        logger.info("100%")
+
+        self.assertEqual(java.messages, [("trace", "Got 3 requests"), ("info", "100%")])
+
+    def test_errors_are_always_forwarded(self):
+        java = FakeJavaLogger(7)
+        logger = LevelGatedLogger(java)
+
+        logger.error("failed: %s", "boom")
+
+        self.assertEqual(java.messages, [("error", "failed: boom")])
+
+    def test_level_is_cached(self):
+        java = FakeJavaLogger(INFO)
+        logger = LevelGatedLogger(java)
+
+        with mock.patch.object(logger_module, "monotonic", return_value=100.0):
+            for _ in range(10):
+                logger.trace("ignored")
+        self.assertEqual(java.level_reads, 1)
+
+        java.level = TRACE
+        with mock.patch.object(
+            logger_module,
+            "monotonic",
+            return_value=100.0 + logger_module.LEVEL_REFRESH_INTERVAL,
+        ):
+            logger.trace("logged")
+
+        self.assertEqual(java.level_reads, 2)
+        self.assertEqual(java.messages, [("trace", "logged")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+
+from pyscalpel.http import Request, Response, Flow
+from pyscalpel.http.match import glob_to_regex, compile_match_spec
+from pyscalpel.http.utils import match_patterns
+
+
+class GlobToRegexTestCase(unittest.TestCase):
+    def assertGlob(self, pattern: str, value: str, expected: bool):
+        self.assertEqual(
+            expected,
+            compile_match_spec({"paths": [pattern]})._field_matches("paths", value),
+            f"{pattern!r} against {value!r}",
+        )
+
+    def test_wildcards(self):
+        self.assertGlob("/api/*", "/api/users?id=1", True)
+        self.assertGlob("/api/*", "/static/api/", False)
+        self.assertGlob("/v?/users", "/v2/users", True)
+        self.assertGlob("/v?/users", "/v10/users", False)
+
+    def test_brackets(self):
+        self.assertGlob("/v[12]/*", "/v1/a", True)
+        self.assertGlob("/v[12]/*", "/v3/a", False)
+        self.assertGlob("/v[!12]/*", "/v3/a", True)
+        self.assertGlob("/v[0-9]", "/v7", True)
+        self.assertGlob("/[&^]", "/&", True)
+        self.assertGlob("/[", "/[", True)
+
+    def test_literals_are_escaped(self):
+        self.assertGlob("/a.b+c(d)", "/a.b+c(d)", True)
+        self.assertGlob("/a.b", "/axb", False)
+
+    def test_agrees_with_fnmatch(self):
+        patterns = ["*.example.com", "a?c", "[!x]y", "[a-c]*", "plain", "*[*"]
+        values = [
+            "www.example.com",
+            "example.com",
+            "abc",
+            "zy",
+            "xy",
+            "b",
+            "plain",
+            "a[b",
+        ]
+        for pattern in patterns:
+            for value in values:
+                self.assertEqual(
+                    match_patterns(value, pattern),
+                    compile_match_spec({"paths": [pattern]})._field_matches(
+                        "paths", value
+                    ),
+                    f"{pattern!r} against {value!r}",
+                )
+
+    def test_translate(self):
+        self.assertEqual(r".*\.example\.com", glob_to_regex("*.example.com"))
+        self.assertEqual("[^a\\&]", glob_to_regex("[!a&]"))
+
+
+class CompiledMatchSpecTestCase(unittest.TestCase):
+    def make_flow(self, url: str, method: str = "GET", response=None) -> Flow:
+        req = Request.make(method, url)
+        req.headers["Content-Type"] = "application/json; charset=utf-8"
+        return Flow(host=req.host, request=req, response=response)
+
+    def test_empty_spec_matches(self):
+        spec = compile_match_spec({})
+        self.assertEqual({}, spec.regexes)
+        self.assertTrue(spec.matches(self.make_flow("http://a.com/"), "request"))
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            compile_match_spec({"host": ["*"]})  # type: ignore
+
+    def test_hosts(self):
+        spec = compile_match_spec({"hosts": ["*.example.com", "localhost"]})
+        self.assertTrue(
+            spec.matches(self.make_flow("http://WWW.example.com/"), "request")
+        )
+        self.assertTrue(spec.matches(self.make_flow("http://localhost/"), "request"))
+        self.assertFalse(spec.matches(self.make_flow("http://example.org/"), "request"))
+
+    def test_paths_and_methods(self):
+        spec = compile_match_spec({"paths": ["/api/*"], "methods": ["post", "PUT"]})
+        self.assertTrue(
+            spec.matches(self.make_flow("http://a.com/api/x?y=1", "POST"), "request")
+        )
+        self.assertFalse(
+            spec.matches(self.make_flow("http://a.com/api/x", "GET"), "request")
+        )
+        self.assertFalse(
+            spec.matches(self.make_flow("http://a.com/API/x", "PUT"), "request")
+        )
+
+    def test_content_types(self):
+        spec = compile_match_spec({"content_types": ["text/*"]})
+        response = Response.make(200, headers=((b"Content-Type", b"text/html"),))
+        flow = self.make_flow("http://a.com/", response=response)
+
+        # The request is JSON, the response is HTML.
+        self.assertFalse(spec.matches(flow, "request"))
+        self.assertFalse(spec.matches(flow, "req_edit_in"))
+        self.assertTrue(spec.matches(flow, "response"))
+        self.assertTrue(spec.matches(flow, "res_edit_in"))
+
+        no_content_type = Flow(
+            host="a.com", request=Request.make("GET", "http://a.com/")
+        )
+        self.assertFalse(spec.matches(no_content_type, "request"))
+
+    def test_regexes_are_exported(self):
+        spec = compile_match_spec({"hosts": ["*.com"], "paths": ["/a"]})
+        self.assertEqual({"hosts", "paths"}, set(spec.regexes))
+        self.assertTrue(spec.regexes["hosts"].startswith("(?i)"))
+        self.assertFalse(spec.regexes["paths"].startswith("(?i)"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import copy
+import pickle
+import random
+import unittest
+
+from _internal_mitmproxy.coretypes.multidict import (
+    IndexedMultiDict,
+    IndexedMultiDictView,
+    MultiDict,
+    MultiDictView,
+)
+
+
+class _CaseInsensitiveMultiDict(MultiDict):
+    @staticmethod
+    def _kconv(key):
+        return key.lower()
+
+
+class _CaseInsensitiveIndexedMultiDict(IndexedMultiDict):
+    @staticmethod
+    def _kconv(key):
+        return key.lower()
+
+
+def _state(d) -> tuple:
+    return (d.fields, list(d), len(d), list(d.items()))
+
+
+class IndexedMultiDictTestCase(unittest.TestCase):
+    def test_lookups(self):
+        d = IndexedMultiDict([("a", 1), ("b", 2), ("a", 3)])
+        self.assertEqual(d["a"], 1)
+        self.assertEqual(d.get_all("a"), [1, 3])
+        self.assertEqual(d.get_all("c"), [])
+        self.assertIn("b", d)
+        self.assertNotIn("c", d)
+        self.assertEqual(list(d), ["a", "b"])
+        self.assertEqual(len(d), 2)
+        with self.assertRaises(KeyError):
+            d["c"]
+
+    def test_set_all_keeps_positions(self):
+        d = IndexedMultiDict([("a", 1), ("b", 2), ("a", 3), ("c", 4)])
+        d.set_all("a", [5, 6, 7])
+        self.assertEqual(d.fields, (("a", 5), ("b", 2), ("a", 6), ("c", 4), ("a", 7)))
+
+        d.set_all("a", [8])
+        self.assertEqual(d.fields, (("a", 8), ("b", 2), ("c", 4)))
+        self.assertEqual(d.get_all("c"), [4])
+
+    def test_insert_and_delete(self):
+        d = IndexedMultiDict([("a", 1), ("b", 2)])
+        d.insert(0, "c", 3)
+        self.assertEqual(d.get_all("a"), [1])
+        self.assertEqual(list(d), ["c", "a", "b"])
+
+        del d["a"]
+        self.assertEqual(d.fields, (("c", 3), ("b", 2)))
+        with self.assertRaises(KeyError):
+            del d["a"]
+
+    def test_fields_setter_resets_index(self):
+        d = IndexedMultiDict([("a", 1)])
+        self.assertEqual(d["a"], 1)
+        d.fields = (("b", 2),)
+        self.assertNotIn("a", d)
+        self.assertEqual(d["b"], 2)
+
+    def test_copies_are_independent(self):
+        d = IndexedMultiDict([("a", 1)])
+        for copied in (copy.copy(d), copy.deepcopy(d), pickle.loads(pickle.dumps(d))):
+            copied["a"] = 2
+            copied.add("b", 3)
+            self.assertEqual(d.fields, (("a", 1),))
+            self.assertEqual(copied.fields, (("a", 2), ("b", 3)))
+
+    def test_same_results_as_multidict(self):
+        rng = random.Random(1234)
+        keys = ["a", "A", "b", "B", "c"]
+        for _ in range(200):
+            fields = [
+                (rng.choice(keys), rng.randrange(10)) for _ in range(rng.randrange(8))
+            ]
+            expected = _CaseInsensitiveMultiDict(fields)
+            indexed = _CaseInsensitiveIndexedMultiDict(fields)
+
+            for _ in range(20):
+                key = rng.choice(keys)
+                values = [rng.randrange(10) for _ in range(rng.randrange(4))]
+                index = rng.randrange(-3, 10)
+                operation = rng.choice(
+                    ("get", "set", "set_all", "add", "insert", "del", "contains")
+                )
+                for d in (expected, indexed):
+                    match operation:
+                        case "get":
+                            result = d.get_all(key)
+                        case "set":
+                            d[key] = values[0] if values else None
+                            result = None
+                        case "set_all":
+                            d.set_all(key, list(values))
+                            result = None
+                        case "add":
+                            d.add(key, index)
+                            result = None
+                        case "insert":
+                            d.insert(index, key, index)
+                            result = None
+                        case "del":
+                            try:
+                                del d[key]
+                                result = None
+                            except KeyError:
+                                result = KeyError
+                        case _:
+                            result = key in d
+                    if d is expected:
+                        expected_result = result
+
+                self.assertEqual(result, expected_result, operation)
+                self.assertEqual(_state(indexed), _state(expected), operation)
+
+
+class IndexedMultiDictViewTestCase(unittest.TestCase):
+    def setUp(self):
+        self.fields = (("a", "1"), ("b", "2"), ("a", "3"))
+
+    def _get(self):
+        return self.fields
+
+    def _set(self, fields):
+        self.fields = fields
+
+    def test_same_results_as_view(self):
+        view = IndexedMultiDictView(self._get, self._set)
+        expected = MultiDictView(self._get, self._set)
+
+        self.assertEqual(view.get_all("a"), expected.get_all("a"))
+        self.assertEqual(list(view), list(expected))
+        self.assertEqual(len(view), len(expected))
+
+        view["a"] = "4"
+        self.assertEqual(self.fields, (("a", "4"), ("b", "2")))
+        self.assertEqual(view["a"], "4")
+
+    def test_index_follows_parent(self):
+        view = IndexedMultiDictView(self._get, self._set)
+        self.assertEqual(view["b"], "2")
+
+        self.fields = (("c", "5"),)
+        self.assertNotIn("b", view)
+        self.assertEqual(view["c"], "5")
+
+
+if __name__ == "__main__":
+    unittest.main()
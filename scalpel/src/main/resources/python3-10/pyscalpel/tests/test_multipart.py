@@ -2,7 +2,9 @@
 Most of multipart.py is covered in test_form.py, this covers the rest, mostly the utility functions
 """
 
+import pickle
 import unittest
+from copy import deepcopy
 from pyscalpel.http.body.multipart import *
 
 
@@ -111,6 +113,68 @@ class TestMultiPartFormField(unittest.TestCase):
         self.assertIn(b"Test content", bytes(field))
 
 
+class TestMultiPartParser(unittest.TestCase):
+    content_type = "multipart/form-data; boundary=XYZ"
+
+    def test_parse_fields(self):
+        body = (
+            b"--XYZ\r\n"
+            b'Content-Disposition: form-data; name="a"\r\n\r\n'
+            b"1\r\n"
+            b"--XYZ\r\n"
+            b'Content-Disposition: form-data; name="f"; filename="x.bin"\r\n'
+            b"content-type: application/octet-stream\r\n\r\n"
+            b"\x00\r\n--XY\xff\r\n"
+            b"--XYZ--\r\n\r\n"
+        )
+        form = MultiPartForm.from_bytes(body, self.content_type)
+
+        self.assertEqual(form.keys(), ("a", "f"))
+        self.assertEqual(form["a"].content, b"1")
+        self.assertEqual(form["f"].content, b"\x00\r\n--XY\xff")
+        self.assertEqual(form["f"].content_type, "application/octet-stream")
+        self.assertEqual(bytes(form), body)
+
+    def test_parse_contents_are_not_copied(self):
+        body = b'--XYZ\r\nContent-Disposition: form-data; name="a"\r\n\r\n1\r\n--XYZ--'
+        field = MultiPartForm.from_bytes(body, self.content_type)["a"]
+
+        self.assertIsInstance(field._content, memoryview)
+        self.assertIs(field._content.obj, body)
+        self.assertEqual(field.content, b"1")
+        self.assertIsInstance(field._content, bytes)
+
+    def test_parse_skips_closing_delimiter_and_epilogue(self):
+        body = b"--XYZ\r\n\r\nno headers\r\n--XYZ--\r\nepilogue"
+        form = MultiPartForm.from_bytes(body, self.content_type)
+
+        self.assertEqual(len(form.fields), 1)
+        self.assertEqual(form.fields[0].headers, {})
+        self.assertEqual(form.fields[0].content, b"no headers")
+
+    def test_parse_folded_headers(self):
+        body = b"--XYZ\r\nX-Folded: a\r\n\tb\r\n\r\n\r\n--XYZ--"
+        form = MultiPartForm.from_bytes(body, self.content_type)
+
+        self.assertEqual(form.fields[0].headers["x-folded"], "a b")
+
+    def test_parse_improper_part(self):
+        with self.assertRaises(ImproperBodyPartContentException):
+            MultiPartForm.from_bytes(b"--XYZ\r\nbroken\r\n--XYZ--", self.content_type)
+
+    def test_copy_parsed_form(self):
+        body = b'--XYZ\r\nContent-Disposition: form-data; name="a"\r\n\r\n1\r\n--XYZ--'
+        form = MultiPartForm.from_bytes(body, self.content_type)
+
+        copied = deepcopy(form)
+        copied["a"].name = "b"
+        self.assertEqual(form.keys(), ("a",))
+        self.assertEqual(copied["b"].content, b"1")
+
+        unpickled = pickle.loads(pickle.dumps(form))
+        self.assertEqual(unpickled, form)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -20,6 +20,8 @@ from pyscalpel.http.body import (
 )
 
 from pyscalpel.http.request import *
+from pyscalpel.java.burp import IHttpHeader
+from unittest.mock import MagicMock, patch
 import unittest
 
 
@@ -904,6 +906,54 @@ aHBVVAUAA7usdWR1eAsAAQToAwAABOgDAABQSwUGAAAAAAEAAQBNAAAAsQAAAAAA"""
         )
         self.assertEqual(expected, req.content)
 
+    def test_content_tracks_nested_json_mutations(self):
+        req = Request.make(
+            "POST",
+            "http://localhost:3000/graphql",
+            b'{"a": {"b": [1, {"c": 2}]},  "d": 1}',
+            {"Content-Type": "application/json"},
+        )
+        form = req.json_form
+        self.assertEqual(b'{"a": {"b": [1, {"c": 2}]},  "d": 1}', req.content)
+
+        form["a"]["b"][1]["c"] = 3
+        self.assertEqual(b'{"a": {"b": [1, {"c": 3}]}, "d": 1}', req.content)
+
+        form["a"]["b"].append(4)
+        self.assertEqual(b'{"a": {"b": [1, {"c": 3}, 4]}, "d": 1}', req.content)
+
+    def test_content_tracks_json_values_mutated_by_reference(self):
+        req = Request.make(
+            "POST",
+            "http://localhost:3000/graphql",
+            b'{"a": 1}',
+            {"Content-Type": "application/json"},
+        )
+        added: dict = {}
+        req.json_form["b"] = added
+        self.assertEqual(b'{"a": 1, "b": {}}', req.content)
+
+        added["c"] = 2
+        self.assertEqual(b'{"a": 1, "b": {"c": 2}}', req.content)
+
+    def test_content_tracks_multipart_field_mutations(self):
+        req = Request.make(
+            "POST",
+            "http://localhost:3000/upload",
+            b'--XYZ\r\nContent-Disposition: form-data; name="a"\r\n\r\n1\r\n--XYZ--\r\n\r\n',
+            {"Content-Type": "multipart/form-data; boundary=XYZ"},
+        )
+        field = req.multipart_form["a"]
+
+        field.content = b"2"
+        self.assertIn(b"\r\n\r\n2\r\n", req.content)
+
+        field.headers["X-Test"] = "1"
+        self.assertIn(b"X-Test: 1\r\n", req.content)
+
+        field.name = "b"
+        self.assertIn(b'name="b"', req.content)
+
     def test_path_is(self):
         req = Request.make("GET", "http://example.com/abc/def")
 
@@ -1060,6 +1110,26 @@ class TestRequestQuerySetter(unittest.TestCase):
         self.request.query = []
         self.assertEqual(self.request.url, self.base_url)
 
+    def test_query_is_parsed_once(self):
+        self.request.url = self.base_url + "?a=1&b=2"
+        with patch(
+            "pyscalpel.http.request.url_decode", wraps=url_decode
+        ) as mocked_decode:
+            self.assertEqual(self.request.query["a"], "1")
+            self.assertEqual(self.request.query["b"], "2")
+            self.assertEqual(self.request.query.get_all("a"), ["1"])
+            self.assertEqual(mocked_decode.call_count, 1)
+
+    def test_query_cache_follows_path(self):
+        self.request.url = self.base_url + "?a=1"
+        self.assertEqual(self.request.query["a"], "1")
+
+        self.request.query["a"] = "2"
+        self.assertEqual(self.request.query["a"], "2")
+
+        self.request.path = "/other?a=3"
+        self.assertEqual(self.request.query["a"], "3")
+
 
 class TestRequestBodyProperty(unittest.TestCase):
     def setUp(self):
@@ -1098,6 +1168,41 @@ class TestRequestBodyProperty(unittest.TestCase):
         self.assertIsNone(self.request.body)  # Use the getter here
         self.assertFalse("Content-Length" in self.request.headers)
 
+    def test_body_property_with_buffer(self):
+        # Buffers are only copied to bytes when the body is read
+        request = Request(
+            method="POST",
+            scheme="http",
+            host="example.com",
+            port=80,
+            path="/submit",
+            http_version="HTTP/1.1",
+            headers=Headers(),
+            authority="example.com",
+            content=memoryview(b"buffered body"),
+        )
+        self.assertEqual(request.headers["Content-Length"], "13")
+        self.assertIsNone(request._raw_content)
+
+        self.assertEqual(request.body, b"buffered body")
+        self.assertIsInstance(request.body, bytes)
+        self.assertIsNone(request._content_buffer)
+
+    def test_urlencoded_form_with_buffer(self):
+        request = Request(
+            method="POST",
+            scheme="http",
+            host="example.com",
+            port=80,
+            path="/submit",
+            http_version="HTTP/1.1",
+            headers=Headers([(b"Content-Type", b"application/x-www-form-urlencoded")]),
+            authority="example.com",
+            content=memoryview(b"a=1&b=2"),
+        )
+        self.assertEqual(request.urlencoded_form[b"b"], b"2")
+        self.assertEqual(bytes(request).split(b"\r\n\r\n")[1], b"a=1&b=2")
+
 
 class TestRequestContentLengthProperty(unittest.TestCase):
     def setUp(self):
@@ -1275,6 +1380,105 @@ class TestRequestMultiPartFormSetter(unittest.TestCase):
         )
 
 
+class TestRequestFromBurp(unittest.TestCase):
+    def setUp(self):
+        self.body = b"a=1&b=2"
+
+        self.mock_service = MagicMock(spec=IHttpService)
+        self.mock_service.secure.return_value = True
+        self.mock_service.host.return_value = "example.com"
+        self.mock_service.port.return_value = 443
+
+        mock_headers = []
+        for name, value in (
+            ("Host", "example.com"),
+            ("Content-Type", "application/x-www-form-urlencoded"),
+            ("Content-Length", "7"),
+        ):
+            header = MagicMock(spec=IHttpHeader)
+            header.name.return_value = name
+            header.value.return_value = value
+            mock_headers.append(header)
+
+        self.mock_request = MagicMock(spec=IHttpRequest)
+        self.mock_request.method.return_value = "POST"
+        self.mock_request.url.return_value = "/submit?x=1"
+        self.mock_request.httpVersion.return_value = "HTTP/1.1"
+        self.mock_request.headers.return_value = mock_headers
+        self.mock_request.body.return_value = MagicMock(
+            spec=IByteArray, getBytes=lambda: self.body, length=lambda: len(self.body)
+        )
+
+    def test_fields_are_fetched_on_access(self):
+        req = Request.from_burp(self.mock_request, self.mock_service)
+
+        self.assertEqual(req.host, "example.com")
+        self.assertEqual(req.path, "/submit?x=1")
+        self.mock_request.headers.assert_not_called()
+        self.mock_request.body.assert_not_called()
+
+        self.assertEqual(req.scheme, "https")
+        self.assertEqual(req.port, 443)
+        self.assertEqual(req.method, "POST")
+        self.assertEqual(req.authority, "example.com")
+        self.assertEqual(req.urlencoded_form[b"b"], b"2")
+        self.assertEqual(
+            bytes(req),
+            b"POST /submit?x=1 HTTP/1.1\r\n"
+            b"Host: example.com\r\n"
+            b"Content-Type: application/x-www-form-urlencoded\r\n"
+            b"Content-Length: 7\r\n"
+            b"\r\n"
+            b"a=1&b=2",
+        )
+
+    def test_to_burp_untouched(self):
+        req = Request.from_burp(self.mock_request, self.mock_service)
+        self.assertIs(req.to_burp(), self.mock_request)
+
+        # Reading fields does not count as a modification
+        _ = req.headers, req.content, req.path, req.urlencoded_form
+        self.assertIs(req.to_burp(), self.mock_request)
+
+    def test_untouched_detection(self):
+        req = Request.from_burp(self.mock_request, self.mock_service)
+        req.path = "/other"
+        self.assertFalse(req._is_untouched())
+
+        req = Request.from_burp(self.mock_request, self.mock_service)
+        req.headers["X-Test"] = "1"
+        self.assertFalse(req._is_untouched())
+
+        req = Request.from_burp(self.mock_request, self.mock_service)
+        req.content = b"a=2"
+        self.assertFalse(req._is_untouched())
+
+        req = Request.from_burp(self.mock_request, self.mock_service)
+        req.urlencoded_form[b"a"] = b"3"
+        self.assertFalse(req._is_untouched())
+
+        req = Request.from_burp(self.mock_request, self.mock_service)
+        req.content = self.body
+        self.assertTrue(req._is_untouched())
+
+    def test_unread_body_is_serialized_from_buffer(self):
+        req = Request.from_burp(self.mock_request, self.mock_service)
+        req.headers["X-Test"] = "1"
+
+        self.assertTrue(bytes(req).endswith(b"X-Test: 1\r\n\r\na=1&b=2"))
+        self.assertIsNone(req._raw_content)
+        self.assertIsInstance(req._content_buffer, memoryview)
+
+    def test_absent_body(self):
+        self.body = b""
+        self.mock_request.headers.return_value = []
+        req = Request.from_burp(self.mock_request, self.mock_service)
+
+        self.assertNotIn("Content-Length", req.headers)
+        self.assertIsNone(req.content)
+        self.assertTrue(req._is_untouched())
+
+
 class TestRequestEncoding(unittest.TestCase):
     def test_utf16(self):
         req_bytes = """GET / HTTP/1.1\r
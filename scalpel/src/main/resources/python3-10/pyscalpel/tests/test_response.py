@@ -1,4 +1,6 @@
+import gzip
 import unittest
+import zlib
 from unittest.mock import MagicMock, patch
 from pyscalpel.java.burp import IHttpHeader
 from pyscalpel.http.response import *
@@ -48,6 +50,24 @@ class ResponseTestCase(unittest.TestCase):
         self.assertEqual("localhost", response.host)
         self.assertEqual(8080, response.port)
 
+    def test_buffer_content(self):
+        response = Response(
+            b"HTTP/1.1",
+            200,
+            b"OK",
+            Headers([(b"Content-Type", b"text/html")]),
+            memoryview(b"<html></html>"),
+            None,
+        )
+
+        # The buffer is only copied to bytes when the body is read
+        self.assertIsNone(response.data.content)
+        self.assertEqual(b"<html></html>", response.content)
+        self.assertEqual(b"<html></html>", response.data.content)
+
+        response.content = b"changed"
+        self.assertTrue(bytes(response).endswith(b"\r\n\r\nchanged"))
+
     def test_host_is(self):
         response = Response.make(200)
         response.host = "example.com"
@@ -95,6 +115,38 @@ class TestResponseMockedBasic(unittest.TestCase):
         self.assertEqual(response.content, b"<html></html>")
         mock_headers_from_burp.assert_called_once()
 
+    @patch("pyscalpel.http.response.Headers.from_burp")
+    def test_from_burp_is_lazy(self, mock_headers_from_burp):
+        mock_headers_from_burp.return_value = Headers([])
+        response = Response.from_burp(self.mock_response)
+
+        mock_headers_from_burp.assert_not_called()
+        self.mock_response.body.assert_not_called()
+        self.assertIs(response.to_burp(), self.mock_response)
+
+        # Reading does not count as a modification
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"<html></html>")
+        self.assertIs(response.to_burp(), self.mock_response)
+
+        response.status_code = 404
+        self.assertFalse(response._is_untouched())
+
+        response = Response.from_burp(self.mock_response)
+        response.content = b"changed"
+        self.assertFalse(response._is_untouched())
+
+    @patch("pyscalpel.http.response.Headers.from_burp")
+    def test_unread_body_is_serialized_from_buffer(self, mock_headers_from_burp):
+        mock_headers_from_burp.return_value = Headers([])
+        response = Response.from_burp(self.mock_response)
+        response.headers["X-Test"] = "1"
+
+        self.assertEqual(
+            bytes(response), b"HTTP/1.1 200 OK\r\nX-Test: 1\r\n\r\n<html></html>"
+        )
+        self.assertIsNone(response.data.content)
+
 
 class TestResponseFromBurp(unittest.TestCase):
     def setUp(self):
@@ -233,5 +285,96 @@ class TestResponseBodyProperty(unittest.TestCase):
         self.assertEqual(bytes(response), expected_bytes)
 
 
+class TestResponseContentEncoding(unittest.TestCase):
+    def test_gzip_content_is_decoded(self):
+        content = b"Hello World! " * 100
+        response = Response.make(
+            status_code=200,
+            content=b"",
+            headers=((b"Content-Encoding", b"gzip"),),
+        )
+        response.content = content
+
+        self.assertNotEqual(response.raw_content, content)
+        self.assertEqual(gzip.decompress(response.raw_content), content)
+        self.assertEqual(response.content, content)
+
+    def test_deflate_content_is_decoded(self):
+        content = b"Hello World!"
+        for raw_content in (zlib.compress(content), zlib.compress(content)[2:-4]):
+            response = Response.make(
+                status_code=200,
+                content=raw_content,
+                headers=((b"Content-Encoding", b"deflate"),),
+            )
+            self.assertEqual(response.content, content)
+
+    def test_invalid_content_is_kept_when_not_strict(self):
+        response = Response.make(
+            status_code=200,
+            content=b"not gzip",
+            headers=((b"Content-Encoding", b"gzip"),),
+        )
+        with self.assertRaises(ValueError):
+            response.content  # pylint: disable=pointless-statement
+        self.assertEqual(response.get_content(strict=False), b"not gzip")
+
+    def test_encoded_content_survives_serialization(self):
+        content = b"Hello World! " * 100
+        for encoding, raw_content in (
+            (b"gzip", gzip.compress(content)),
+            (b"deflate", zlib.compress(content)),
+        ):
+            with self.subTest(encoding=encoding):
+                response = Response.make(
+                    status_code=200,
+                    content=raw_content,
+                    headers=((b"Content-Encoding", encoding),),
+                )
+                self.assertEqual(response.content, content)
+
+                with patch(
+                    "pyscalpel.http.response.PythonUtils"
+                ) as python_utils, patch(
+                    "pyscalpel.http.response.HttpResponse"
+                ) as http_response:
+                    python_utils.toByteArray.side_effect = lambda data: data
+                    http_response.httpResponse.side_effect = _parse_burp_response
+                    parsed = Response.from_raw(bytes(response))
+
+                self.assertEqual(parsed.headers, response.headers)
+                self.assertEqual(
+                    parsed.headers[b"Content-Length"], str(len(raw_content))
+                )
+                self.assertEqual(parsed.raw_content, raw_content)
+                self.assertEqual(parsed.content, content)
+
+
+def _parse_burp_response(raw: bytes) -> IHttpResponse:
+    """Mock the IHttpResponse Burp would parse from raw bytes"""
+    head, body = raw.split(b"\r\n\r\n", 1)
+    first_line, *header_lines = head.decode().split("\r\n")
+    http_version, status_code, reason = first_line.split(" ", 2)
+
+    burp_headers = []
+    for line in header_lines:
+        name, value = line.split(": ", 1)
+        header = MagicMock(spec=IHttpHeader)
+        header.name.return_value = name
+        header.value.return_value = value
+        burp_headers.append(header)
+
+    burp_body = MagicMock(spec=IByteArray)
+    burp_body.getBytes.return_value = body
+
+    burp_response = MagicMock(spec=IHttpResponse)
+    burp_response.httpVersion.return_value = http_version
+    burp_response.statusCode.return_value = int(status_code)
+    burp_response.reasonPhrase.return_value = reason
+    burp_response.headers.return_value = burp_headers
+    burp_response.body.return_value = burp_body
+    return burp_response
+
+
 if __name__ == "__main__":
     unittest.main()
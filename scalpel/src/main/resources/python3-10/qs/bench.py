@@ -0,0 +1,58 @@
+"""
+Throughput benchmark of the query string parser and builder.
+
+The query strings are the tests.py cases, repeated to thousands of pairs.
+
+Usage (from the python3-10 directory):
+    python3 -m qs.bench [pairs] [runs]
+"""
+
+import statistics
+from typing import Callable
+
+from pyscalpel.tests.bench_utils import int_arg, measure
+from qs import build_qs, qs_parse, qs_parse_pairs
+
+# test_qs_parse_complex
+COMPLEX = (
+    "key1[key2][key3][key4][]=ho&key1[key2][key3][key4][]=hey&key1[key2][key3][key4][]=choco&key1[key2][key3][key4][key5][]=nest"
+    "&key1[key2][key3][key4][key5][key6]=deep&key1[key2][key3][key4][key5][]=along&key1[key2][key3][key4][key5][key5_1]=hello"
+)
+
+
+def make_cases(pairs: int) -> dict[str, str]:
+    return {
+        # test_qs_parse_no_strict_no_blanks
+        "flat": "&".join(f"k{i}={i}" for i in range(pairs)),
+        # test_simple_duplicates_rigth
+        "appended": "&".join(f"a[]={i}" for i in range(pairs)),
+        # test_handling_duplicated_keys_with_mixed_syntax
+        "nested arrays": "&".join(f"key[subkey][]={i}" for i in range(pairs)),
+        "nested keys": "&".join(f"a[b][c{i}]={i}" for i in range(pairs)),
+        "complex": "&".join(
+            COMPLEX.replace("key1", f"root{i}") for i in range(max(1, pairs // 7))
+        ),
+    }
+
+
+def main(pairs: int, runs: int) -> None:
+    for name, query in make_cases(pairs).items():
+        parsed = qs_parse(query)
+        split_pairs = [tuple(pair.split("=", 1)) for pair in query.split("&")]
+        count = len(split_pairs)
+
+        steps: dict[str, Callable[[], object]] = {
+            "qs_parse": lambda: qs_parse(query),
+            "qs_parse_pairs": lambda: qs_parse_pairs(split_pairs),
+            "build_qs": lambda: build_qs(parsed),
+        }
+        for step, func in steps.items():
+            best = min(measure(func, runs))
+            median = statistics.median(measure(func, runs))
+            print(
+                f"{name:<14} {step:<15} {count / best:12.0f} pairs/s   median {median * 1000:8.2f} ms   ({count} pairs, {runs} runs)"
+            )
+
+
+if __name__ == "__main__":
+    main(int_arg(1, 10_000), int_arg(2, 5))
@@ -25,6 +25,36 @@ def list_to_dict(lst: list[Any]) -> dict[int, Any]:
     return {i: value for i, value in enumerate(lst)}
 
 
+_PHP_QUERY_NAME = re.compile(
+    r"""
+    ^               # Asserts the start of the line, it means to start matching from the beginning of the string.
+    [^\[\]&]+       # Matches one or more characters that are not `[`, `]`, or `&`. It describes the base key.
+    (               # Opens a group. This group is used to match any subsequent keys within brackets.
+    \[              # Matches a literal `[`, which is the start of a key.
+    [^\[\]&]*       # Matches zero or more characters that are not `[`, `]`, or `&`, which is the content of a key.
+    \]              # Matches a literal `]`, which is the end of a key.
+    )*              # Closes the group and asserts that the group can appear zero or more times, for nested keys.
+    $               # Asserts the end of the line, meaning the string should end with the preceding group.
+    """,
+    re.VERBOSE,
+)
+
+_PHP_QUERY_NAME_TOKEN = re.compile(
+    r"""
+    (              # Group start
+        [^\[\]&]+  # One or more of any character except square brackets and the ampersand
+        |          # Or
+        \[\]       # Match empty square brackets
+        |          # Or
+        \[         # Match an opening square bracket
+        [^\[\]&]*  # Zero or more of any character except square brackets and the ampersand
+        \]         # Match a closing square bracket
+    )              # Group end
+    """,
+    re.VERBOSE,
+)
+
+
 def is_valid_php_query_name(name: str) -> bool:
     """
     Check if a given name follows PHP query string syntax.
@@ -34,17 +64,35 @@ def is_valid_php_query_name(name: str) -> bool:
     field[key1][key2]
     field[]
     """
-    pattern = r"""
-    ^               # Asserts the start of the line, it means to start matching from the beginning of the string.
-    [^\[\]&]+       # Matches one or more characters that are not `[`, `]`, or `&`. It describes the base key.
-    (               # Opens a group. This group is used to match any subsequent keys within brackets.
-    \[              # Matches a literal `[`, which is the start of a key.
-    [^\[\]&]*       # Matches zero or more characters that are not `[`, `]`, or `&`, which is the content of a key.
-    \]              # Matches a literal `]`, which is the end of a key.
-    )*              # Closes the group and asserts that the group can appear zero or more times, for nested keys.
-    $               # Asserts the end of the line, meaning the string should end with the preceding group.
+    return bool(_PHP_QUERY_NAME.match(name))
+
+
+def _tokenize_php_query_name(name: str) -> list[str] | None:
+    """
+    Split a PHP query name into its field and bracketed keys.
+
+    e.g: "field[key1][]" -> ["field", "[key1]", "[]"]
+
+    Args:
+        name (str): The name to split.
+
+    Returns:
+        list[str] | None: The tokens, None if the name doesn't follow PHP query string syntax.
     """
-    return bool(re.match(pattern, name, re.VERBOSE))
+    # Most names are plain fields.
+    if "[" not in name and "]" not in name:
+        return [name] if name and "&" not in name else None
+
+    if not _PHP_QUERY_NAME.match(name):
+        return None
+
+    if name[-1] != "]":
+        # $ matched before a trailing newline, which is then tokenized as a field.
+        return _PHP_QUERY_NAME_TOKEN.findall(name)
+
+    # The name is valid, so the keys cannot contain brackets.
+    field, _, keys = name.partition("[")
+    return [field, *(f"[{key}]" for key in keys[:-1].split("]["))]
 
 
 def _get_name_value(tokens: dict, name: str, value: str, urlencoded: bool) -> None:
@@ -63,23 +111,11 @@ def _get_name_value(tokens: dict, name: str, value: str, urlencoded: bool) -> No
         value = unquote_plus(value)
 
     # If name doesn't follow PHP query string syntax, treat it as a single key
-    if not is_valid_php_query_name(name):
+    matches = _tokenize_php_query_name(name)
+    if matches is None:
         tokens[name] = value
         return
 
-    pattern = r"""
-    (              # Group start
-        [^\[\]&]+  # One or more of any character except square brackets and the ampersand
-        |          # Or
-        \[\]       # Match empty square brackets
-        |          # Or
-        \[         # Match an opening square bracket
-        [^\[\]&]*  # Zero or more of any character except square brackets and the ampersand
-        \]         # Match a closing square bracket
-    )              # Group end
-    """
-    matches = re.findall(pattern, name, re.VERBOSE)
-
     new_value: str | list | dict = value
     for i, match in enumerate(reversed(matches)):
         match match:
@@ -89,13 +125,9 @@ def _get_name_value(tokens: dict, name: str, value: str, urlencoded: bool) -> No
                 else:
                     new_value += new_value  # type: ignore
 
-            # Regex pattern matches a string enclosed by square brackets. The string
-            # may contain any character except square brackets and ampersand.
-            case _ if re.match(r"\[[^\[\]&]*\]", match):
-                # Here we're using another regular expression to remove the square
-                # brackets from the match, thereby extracting the name.
-                name = re.sub(r"[\[\]]", "", match)
-                new_value = {name: new_value}
+            # A key enclosed by square brackets.
+            case _ if match[0] == "[":
+                new_value = {match[1:-1]: new_value}
 
             case _:  # Plain field (no square brackets)
                 if match not in tokens:
@@ -113,7 +145,12 @@ def _get_name_value(tokens: dict, name: str, value: str, urlencoded: bool) -> No
                             tokens[match] = [tokens[match]]
                         tokens[match] = merge(new_value, tokens[match])
                     case list() | tuple():
-                        tokens[match] = tokens[match] + list(new_value)
+                        existing = tokens[match]
+                        if isinstance(existing, list):
+                            # Append in place, repeated "field[]" names would be quadratic otherwise.
+                            existing.extend(new_value)
+                        else:
+                            tokens[match] = existing + list(new_value)
                     case _:
                         if not isinstance(tokens[match], list):
                             # The key is duplicated, so we transform the first value into a list so we can append the new one
@@ -180,7 +217,13 @@ def merge(source: dict | list, destination: dict | list, shallow: bool = True):
             if (
                 isinstance(value, list) or isinstance(value, tuple)
             ) and key in destination:
-                value = merge(destination[key], list(value))
+                existing = destination[key]
+                if isinstance(existing, list):
+                    # Same as merge(existing, list(value)), without copying the existing values.
+                    existing.extend(value)
+                    value = existing
+                else:
+                    value = merge(existing, list(value))
 
             if isinstance(key, str) and isinstance(destination, list):
                 destination = list_to_dict(
@@ -241,44 +284,40 @@ def build_qs(query: Mapping) -> str:
         str: A query string.
     """
 
-    def dict_generator(indict, pre=None):
-        pre = pre[:] if pre else []
-        if isinstance(indict, dict):
-            for key, value in indict.items():
-                if isinstance(value, dict):
-                    for d in dict_generator(value, pre + [key]):
-                        yield d
-                else:
-                    yield pre + [key, value]
-        else:
-            yield indict
+    # Flatten the nested dicts into (name, value) pairs, e.g: {"a": {"b": 1}} -> ("a[b]", 1)
+    paths: list[tuple[str, Any]] = []
+    if isinstance(query, dict):
+        # Iterative depth-first walk, the nested dicts items are pushed in reverse to keep their order.
+        stack: list[tuple[str | None, Any, Any]] = [
+            (None, key, value) for key, value in reversed(query.items())
+        ]
+        while stack:
+            prefix, key, value = stack.pop()
+            name = str(key) if prefix is None else f"{prefix}[{key}]"
+            if isinstance(value, dict):
+                stack.extend(
+                    (name, child_key, child_value)
+                    for child_key, child_value in reversed(value.items())
+                )
+            else:
+                paths.append((name, value))
+    else:
+        # Not a dict: the whole query is a path, its last item being the value.
+        path = cast(Sequence, query)
+        name = "".join(f"[{n}]" if i > 0 else str(n) for i, n in enumerate(path[:-1]))
+        paths.append((name, path[-1]))
 
-    paths = [i for i in dict_generator(query)]
     qs = []
-
-    for path in paths:
-        names = path[:-1]
-        value = path[-1]
-        s: list[str] = []
-        for i, n in enumerate(names):
-            n = f"[{n}]" if i > 0 else str(n)
-            s.append(n)
-
+    for name, value in paths:
         match value:
             case list() | tuple():
+                multi_name = name if name.endswith("[]") else name + "[]"
                 for v in value:
-                    multi = s[:]
-                    if not s[-1].endswith("[]"):
-                        multi.append("[]")
-                    multi.append("=")
                     # URLEncode value
-                    multi.append(quote_plus(str(v)))
-                    qs.append("".join(multi))
+                    qs.append(f"{multi_name}={quote_plus(str(v))}")
             case _:
-                s.append("=")
                 # URLEncode value
-                s.append(quote_plus(str(value)))
-                qs.append("".join(s))
+                qs.append(f"{name}={quote_plus(str(value))}")
 
     return "&".join(qs)
 
@@ -0,0 +1,82 @@
+package lexfo.scalpel;
+
+import java.util.Arrays;
+import java.util.Random;
+
+/**
+ * Measures the Java side cost of handing the editor content to the edit_out hooks, against the body size.
+ *
+ * <ul>
+ * <li>int[]: the previous conversion, every byte widened to an unsigned int through {@link PythonUtils#toPythonBytes(byte[])},
+ * which Jep then turns into a Python list of ints.</li>
+ * <li>direct: a single copy into a direct buffer through {@link PythonUtils#toDirectBuffer(byte[])},
+ * which Jep exposes to Python as a memoryview.</li>
+ * </ul>
+ *
+ * <p>The Python side of the conversion is measured by pyscalpel/tests/bench_edit_out.py.
+ *
+ * <p>Usage: ./gradlew editorContentBenchmark [--args="maxSizeKiB runs"]
+ */
+public class EditorContentBenchmark {
+
+	private interface Conversion {
+		Object convert(byte[] content);
+	}
+
+	private static volatile Object sink;
+
+	/**
+	 * Converts the content `runs` times and returns the sorted latencies, in nanoseconds.
+	 */
+	private static long[] run(Conversion conversion, byte[] content, int runs) {
+		final long[] latencies = new long[runs];
+		for (int i = 0; i < runs; i++) {
+			final long begin = System.nanoTime();
+			sink = conversion.convert(content);
+			latencies[i] = System.nanoTime() - begin;
+		}
+		Arrays.sort(latencies);
+		return latencies;
+	}
+
+	private static void report(
+		String name,
+		Conversion conversion,
+		byte[] content,
+		int runs
+	) {
+		final long[] latencies = run(conversion, content, runs);
+		System.out.printf(
+			"%-7s %8d KiB  min %10.3f ms  p50 %10.3f ms  max %10.3f ms%n",
+			name,
+			content.length / 1024,
+			latencies[0] / 1e6,
+			latencies[latencies.length / 2] / 1e6,
+			latencies[latencies.length - 1] / 1e6
+		);
+	}
+
+	public static void main(String[] args) {
+		final int maxSizeKiB = args.length > 0
+			? Integer.parseInt(args[0])
+			: 8 * 1024;
+		final int runs = args.length > 1 ? Integer.parseInt(args[1]) : 20;
+
+		final Conversion intArray = PythonUtils::toPythonBytes;
+		final Conversion direct = PythonUtils::toDirectBuffer;
+
+		// Warm up the JIT.
+		final byte[] warmup = new byte[64 * 1024];
+		run(intArray, warmup, 500);
+		run(direct, warmup, 500);
+
+		final Random random = new Random(1234);
+		for (int sizeKiB = 1; sizeKiB <= maxSizeKiB; sizeKiB *= 8) {
+			final byte[] content = new byte[sizeKiB * 1024];
+			random.nextBytes(content);
+
+			report("int[]", intArray, content, runs);
+			report("direct", direct, content, runs);
+		}
+	}
+}
@@ -0,0 +1,223 @@
+package lexfo.scalpel;
+
+import java.util.ArrayDeque;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+import java.util.Queue;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.LinkedBlockingQueue;
+import java.util.concurrent.TimeUnit;
+
+/**
+ * Measures the per-task handoff overhead of the executor dispatch loop under concurrent producers.
+ *
+ * <p>Both models reproduce the ScalpelExecutor synchronization with a no-op task body,
+ * so only the cost of queuing a task, waking the runner and waking the awaiting thread is measured:
+ * <ul>
+ * <li>monitor: the previous loop, the runner holds the queue monitor while processing and waits up to 1s after every task,
+ * each caller parks on its task's monitor.</li>
+ * <li>queue: a LinkedBlockingQueue drained back to back, each caller awaits a CompletableFuture.</li>
+ * </ul>
+ *
+ * <p>Usage: ./gradlew taskHandoffBenchmark [--args="producers tasksPerProducer"]
+ */
+public class TaskHandoffBenchmark {
+
+	private interface Dispatcher {
+		void call() throws InterruptedException;
+
+		void stop();
+	}
+
+	/**
+	 * The previous handoff: shared monitor, wait(1000) after every task, per-task monitor.
+	 */
+	private static class MonitorDispatcher implements Dispatcher {
+
+		private static class Task {
+
+			private boolean finished = false;
+		}
+
+		private final Queue<Task> tasks = new ArrayDeque<>();
+		private volatile boolean running = true;
+		private final Thread runner = new Thread(this::loop);
+
+		MonitorDispatcher() {
+			runner.start();
+		}
+
+		private void loop() {
+			try {
+				synchronized (tasks) {
+					while (running) {
+						final Task task = tasks.poll();
+						if (task == null) {
+							tasks.wait(1000);
+							continue;
+						}
+
+						synchronized (task) {
+							task.finished = true;
+							task.notifyAll();
+						}
+
+						tasks.wait(1000);
+					}
+				}
+			} catch (InterruptedException e) {
+				Thread.currentThread().interrupt();
+			}
+		}
+
+		@Override
+		public void call() throws InterruptedException {
+			final Task task = new Task();
+			synchronized (tasks) {
+				tasks.add(task);
+				tasks.notifyAll();
+			}
+			synchronized (task) {
+				while (!task.finished) {
+					task.wait(1000);
+				}
+			}
+		}
+
+		@Override
+		public void stop() {
+			running = false;
+			synchronized (tasks) {
+				tasks.notifyAll();
+			}
+		}
+	}
+
+	/**
+	 * The current handoff: blocking queue drained back to back, futures for completion.
+	 */
+	private static class QueueDispatcher implements Dispatcher {
+
+		private final BlockingQueue<CompletableFuture<Object>> tasks = new LinkedBlockingQueue<>();
+		private volatile boolean running = true;
+		private final Thread runner = new Thread(this::loop);
+
+		QueueDispatcher() {
+			runner.start();
+		}
+
+		private void loop() {
+			try {
+				while (running) {
+					final CompletableFuture<Object> task = tasks.poll(
+						1000,
+						TimeUnit.MILLISECONDS
+					);
+					if (task != null) {
+						task.complete(Boolean.TRUE);
+					}
+				}
+			} catch (InterruptedException e) {
+				Thread.currentThread().interrupt();
+			}
+		}
+
+		@Override
+		public void call() throws InterruptedException {
+			final CompletableFuture<Object> task = new CompletableFuture<>();
+			tasks.add(task);
+			try {
+				task.get();
+			} catch (ExecutionException e) {
+				throw new RuntimeException(e);
+			}
+		}
+
+		@Override
+		public void stop() {
+			running = false;
+			runner.interrupt();
+		}
+	}
+
+	/**
+	 * Runs the producers and returns the latency of every call, in nanoseconds.
+	 */
+	private static long[] run(
+		Dispatcher dispatcher,
+		int producers,
+		int tasksPerProducer
+	) throws InterruptedException {
+		final long[] latencies = new long[producers * tasksPerProducer];
+		final CountDownLatch start = new CountDownLatch(1);
+		final List<Thread> threads = new ArrayList<>();
+
+		for (int p = 0; p < producers; p++) {
+			final int offset = p * tasksPerProducer;
+			final Thread thread = new Thread(() -> {
+				try {
+					start.await();
+					for (int i = 0; i < tasksPerProducer; i++) {
+						final long begin = System.nanoTime();
+						dispatcher.call();
+						latencies[offset + i] = System.nanoTime() - begin;
+					}
+				} catch (InterruptedException e) {
+					Thread.currentThread().interrupt();
+				}
+			});
+			thread.start();
+			threads.add(thread);
+		}
+
+		start.countDown();
+		for (final Thread thread : threads) {
+			thread.join();
+		}
+		dispatcher.stop();
+		return latencies;
+	}
+
+	private static void report(
+		String name,
+		Dispatcher dispatcher,
+		int producers,
+		int tasksPerProducer
+	) throws InterruptedException {
+		final long begin = System.nanoTime();
+		final long[] latencies = run(dispatcher, producers, tasksPerProducer);
+		final double elapsedMs = (System.nanoTime() - begin) / 1e6;
+
+		Arrays.sort(latencies);
+		final double meanUs = Arrays.stream(latencies).average().orElse(0) / 1e3;
+		System.out.printf(
+			"%-8s %3d producers  %8.1f ms total  mean %9.1f us  p50 %9.1f us  p99 %10.1f us  max %10.1f us%n",
+			name,
+			producers,
+			elapsedMs,
+			meanUs,
+			latencies[latencies.length / 2] / 1e3,
+			latencies[(int) (latencies.length * 0.99)] / 1e3,
+			latencies[latencies.length - 1] / 1e3
+		);
+	}
+
+	public static void main(String[] args) throws InterruptedException {
+		final int maxProducers = args.length > 0 ? Integer.parseInt(args[0]) : 8;
+		final int tasksPerProducer = args.length > 1
+			? Integer.parseInt(args[1])
+			: 200;
+
+		// Warm up the JIT.
+		run(new QueueDispatcher(), 4, 2000);
+
+		for (int producers = 1; producers <= maxProducers; producers *= 2) {
+			report("queue", new QueueDispatcher(), producers, tasksPerProducer);
+			report("monitor", new MonitorDispatcher(), producers, tasksPerProducer);
+		}
+	}
+}